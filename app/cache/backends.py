@@ -0,0 +1,102 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Returned by `get` when the key is absent, so that a cached `None`
+# (negative entry) can be told apart from a miss.
+MISS = object()
+
+
+class MemoryCache:
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Bounded by entry count; the least recently used entry is evicted first,
+    expired entries are dropped lazily on access.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return MISS
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            return MISS
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def __len__(self):
+        return len(self._data)
+
+    async def close(self):
+        self._data.clear()
+
+
+class FakeCache(MemoryCache):
+    """
+    MemoryCache driven by a manual clock, for tests.
+
+    Call `advance(seconds)` to expire entries deterministically.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.now = 0.0
+        super().__init__(max_entries=max_entries, clock=lambda: self.now)
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class RedisCache:
+    """
+    Redis-backed cache shared by all workers. Values are stored as JSON and
+    expire through Redis TTLs; eviction is left to the server's maxmemory policy.
+    """
+
+    def __init__(self, url: str, prefix: str = "songlib:"):
+        import redis.asyncio as redis
+
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+
+    async def get(self, key: str) -> Any:
+        raw = await self._redis.get(self.prefix + key)
+        if raw is None:
+            return MISS
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        await self._redis.set(self.prefix + key, json.dumps(value, default=str), px=int(ttl * 1000))
+
+    async def delete(self, key: str):
+        await self._redis.delete(self.prefix + key)
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+def create_cache_backend(settings) -> Optional[Any]:
+    """Build the backend selected by `CACHE_BACKEND` (memory, redis or none)."""
+    if settings.cache_backend == "none":
+        return None
+    if settings.cache_backend == "redis":
+        return RedisCache(settings.redis_url)
+    if settings.cache_backend == "memory":
+        return MemoryCache(max_entries=settings.cache_max_entries)
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.cache_backend}")
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo.errors import CollectionInvalid
+
+logger = logging.getLogger(__name__)
+
+# Song IDs per message/document, well under Redis and BSON size limits
+PUBLISH_BATCH = 1000
+
+
+def _batches(song_ids: List[str]):
+    for start in range(0, len(song_ids), PUBLISH_BATCH):
+        yield song_ids[start:start + PUBLISH_BATCH]
+
+
+class RedisInvalidationBus:
+    """
+    Broadcast song invalidations to every worker over Redis pub/sub.
+
+    `on_invalidate(song_ids, reindex)` runs for every message from another
+    worker; `reindex` is False when the search fields did not change.
+    """
+
+    def __init__(self, url: str, on_invalidate: Callable[[List[str], bool], None], channel: str = "songlib:invalidate"):
+        import redis.asyncio as redis
+
+        self.origin = uuid.uuid4().hex
+        self.channel = channel
+        self.on_invalidate = on_invalidate
+        self._redis = redis.from_url(url)
+        self._task = None
+
+    async def publish(self, song_id: str, reindex: bool = True):
+        await self.publish_many([song_id], reindex=reindex)
+
+    async def publish_many(self, song_ids: List[str], reindex: bool = True):
+        for batch in _batches(song_ids):
+            await self._redis.publish(self.channel, json.dumps({"origin": self.origin, "song_ids": batch, "reindex": reindex}))
+
+    async def start(self):
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self.channel)
+        self._task = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = json.loads(message["data"])
+                if data["origin"] != self.origin:
+                    self.on_invalidate(data["song_ids"], data.get("reindex", True))
+        finally:
+            await pubsub.aclose()
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        await self._redis.aclose()
+
+
+class MongoPollingInvalidationBus:
+    """
+    Fallback invalidation bus when no Redis is available.
+
+    Invalidations are appended to a small capped collection, stamped with the
+    server's clock. Every worker polls it for entries stamped after the last
+    one it has seen, minus an `overlap` window: an entry written just before
+    another can become visible just after it, so recent entries are re-read
+    and deduplicated by `_id` instead of being skipped. One entry carries a
+    whole batch of song IDs, so bulk writes do not flood the collection.
+    """
+
+    def __init__(self, db, on_invalidate: Callable[[List[str], bool], None], interval: float = 1.0,
+                 collection: str = "cache_invalidations", size_bytes: int = 1_000_000, overlap: float = 5.0):
+        self.origin = uuid.uuid4().hex
+        self.db = db
+        self.collection_name = collection
+        self.size_bytes = size_bytes
+        self.collection = db[collection]
+        self.on_invalidate = on_invalidate
+        self.interval = interval
+        self.overlap = timedelta(seconds=overlap)
+        self._since: Optional[datetime] = None
+        self._seen: Dict[ObjectId, datetime] = {}
+        self._task = None
+        self._created = False
+
+    async def _ensure_collection(self):
+        # Must exist as a capped collection before the first insert,
+        # which would otherwise create a regular, unbounded one
+        if self._created:
+            return
+        try:
+            await self.db.create_collection(self.collection_name, capped=True, size=self.size_bytes)
+        except CollectionInvalid:
+            pass  # already exists
+        self._created = True
+
+    async def publish(self, song_id: str, reindex: bool = True):
+        await self.publish_many([song_id], reindex=reindex)
+
+    async def publish_many(self, song_ids: List[str], reindex: bool = True):
+        await self._ensure_collection()
+        for batch in _batches(song_ids):
+            # Upsert rather than insert so `at` comes from the server's clock
+            await self.collection.update_one(
+                {"_id": ObjectId()},
+                {"$set": {"origin": self.origin, "song_ids": batch, "reindex": reindex}, "$currentDate": {"at": True}},
+                upsert=True,
+            )
+
+    async def start(self):
+        await self._ensure_collection()
+        latest = await self.collection.find_one({"at": {"$exists": True}}, sort=[("$natural", -1)])
+        if latest:
+            self._since = latest["at"]
+            self._seen[latest["_id"]] = latest["at"]
+        self._task = asyncio.create_task(self._poll())
+
+    async def poll_once(self):
+        query = {"at": {"$gte": self._since - self.overlap}} if self._since is not None else {"at": {"$exists": True}}
+        async for doc in self.collection.find(query):
+            if doc["_id"] in self._seen:
+                continue
+            self._seen[doc["_id"]] = doc["at"]
+            if self._since is None or doc["at"] > self._since:
+                self._since = doc["at"]
+            if doc.get("origin") != self.origin:
+                song_ids = doc["song_ids"] if "song_ids" in doc else [doc["song_id"]]
+                self.on_invalidate(song_ids, doc.get("reindex", True))
+        if self._since is not None:
+            horizon = self._since - self.overlap
+            self._seen = {doc_id: at for doc_id, at in self._seen.items() if at >= horizon}
+
+    async def _poll(self):
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation poll failed: %r", e)
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
@@ -0,0 +1,65 @@
+import functools
+from collections import Counter
+
+from .backends import MISS
+from ..utils.text import normalize
+
+
+class ProviderCache:
+    """
+    Response cache in front of the external provider clients.
+
+    Keys are built from the normalized title/artist, so "Alex G" and "alex g"
+    share one entry. Successful lookups are kept for `ttl` seconds; "not found"
+    results (`None`) are cached too, for the shorter `negative_ttl`. Errors are
+    never cached.
+    """
+
+    def __init__(self, backend, ttl: float, negative_ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.counters = Counter()
+
+    @staticmethod
+    def key(namespace: str, title: str, artist: str) -> str:
+        return f"provider:{namespace}:{normalize(title)}:{normalize(artist)}"
+
+    def wrap(self, namespace: str, fn):
+        @functools.wraps(fn)
+        async def cached(title: str, artist: str):
+            key = self.key(namespace, title, artist)
+            value = await self.backend.get(key)
+            if value is not MISS:
+                self.counters[f"{namespace}.hit"] += 1
+                if value is None:
+                    self.counters[f"{namespace}.negative_hit"] += 1
+                return value
+
+            self.counters[f"{namespace}.miss"] += 1
+            value = await fn(title, artist)
+            await self.backend.set(key, value, self.ttl if value is not None else self.negative_ttl)
+            return value
+        return cached
+
+    def stats(self) -> dict:
+        stats = {}
+        for name, count in self.counters.items():
+            namespace, counter = name.rsplit(".", 1)
+            stats.setdefault(namespace, {"hit": 0, "negative_hit": 0, "miss": 0})[counter] = count
+        return stats
+
+
+class CachedProvider:
+    """
+    Proxy over a provider client whose lookup `methods` go through a
+    ProviderCache; every other attribute is passed through unchanged.
+    """
+
+    def __init__(self, provider, cache: ProviderCache, namespace: str, methods):
+        self._provider = provider
+        for method in methods:
+            setattr(self, method, cache.wrap(f"{namespace}.{method}", getattr(provider, method)))
+
+    def __getattr__(self, name):
+        return getattr(self._provider, name)
@@ -0,0 +1,140 @@
+import sys
+import time
+from array import array
+from collections import Counter, OrderedDict
+from typing import Optional
+
+
+class CompactSong:
+    """
+    Memory-lean cached form of a song document.
+
+    Lyrics are kept as one string plus an array of line start offsets instead
+    of a list of Python strings, so a page is sliced out on demand and the
+    per-line object overhead is paid only for the lines being returned.
+    """
+
+    __slots__ = ("meta", "text", "offsets", "synced_offsets", "expires_at", "nbytes")
+
+    def __init__(self, doc: dict, expires_at: float):
+        lines = [line or "" for line in doc.get("lyrics") or []]
+        synced = doc.get("synced_lyrics")
+        self.meta = {k: v for k, v in doc.items() if k not in ("_id", "lyrics", "synced_lyrics")}
+        self.text = "\n".join(lines)
+        self.offsets = array("I", [0])
+        for line in lines:
+            self.offsets.append(self.offsets[-1] + len(line) + 1)
+        # Start time (ms) of each lyrics line, when the song has synced lyrics
+        self.synced_offsets = array("I", synced["offsets"]) if synced else None
+        self.expires_at = expires_at
+        self.nbytes = (
+            sys.getsizeof(self.text)
+            + self.offsets.itemsize * len(self.offsets)
+            + (self.synced_offsets.itemsize * len(self.synced_offsets) if synced else 0)
+            + sum(sys.getsizeof(v) for v in self.meta.values())
+        )
+
+    @property
+    def total(self) -> int:
+        return len(self.offsets) - 1
+
+    def lines(self, start: int, count: int) -> list:
+        end = min(start + count, self.total)
+        return [
+            self.text[self.offsets[i]:self.offsets[i + 1] - 1]
+            for i in range(start, end)
+        ]
+
+    def page(self, page: int, size: int) -> dict:
+        song = dict(self.meta)
+        song["lyrics"] = self.lines((page - 1) * size, size)
+        song["lyrics_total"] = self.total
+        return song
+
+
+class SongDocumentCache:
+    """
+    Read-through cache of hot song documents.
+
+    - Bounded by entry count and by approximate bytes (LRU eviction)
+    - A song is only admitted after `admit_after` reads, so one-off reads keep
+      using the paged `$slice` query instead of pulling the full lyrics
+    - Entries live at most `ttl` seconds, bounding staleness if a
+      cross-worker invalidation is ever missed
+    - `invalidate` bumps a generation counter so a full read that raced with
+      a write is not stored
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float, admit_after: int = 2, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.admit_after = admit_after
+        self._clock = clock
+        self._entries: "OrderedDict[str, CompactSong]" = OrderedDict()
+        self._candidates: "OrderedDict[str, int]" = OrderedDict()
+        self.bytes = 0
+        self.generation = 0
+        self.counters = Counter()
+
+    def get(self, song_id: str) -> Optional[CompactSong]:
+        entry = self._entries.get(song_id)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(song_id)
+            entry = None
+        if entry is None:
+            self.counters["miss"] += 1
+            return None
+        self._entries.move_to_end(song_id)
+        self.counters["hit"] += 1
+        return entry
+
+    def should_admit(self, song_id: str) -> bool:
+        """Count a miss for `song_id`; True once it has been read often enough."""
+        seen = self._candidates.pop(song_id, 0) + 1
+        if seen >= self.admit_after:
+            return True
+        self._candidates[song_id] = seen
+        while len(self._candidates) > 4 * self.max_entries:
+            self._candidates.popitem(last=False)
+        return False
+
+    def put(self, song_id: str, doc: dict, generation: int) -> Optional[CompactSong]:
+        entry = CompactSong(doc, self._clock() + self.ttl)
+        if generation != self.generation or entry.nbytes > self.max_bytes:
+            return entry
+        self._remove(song_id)
+        self._entries[song_id] = entry
+        self.bytes += entry.nbytes
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            evicted, _ = next(iter(self._entries.items()))
+            self._remove(evicted)
+            self.counters["eviction"] += 1
+        return entry
+
+    def invalidate(self, song_id: str):
+        self.generation += 1
+        self._candidates.pop(song_id, None)
+        if self._remove(song_id):
+            self.counters["invalidation"] += 1
+
+    def _remove(self, song_id: str) -> bool:
+        entry = self._entries.pop(song_id, None)
+        if entry is None:
+            return False
+        self.bytes -= entry.nbytes
+        return True
+
+    def stats(self) -> dict:
+        lookups = self.counters["hit"] + self.counters["miss"]
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hit": self.counters["hit"],
+            "miss": self.counters["miss"],
+            "hit_ratio": self.counters["hit"] / lookups if lookups else 0.0,
+            "eviction": self.counters["eviction"],
+            "invalidation": self.counters["invalidation"],
+        }
@@ -0,0 +1,138 @@
+"""
+Command line entry points.
+
+Usage:
+    python -m app.cli import catalog.jsonl [--concurrency N] [--batch-size N]
+    python -m app.cli parse-lrc [--batch-size N]
+    python -m app.cli refresh-spotify [--stale-days N] [--batch-size N]
+    python -m app.cli migrate-lyrics [--decompress] [--batch-size N]
+    python -m app.cli migrate [--batch-size N]
+"""
+import argparse
+import asyncio
+import sys
+from collections import Counter
+
+from app.core.config import get_app_settings
+from app.core.dependencies import create_dependencies, close_dependencies, ensure_indexes
+from app.utils.ndjson import iter_ndjson, iter_file_chunks, dumps_line
+
+
+async def import_songs(args) -> int:
+    settings = get_app_settings()
+    if args.concurrency:
+        settings.bulk_concurrency = args.concurrency
+    if args.batch_size:
+        settings.bulk_batch_size = args.batch_size
+
+    container = create_dependencies(settings)
+    service = container["song_service"]
+    counts = Counter()
+    try:
+        with open(args.path, "rb") as f:
+            async for result in service.import_songs(iter_ndjson(iter_file_chunks(f))):
+                counts[result["status"]] += 1
+                sys.stdout.buffer.write(dumps_line(result))
+    finally:
+        await close_dependencies(container)
+
+    summary = ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+    print(f"Imported {sum(counts.values())} lines: {summary}", file=sys.stderr)
+    return 0 if not counts["error"] else 1
+
+
+async def parse_lrc(args) -> int:
+    container = create_dependencies(get_app_settings())
+    try:
+        converted = await container["song_service"].backfill_synced_lyrics(batch_size=args.batch_size)
+    finally:
+        await close_dependencies(container)
+    print(f"Parsed synced lyrics of {converted} songs", file=sys.stderr)
+    return 0
+
+
+async def refresh_spotify(args) -> int:
+    container = create_dependencies(get_app_settings())
+    try:
+        counts = await container["song_service"].refresh_spotify_metadata(
+            stale_after_days=args.stale_days, batch_size=args.batch_size,
+            retry_missing_after_days=args.retry_missing_days,
+        )
+    finally:
+        await close_dependencies(container)
+    print(", ".join(f"{name}={count}" for name, count in counts.items()), file=sys.stderr)
+    return 0 if not counts["errors"] else 1
+
+
+async def migrate_lyrics(args) -> int:
+    container = create_dependencies(get_app_settings())
+    try:
+        converted = await container["song_service"].repository.migrate_lyrics_storage(
+            compress=not args.decompress, batch_size=args.batch_size
+        )
+    finally:
+        await close_dependencies(container)
+    target = "array" if args.decompress else "compressed"
+    print(f"Converted lyrics of {converted} songs to {target} storage", file=sys.stderr)
+    return 0
+
+
+async def migrate(args) -> int:
+    container = create_dependencies(get_app_settings())
+    repository = container["song_service"].repository
+    try:
+        await ensure_indexes(container)
+        backfill = await repository.backfill_match_keys(batch_size=args.batch_size)
+        # The exact-string unique index goes once every song has a match_key
+        dropped = [] if backfill["conflicts"] else await repository.drop_legacy_indexes()
+    finally:
+        await close_dependencies(container)
+    print(f"Indexes are up to date; set match_key on {backfill['updated']} songs", file=sys.stderr)
+    if dropped:
+        print(f"Dropped {', '.join(dropped)}", file=sys.stderr)
+    if backfill["conflicts"]:
+        # Not fatal: the app runs fine with the legacy index still in place,
+        # and deployments wait on this command succeeding
+        print(f"Warning: {len(backfill['conflicts'])} songs duplicate another song's match_key and were not updated; "
+              f"merge or rename them and re-run: {', '.join(backfill['conflicts'])}", file=sys.stderr)
+        return 1 if args.strict else 0
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Song Library management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Bulk import songs from an NDJSON file of title/artist pairs")
+    import_parser.add_argument("path", help="NDJSON file, one {\"title\", \"artist\"} object per line")
+    import_parser.add_argument("--concurrency", type=int, help="Max songs enriched at once")
+    import_parser.add_argument("--batch-size", type=int, help="Songs per insert batch")
+    import_parser.set_defaults(handler=import_songs)
+
+    lrc_parser = commands.add_parser("parse-lrc", help="Parse raw LRC lyrics of existing songs into synced_lyrics")
+    lrc_parser.add_argument("--batch-size", type=int, default=500, help="Songs per bulk update")
+    lrc_parser.set_defaults(handler=parse_lrc)
+
+    spotify_parser = commands.add_parser("refresh-spotify", help="Refresh missing or stale Spotify metadata in batches")
+    spotify_parser.add_argument("--stale-days", type=float, default=30, help="Refresh songs last refreshed more than N days ago")
+    spotify_parser.add_argument("--retry-missing-days", type=float, default=1,
+                                help="Retry songs still missing metadata after N days")
+    spotify_parser.add_argument("--batch-size", type=int, default=500, help="Songs per bulk update")
+    spotify_parser.set_defaults(handler=refresh_spotify)
+
+    lyrics_parser = commands.add_parser("migrate-lyrics", help="Convert stored lyrics to compressed storage (or back)")
+    lyrics_parser.add_argument("--decompress", action="store_true", help="Convert compressed lyrics back to arrays")
+    lyrics_parser.add_argument("--batch-size", type=int, default=500, help="Songs per bulk update")
+    lyrics_parser.set_defaults(handler=migrate_lyrics)
+
+    migrate_parser = commands.add_parser("migrate", help="Create the collection indexes and backfill match keys (idempotent)")
+    migrate_parser.add_argument("--batch-size", type=int, default=500, help="Songs per bulk update")
+    migrate_parser.add_argument("--strict", action="store_true", help="Exit with an error if any match_key conflicts remain")
+    migrate_parser.set_defaults(handler=migrate)
+
+    args = parser.parse_args(argv)
+    return asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
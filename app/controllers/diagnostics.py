@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Request
+from ..services.song_service import SongService
+from .songs import get_song_service
+
+router = APIRouter(prefix="/diagnostics")
+
+@router.get("/cache", tags=["Diagnostics"], summary="Cache hit/miss counters and memory use")
+async def cache_stats(service: SongService = Depends(get_song_service)):
+    """
+    Cache statistics of this worker process.
+
+    - **providers**: hit, negative-hit and miss counters of the provider
+      response cache, per provider method
+    - **songs**: hot-song cache entries, bytes, hit ratio, evictions and
+      invalidations
+
+    ### Responses
+    - **200**: `{"providers": {...} | null, "songs": {...} | null}`
+    """
+    return {
+        "providers": service.cache.stats() if service.cache is not None else None,
+        "songs": service.song_cache.stats() if service.song_cache is not None else None,
+    }
+
+@router.get("/providers", tags=["Diagnostics"], summary="Provider circuit breaker state and latency")
+async def provider_stats(request: Request):
+    """
+    Health of each external provider as seen by this worker process.
+
+    - **breaker**: `state` (closed/open/half_open), recent failure and
+      slow-call rates, and success/failure/rejected/opened counters
+    - **p95_seconds**: recent p95 latency of successful calls
+    - **hedging**: whether GETs are hedged, with `hedged`/`hedge_won` counters
+
+    ### Responses
+    - **200**: `{"provider": {...}, ...}`
+    """
+    guards = request.app.state.container["provider_guards"]
+    return {name: guard.stats() for name, guard in guards.items()}
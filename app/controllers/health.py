@@ -0,0 +1,54 @@
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter(prefix="/health")
+
+READY_PING_TIMEOUT = 2.0
+
+
+def _index_state(container: dict) -> str:
+    task = container.get("index_task")
+    if task is None:
+        # Managed by `python -m app.cli migrate`
+        return "external"
+    if not task.done():
+        return "pending"
+    if task.cancelled() or task.exception() is not None:
+        return "failed"
+    return "ready"
+
+
+@router.get("/live", tags=["Health"], summary="Liveness probe")
+async def live():
+    """
+    The worker's event loop is running and answering requests. Does not
+    touch Mongo or providers, so a database outage never restarts workers.
+
+    ### Responses
+    - **200**: `{"status": "ok"}`
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready", tags=["Health"], summary="Readiness probe")
+async def ready(request: Request):
+    """
+    Whether this worker should receive traffic: startup indexes are built
+    (or managed by the migrate command) and Mongo answers a ping.
+
+    ### Responses
+    - **200**: `{"status": "ready", "checks": {"indexes": ..., "mongo": "ok"}}`
+    - **503**: `{"status": "not_ready", "checks": {...}}`
+    """
+    container = request.app.state.container
+    checks = {"indexes": _index_state(container)}
+    try:
+        await asyncio.wait_for(container["mongo_client"].admin.command("ping"), READY_PING_TIMEOUT)
+        checks["mongo"] = "ok"
+    except Exception as e:
+        checks["mongo"] = f"error: {e.__class__.__name__}"
+    is_ready = checks["indexes"] in ("ready", "external") and checks["mongo"] == "ok"
+    return JSONResponse({"status": "ready" if is_ready else "not_ready", "checks": checks},
+                        status_code=200 if is_ready else 503)
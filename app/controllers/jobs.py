@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from ..services.song_service import SongService
+from ..models.song import JobStatus
+from .songs import get_song_service
+
+router = APIRouter(prefix="/jobs")
+
+@router.get("/{job_id}", response_model=JobStatus, tags=["Jobs"], summary="Get enrichment job status", responses={
+        404: {"description": "Job not found"}
+    })
+async def get_job(job_id: str, service: SongService = Depends(get_song_service)):
+    """
+    Retrieve the status of a background enrichment job.
+
+    ### Path parameters
+    - **job_id**: ID returned by `POST /?mode=async` *(string, required)*
+
+    ### Responses
+    - **200**: `JobStatus` (`pending`, `running`, `done` or `failed`, with attempts and last error)
+    - **404**: Job not found
+    """
+    return await service.get_job(job_id)
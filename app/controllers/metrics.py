@@ -0,0 +1,37 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+from ..metrics.collectors import service_stats
+
+router = APIRouter()
+
+_registry = None
+
+
+def _metrics_registry():
+    """
+    The default registry for a single process. With several workers
+    (`PROMETHEUS_MULTIPROC_DIR` set by `app.server`) a scrape reaches one
+    of them, so counters and histograms are merged from every worker's
+    files; cache, breaker and index stats stay those of the answering worker.
+    """
+    global _registry
+    if _registry is None:
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            _registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(_registry)
+            _registry.register(service_stats)
+        else:
+            _registry = REGISTRY
+    return _registry
+
+
+@router.get("/metrics", tags=["Diagnostics"], summary="Prometheus metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus exposition: route latency by status, provider call outcomes,
+    Mongo command timings, connection pool, cache and circuit breaker state.
+    """
+    return Response(generate_latest(_metrics_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -1,23 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Request
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse
 from ..services.song_service import SongService
-from ..models.song import SongCreate, SongWithLyrics, SongReturn, SongUpdate, SongSearch
+from ..utils.ndjson import iter_ndjson, dumps_line
+from ..models.song import SongCreate, SongWithLyrics, SongReturn, SongUpdate, SongSearch, SyncedLyrics, SongAccepted, SongSuggestion, \
+    SongBulkPatch, SongBulkDelete, SongBulkResponse
+from collections import Counter
 from typing import List, Optional
 
 router = APIRouter()
 
-def get_song_service() -> SongService:
+def get_song_service(request: Request) -> SongService:
     """
-    Uses core.dependencies.create_dependencies to build the service layer.
+    Returns the application-scoped service built at startup by core.events.
     """
-    from app.core.dependencies import create_dependencies
-    return create_dependencies()["song_service"]
+    return request.app.state.container["song_service"]
 
 @router.post("/", response_model=SongReturn, tags=["Songs"], summary="Add a new song with title and artist", responses={
+        202: {"model": SongAccepted, "description": "Song accepted, enrichment queued (`mode=async`)"},
         404: {"description": "Song not found"},
         409: {"description": "Song already exists in database"},
         500: {"description": "Song cannot be saved in database"},
     },)
-async def add_song(song: SongCreate = Body(..., example={"title": "String", "artist": "Alex G"}), service: SongService = Depends(get_song_service)):
+async def add_song(song: SongCreate = Body(..., example={"title": "String", "artist": "Alex G"}),
+                   mode: str = Query("sync", pattern="^(sync|async)$", description="`async` returns 202 and enriches in the background"),
+                   service: SongService = Depends(get_song_service)):
     """
     Add a new song by title and artist.
 
@@ -30,14 +36,105 @@ async def add_song(song: SongCreate = Body(..., example={"title": "String", "art
     - `lyrics`
     - `link` (from Genius API)
 
+    ### Query parameters
+    - **mode**: `sync` (default) waits for enrichment; `async` saves a pending
+      song, queues its enrichment and returns 202 right away. Poll the
+      `Location` (`/jobs/{job_id}`) for progress.
+
     ### Responses
     - **200**: `SongRead` (created song with full details)
+    - **202**: `SongAccepted` (pending song and job IDs)
     - **409**: Song already exists in the library
     - **404**: Song not found in Genius API
     - **500**: Failed to save the song in the database
     """
+    if mode == "async":
+        accepted = await service.add_song_async(dict(song))
+        return JSONResponse(status_code=202, content=accepted, headers={"Location": f"/jobs/{accepted['job_id']}"})
     return await service.add_song(dict(song))
 
+@router.post("/bulk", tags=["Songs"], summary="Bulk import songs from NDJSON", response_class=StreamingResponse, responses={
+        200: {"description": "One NDJSON result line per input line", "content": {"application/x-ndjson": {}}},
+    })
+async def bulk_add_songs(request: Request, service: SongService = Depends(get_song_service)):
+    """
+    Import many songs in one request.
+
+    ### Request body
+    Newline-delimited JSON (`application/x-ndjson`), one object per line:
+    `{"title": "String", "artist": "Alex G"}`
+
+    The body is read as a stream and songs are enriched with bounded
+    concurrency and saved in unordered batches.
+
+    ### Responses
+    - **200**: NDJSON stream, one line per input line, with `status`:
+      `inserted` (with `id`), `duplicate`, `not_found` or `error` (with `detail`)
+    """
+    results = service.import_songs(iter_ndjson(request.stream()))
+
+    async def body():
+        async for result in results:
+            yield dumps_line(result)
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+@router.patch("/bulk", response_model=SongBulkResponse, tags=["Songs"], summary="Update many songs partially")
+async def bulk_patch_songs(body: SongBulkPatch = Body(...), service: SongService = Depends(get_song_service)):
+    """
+    Apply up to 1000 partial updates with one bulk write.
+
+    ### Request body
+    - **items**: `{"id": ..., "title"?, "artist"?, "lyrics"?}` per song
+    - **ordered**: `false` (default) applies every item it can; `true`
+      stops at the first failure
+
+    ### Responses
+    - **200**: `results`, one per item in request order, with `status`:
+      `updated`, `not_found`, `duplicate` (title/artist of another song),
+      `skipped` (after a failure, `ordered` only) or `error` (with `detail`);
+      and `summary`, the count per status
+    """
+    results = await service.bulk_update_songs([item.dict(exclude_unset=True) for item in body.items], ordered=body.ordered)
+    return {"results": results, "summary": Counter(result["status"] for result in results)}
+
+@router.delete("/bulk", response_model=SongBulkResponse, tags=["Songs"], summary="Delete many songs by ID")
+async def bulk_delete_songs(body: SongBulkDelete = Body(...), service: SongService = Depends(get_song_service)):
+    """
+    Delete up to 1000 songs with one bulk write.
+
+    ### Request body
+    - **ids**: Song IDs
+    - **ordered**: `false` (default) deletes every song it can; `true`
+      stops at the first failure
+
+    ### Responses
+    - **200**: `results`, one per ID in request order, with `status`:
+      `deleted`, `not_found`, `skipped` (`ordered` only) or `error`
+      (with `detail`); and `summary`, the count per status
+    """
+    results = await service.bulk_delete_songs(body.ids, ordered=body.ordered)
+    return {"results": results, "summary": Counter(result["status"] for result in results)}
+
+@router.get("/suggest", response_model=List[SongSuggestion], response_class=ORJSONResponse, tags=["Songs"], summary="Typeahead suggestions by title or artist", responses={
+        503: {"description": "Suggest index disabled or still building"},
+    })
+async def suggest_songs(q: str = Query(..., min_length=1, max_length=200, description="Text typed so far"),
+                        k: int = Query(10, ge=1, le=50, description="Max suggestions"),
+                        service: SongService = Depends(get_song_service)):
+    """
+    Suggest songs while the user types.
+
+    Served from an in-memory index of normalized titles and artists, so it
+    never touches Mongo: songs whose title or artist (or any word of it)
+    starts with `q` come first, then fuzzy matches for typos.
+
+    ### Responses
+    - **200**: List of `SongSuggestion` (`id`, `title`, `artist`, `match`)
+    - **503**: Index disabled or still being built at startup
+    """
+    return ORJSONResponse(service.suggest_songs(q, k))
+
 @router.get("/{song_id}", response_model=SongWithLyrics, tags=["Songs"], summary="Get a song by ID", responses={
         404: {"description": "Song not found"}
     })
@@ -46,11 +143,17 @@ async def get_song(song_id: str,
                     size: int = Query(1, ge=1, le=100, description="Lyrics per page"),
                    service: SongService = Depends(get_song_service)):
     """
-    Retrieve a song by its song_id.
+    Retrieve a song by its song_id with one page of lyrics.
 
     ### Path parameters
     - **song_id**: MongoDB ObjectId of the song *(string, required)*
 
+    ### Query parameters
+    - **page**: Lyrics page number *(int, default 1)*
+    - **size**: Lyrics lines per page *(int, default 1, max 100)*
+
+    The response carries `total` (lyrics lines) and `pages` (for this `size`).
+
     ### Responses
     - **200**: `SongRead` (song data)
     - **404**: Song not found
@@ -60,6 +163,36 @@ async def get_song(song_id: str,
         raise HTTPException(status_code=404, detail="Song not found")
     return song
 
+@router.get("/{song_id}/synced", response_model=SyncedLyrics, tags=["Songs"], summary="Get synced lyrics at a playback time", responses={
+        400: {"description": "Neither `t` nor `start`/`end` given"},
+        404: {"description": "Song not found or has no synced lyrics"}
+    })
+async def get_synced_lyrics(song_id: str,
+                            t: Optional[int] = Query(None, ge=0, description="Playback position in ms"),
+                            start: Optional[int] = Query(None, ge=0, description="Window start in ms"),
+                            end: Optional[int] = Query(None, ge=0, description="Window end in ms"),
+                            service: SongService = Depends(get_song_service)):
+    """
+    Retrieve the synced lyrics line(s) for a playback position.
+
+    ### Path parameters
+    - **song_id**: MongoDB ObjectId of the song *(string, required)*
+
+    ### Query parameters
+    - **t**: Line active at this time in ms, *or*
+    - **start**/**end**: All lines active within this window in ms
+
+    `next_ms` tells the player when the following line starts.
+
+    ### Responses
+    - **200**: `SyncedLyrics`
+    - **400**: Missing or inverted time parameters
+    - **404**: Song not found or has no synced lyrics
+    """
+    if t is None and (start is None or end is None or end < start):
+        raise HTTPException(status_code=400, detail="Give `t`, or `start` and `end` with start <= end")
+    return await service.get_synced_lyrics(song_id, t=t, start=start, end=end)
+
 @router.delete("/{song_id}", tags=["Songs"], summary="Delete a song by ID", responses={
         404: {"description": "Song not found"}
     })
@@ -78,9 +211,12 @@ async def delete_song(song_id: str, service: SongService = Depends(get_song_serv
     return deleted
 
 @router.patch("/{song_id}", tags=["Songs"], summary="Update a song partially by ID", responses={
-        404: {"description": "Song not found"}
+        404: {"description": "Song not found"},
+        409: {"description": "Another song has this title and artist"},
     })
-async def patch_song(song_id: str, data: SongUpdate = Body(...), service: SongService = Depends(get_song_service)):
+async def patch_song(song_id: str, data: SongUpdate = Body(...),
+                     return_song: bool = Query(False, description="Return the updated song (without lyrics) instead of a message"),
+                     service: SongService = Depends(get_song_service)):
     """
     Partially update fields of a song.
 
@@ -93,15 +229,24 @@ async def patch_song(song_id: str, data: SongUpdate = Body(...), service: SongSe
     - **artist** *(string, optional)*
     - **release_date** *(string, optional, ISO format)*
 
+    ### Query parameters
+    - **return_song**: Return the updated song as `SongReturn`; by default
+      only a confirmation message is returned and nothing is read back
+
     ### Responses
-    - **200**: Updated song
+    - **200**: Confirmation message, or the updated song
     - **404**: Song not found
+    - **409**: Another song already has this title and artist
     """
-    updated = await service.update_song(song_id, data.dict(exclude_unset=True))
+    updated = await service.update_song(song_id, data.dict(exclude_unset=True), return_song=return_song)
     return updated
 
-@router.post("/search", response_model=List[SongReturn], tags=["Songs"], summary="Search songs by artist, keywords or release date range")
+@router.post("/search", response_model=List[SongReturn], response_class=ORJSONResponse, tags=["Songs"], summary="Search songs by artist, keywords or release date range", responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        400: {"description": "Invalid cursor"},
+    })
 async def search_songs(
+    request: Request,
     search: SongSearch = Body(...),
     service: "SongService" = Depends(get_song_service)
 ):
@@ -112,9 +257,37 @@ async def search_songs(
     - **keywords** *(string, optional)*: Text to match in title, artist, or lyrics
     - **release_date** *(string, optional, ISO format)*: Exact release date
     - **link** *(string, optional)*: Source link
+    - **limit** *(int, optional)*: Page size, default 100
+    - **cursor** *(string, optional)*: `X-Next-Cursor` value from the previous page
+    - **engine** *(string, optional)*: `mongo` (default) or `bm25` to rank keywords
+      with the in-process index; results then carry `matched_lines`. Quoted
+      keywords must match as a phrase.
+
+    ### Pagination
+    When more results exist, the response carries an `X-Next-Cursor` header;
+    send it back as `cursor` (with the same filters) to get the next page.
+
+    ### Streaming
+    With `Accept: application/x-ndjson` the results are streamed as
+    newline-delimited JSON as they are read from Mongo; `limit` is then
+    optional and defaults to all matches.
 
     ### Responses
     - **200**: List of `SongRead` matching search criteria (possibly empty)
+    - **400**: Malformed cursor
     """
-    results = await service.search_songs(search.dict(exclude_unset=True))
-    return results
+    query = search.dict(exclude_unset=True)
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        songs = service.stream_songs(query)
+
+        async def body():
+            async for song in songs:
+                yield dumps_line(song)
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    # Rows are already `SongReturn`-shaped; returning the response directly
+    # skips FastAPI's second validation/serialization pass
+    results, next_cursor = await service.search_songs(query)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return ORJSONResponse(results, headers=headers)
@@ -14,6 +14,127 @@ class Settings:
         self.genius_api_url: str = os.getenv("GENIUS_API_URL")
         self.genius_token: str = os.getenv("GENIUS_TOKEN")
         self.lrclib_url: str = os.getenv("LRCLIB_URL")
+        self.musixmatch_api_key: str = os.getenv("MUSIXMATCH_API_KEY")
+
+        # Mongo connection pool
+        self.mongo_max_pool_size: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+        self.mongo_min_pool_size: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+        self.mongo_max_idle_time_ms: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+        self.mongo_server_selection_timeout_ms: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+
+        # Production server (`python -m app.server`); 0 workers = one per available core
+        self.web_host: str = os.getenv("WEB_HOST", "0.0.0.0")
+        self.web_port: int = int(os.getenv("WEB_PORT", "8000"))
+        self.web_workers: int = int(os.getenv("WEB_WORKERS", "0"))
+        self.web_loop: str = os.getenv("WEB_LOOP", "uvloop")
+        self.web_http: str = os.getenv("WEB_HTTP", "httptools")
+        self.graceful_shutdown_seconds: float = float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+        # Create indexes in the background at startup (readiness waits for
+        # them); turn off when `python -m app.cli migrate` runs on deploy
+        self.indexes_on_startup: bool = os.getenv("INDEXES_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+        # Prometheus metrics on /metrics
+        self.metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+        # Lyrics sources raced for each add, most preferred first, and the
+        # max upstream requests in flight at once (1 = try them in turn)
+        self.lyrics_sources: list = [p.strip() for p in os.getenv("LYRICS_SOURCES", "lrclib_synced,lrclib_plain,musixmatch").split(",") if p.strip()]
+        self.lyrics_cost_budget: float = float(os.getenv("LYRICS_COST_BUDGET", "3"))
+
+        # Per-request timing: `Server-Timing` header with repository/provider
+        # spans, and a JSON log line for requests slower than SLOW_REQUEST_MS
+        self.server_timing_enabled: bool = os.getenv("SERVER_TIMING", "true").lower() in ("1", "true", "yes")
+        self.slow_request_ms: float = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+        # cProfile for a sampled fraction of requests, or for requests sending
+        # `X-Profile: <PROFILE_TOKEN>`; profiles are written to PROFILE_DIR
+        self.profile_sample_rate: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        self.profile_token: str = os.getenv("PROFILE_TOKEN")
+        self.profile_dir: str = os.getenv("PROFILE_DIR", "/tmp/songlibrary-profiles")
+
+        # Lyrics storage format for new writes: "array" (one string per line)
+        # or "zlib" (compressed text + line offsets). Mongo `$text` cannot see
+        # zlib lyrics; keyword searches over them need the bm25 engine.
+        # `python -m app.cli migrate-lyrics` converts existing songs.
+        self.lyrics_storage: str = os.getenv("LYRICS_STORAGE", "array").lower()
+
+        # Shared HTTP transport for external providers
+        self.http_pool_limit: int = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+        self.http_pool_limit_per_host: int = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "20"))
+        self.http_dns_cache_ttl: int = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+        self.http_keepalive_timeout: float = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+        self.http_connect_timeout: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3"))
+        self.http_read_timeout: float = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+        self.http_total_timeout: float = float(os.getenv("HTTP_TOTAL_TIMEOUT", "15"))
+        self.http_max_response_bytes: int = int(os.getenv("HTTP_MAX_RESPONSE_BYTES", "2000000"))
+
+        # Enrichment latency budget (seconds)
+        self.enrich_deadline: float = float(os.getenv("ENRICH_DEADLINE", "8"))
+        self.provider_timeout: float = float(os.getenv("PROVIDER_TIMEOUT", "5"))
+
+        # Provider quotas: {"provider": [requests per second, burst]}
+        self.provider_rate_limits: dict = {
+            "genius": [5, 10],
+            "lrclib": [10, 20],
+            "spotify": [10, 20],
+            "musixmatch": [2, 5],
+            **json.loads(os.getenv("PROVIDER_RATE_LIMITS", "{}")),
+        }
+        self.provider_max_retries: int = int(os.getenv("PROVIDER_MAX_RETRIES", "2"))
+        self.provider_backoff_base: float = float(os.getenv("PROVIDER_BACKOFF_BASE", "0.5"))
+        self.provider_backoff_max: float = float(os.getenv("PROVIDER_BACKOFF_MAX", "30"))
+        self.spotify_token_refresh_margin: float = float(os.getenv("SPOTIFY_TOKEN_REFRESH_MARGIN", "60"))
+
+        # Provider circuit breakers and hedged requests
+        self.breaker_window: int = int(os.getenv("BREAKER_WINDOW", "20"))
+        self.breaker_min_calls: int = int(os.getenv("BREAKER_MIN_CALLS", "10"))
+        self.breaker_failure_rate: float = float(os.getenv("BREAKER_FAILURE_RATE", "0.5"))
+        self.breaker_slow_call_seconds: float = float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "3"))
+        self.breaker_slow_call_rate: float = float(os.getenv("BREAKER_SLOW_CALL_RATE", "0.8"))
+        self.breaker_open_seconds: float = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+        self.breaker_half_open_calls: int = int(os.getenv("BREAKER_HALF_OPEN_CALLS", "2"))
+        self.hedged_providers: list = [p.strip() for p in os.getenv("HEDGED_PROVIDERS", "").split(",") if p.strip()]
+        self.hedge_min_delay: float = float(os.getenv("HEDGE_MIN_DELAY", "0.05"))
+
+        # Asynchronous enrichment (ENRICH_WORKERS=0 runs no workers in this process)
+        self.enrich_workers: int = int(os.getenv("ENRICH_WORKERS", "4"))
+        self.enrich_poll_interval: float = float(os.getenv("ENRICH_POLL_INTERVAL", "1"))
+        self.enrich_lease_seconds: float = float(os.getenv("ENRICH_LEASE_SECONDS", "60"))
+        self.enrich_max_attempts: int = int(os.getenv("ENRICH_MAX_ATTEMPTS", "3"))
+        self.enrich_retry_backoff: float = float(os.getenv("ENRICH_RETRY_BACKOFF", "5"))
+        # On shutdown, seconds in-flight jobs get to finish before they are cancelled
+        self.enrich_drain_seconds: float = float(os.getenv("ENRICH_DRAIN_SECONDS", "8"))
+
+        # Bulk import
+        self.bulk_concurrency: int = int(os.getenv("BULK_CONCURRENCY", "8"))
+        self.bulk_batch_size: int = int(os.getenv("BULK_BATCH_SIZE", "500"))
+
+        # Search streaming
+        self.search_stream_batch_size: int = int(os.getenv("SEARCH_STREAM_BATCH_SIZE", "100"))
+
+        # In-process BM25 search index, opt-in with SEARCH_ENGINE=bm25: every
+        # worker process scans all songs (lyrics included) at boot and keeps
+        # its own positional index, several times the size of the lyrics.
+        # Searches asking for `engine=bm25` fall back to Mongo `$text` without it.
+        # Plus the title/artist typeahead index (SUGGEST_INDEX)
+        self.search_engine: str = os.getenv("SEARCH_ENGINE", "none").lower()
+        self.search_index_batch_size: int = int(os.getenv("SEARCH_INDEX_BATCH_SIZE", "500"))
+        self.suggest_enabled: bool = os.getenv("SUGGEST_INDEX", "true").lower() in ("1", "true", "yes")
+
+        # Provider response cache
+        self.cache_backend: str = os.getenv("CACHE_BACKEND", "memory").lower()
+        self.redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.cache_ttl: float = float(os.getenv("CACHE_TTL", "86400"))
+        self.cache_negative_ttl: float = float(os.getenv("CACHE_NEGATIVE_TTL", "600"))
+        self.cache_max_entries: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+        # Hot song document cache (0 entries disables it); the invalidation
+        # bus also keeps the search index of every worker in sync
+        self.song_cache_max_entries: int = int(os.getenv("SONG_CACHE_MAX_ENTRIES", "1000"))
+        self.song_cache_max_bytes: int = int(os.getenv("SONG_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.song_cache_ttl: float = float(os.getenv("SONG_CACHE_TTL", "300"))
+        self.song_cache_admit_after: int = int(os.getenv("SONG_CACHE_ADMIT_AFTER", "2"))
+        self.song_cache_invalidation: str = os.getenv("SONG_CACHE_INVALIDATION", "poll").lower()
+        self.song_cache_poll_interval: float = float(os.getenv("SONG_CACHE_POLL_INTERVAL", "1"))
 
     @property
     def fastapi_kwargs(self):
@@ -25,6 +146,15 @@ class Settings:
             "lrclib_url": self.lrclib_url,
         }
 
+    @property
+    def mongo_client_kwargs(self):
+        return {
+            "maxPoolSize": self.mongo_max_pool_size,
+            "minPoolSize": self.mongo_min_pool_size,
+            "maxIdleTimeMS": self.mongo_max_idle_time_ms,
+            "serverSelectionTimeoutMS": self.mongo_server_selection_timeout_ms,
+        }
+
 
 @lru_cache
 def get_app_settings() -> Settings:
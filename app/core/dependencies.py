@@ -1,20 +1,187 @@
 from ..repositories.song_repository import SongRepository
+from ..repositories.job_repository import JobRepository
 from ..services.song_service import SongService
+from ..services.enrichment_worker import EnrichmentWorker
+from ..services.lyrics_chain import LyricsChain, build_lyrics_sources
 from ..external.genius_client import GeniusClient
 from ..external.LRCLib_client import LRCLibProvider
 from ..external.spotify_client import SpotifyProvider
+from ..external.musixmatch_client import MusixmatchClient
+from ..external.transport import HttpTransport
+from ..external.scheduler import ProviderScheduler
+from ..external.resilience import CircuitBreaker, ProviderGuard, GuardedTransport
+from ..cache.backends import create_cache_backend
+from ..cache.providers import ProviderCache, CachedProvider
+from ..cache.songs import SongDocumentCache
+from ..cache.invalidation import RedisInvalidationBus, MongoPollingInvalidationBus
+from ..search.engine import SearchEngine
+from ..search.suggest import SuggestIndex
+from ..db.mongo import get_mongo_client
+from ..metrics.instruments import InstrumentedTransport, mongo_event_listeners
+from ..metrics.timing import TimedProxy
 from .config import Settings
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 def create_dependencies(settings: Settings = None):
+    """
+    Build the application-scoped service container.
+
+    Called once from the startup handler; everything returned here is shared
+    by all requests and released by `close_dependencies` on shutdown.
+    """
     if settings is None:
-        from app.core.config import Settings
-        settings = Settings()
+        from app.core.config import get_app_settings
+        settings = get_app_settings()
+
+    event_listeners = None
+    if settings.metrics_enabled:
+        event_listeners = mongo_event_listeners()
+
+    mongo_client = get_mongo_client(settings, event_listeners=event_listeners)
+    repo = SongRepository(client=mongo_client, db_name=settings.mongo_db_name,
+                          compress_lyrics=settings.lyrics_storage == "zlib")
+    jobs = JobRepository(client=mongo_client, db_name=settings.mongo_db_name)
+    if settings.server_timing_enabled:
+        # `mongo.<method>` spans in the Server-Timing header
+        repo = TimedProxy(repo, "mongo")
+        jobs = TimedProxy(jobs, "mongo")
+    http = HttpTransport(settings)
+    scheduler = ProviderScheduler(
+        {name: tuple(quota) for name, quota in settings.provider_rate_limits.items()},
+        max_retries=settings.provider_max_retries,
+        backoff_base=settings.provider_backoff_base,
+        backoff_max=settings.provider_backoff_max,
+    )
+    provider_guards = {}
+
+    def provider_http(name: str):
+        # metrics -> rate limit/429 retries -> breaker/hedging -> shared connection pool.
+        # The breaker sits under the scheduler so bucket waits and Retry-After
+        # sleeps never count towards a call's latency or outcome.
+        provider_guards[name] = ProviderGuard(
+            CircuitBreaker(name, window=settings.breaker_window, min_calls=settings.breaker_min_calls,
+                           failure_rate=settings.breaker_failure_rate, slow_call_seconds=settings.breaker_slow_call_seconds,
+                           slow_call_rate=settings.breaker_slow_call_rate, open_seconds=settings.breaker_open_seconds,
+                           half_open_calls=settings.breaker_half_open_calls),
+            hedge=name in settings.hedged_providers,
+            hedge_min_delay=settings.hedge_min_delay,
+            bucket=scheduler.buckets.get(name),
+        )
+        transport = scheduler.bind(GuardedTransport(http, provider_guards[name]), name)
+        if settings.metrics_enabled:
+            transport = InstrumentedTransport(transport, name)
+        return transport
+
+    genius = GeniusClient(provider_http("genius"))
+    lrclib_provider = LRCLibProvider(provider_http("lrclib"))
+    spotify_provider = SpotifyProvider(provider_http("spotify"), token_refresh_margin=settings.spotify_token_refresh_margin)
+    musixmatch = MusixmatchClient(provider_http("musixmatch")) if settings.musixmatch_api_key else None
+
+    provider_cache = None
+    cache_backend = create_cache_backend(settings)
+    if cache_backend is not None:
+        provider_cache = ProviderCache(cache_backend, ttl=settings.cache_ttl, negative_ttl=settings.cache_negative_ttl)
+        genius = CachedProvider(genius, provider_cache, "genius", ["search_song"])
+        lrclib_provider = CachedProvider(lrclib_provider, provider_cache, "lrclib", ["fetch_lyrics"])
+        spotify_provider = CachedProvider(spotify_provider, provider_cache, "spotify", ["search_song"])
+        if musixmatch is not None:
+            musixmatch = CachedProvider(musixmatch, provider_cache, "musixmatch", ["fetch_lyrics"])
+
+    lyrics_chain = LyricsChain(build_lyrics_sources(lrclib_provider, musixmatch, order=settings.lyrics_sources),
+                               cost_budget=settings.lyrics_cost_budget)
+
+    song_cache = None
+    if settings.song_cache_max_entries > 0:
+        song_cache = SongDocumentCache(max_entries=settings.song_cache_max_entries, max_bytes=settings.song_cache_max_bytes,
+                                       ttl=settings.song_cache_ttl, admit_after=settings.song_cache_admit_after)
+
+    search_engine = SearchEngine() if settings.search_engine == "bm25" else None
+    suggest_index = SuggestIndex() if settings.suggest_enabled else None
+
+    invalidation_bus = None
+    if song_cache is not None or search_engine is not None or suggest_index is not None:
+        # song_service is bound below, before the bus is started
+        on_invalidate = lambda song_ids, reindex: song_service.handle_remote_invalidation(song_ids, reindex)
+        if settings.song_cache_invalidation == "redis":
+            invalidation_bus = RedisInvalidationBus(settings.redis_url, on_invalidate)
+        elif settings.song_cache_invalidation == "poll":
+            invalidation_bus = MongoPollingInvalidationBus(repo.db, on_invalidate, interval=settings.song_cache_poll_interval)
+
+    song_service = SongService(repository=repo, lyrics_provider=genius, lrclib_provider=lrclib_provider, spotify_provider=spotify_provider,
+                               cache=provider_cache, song_cache=song_cache, invalidation_bus=invalidation_bus, search_engine=search_engine,
+                               suggest_index=suggest_index, lyrics_chain=lyrics_chain,
+                               jobs=jobs, enrich_max_attempts=settings.enrich_max_attempts, enrich_retry_backoff=settings.enrich_retry_backoff,
+                               enrich_deadline=settings.enrich_deadline, provider_timeout=settings.provider_timeout,
+                               bulk_concurrency=settings.bulk_concurrency, bulk_batch_size=settings.bulk_batch_size,
+                               stream_batch_size=settings.search_stream_batch_size,
+                               search_index_batch_size=settings.search_index_batch_size)
+
+    enrichment_worker = None
+    if settings.enrich_workers > 0:
+        enrichment_worker = EnrichmentWorker(song_service, jobs, concurrency=settings.enrich_workers,
+                                             poll_interval=settings.enrich_poll_interval, lease_seconds=settings.enrich_lease_seconds,
+                                             drain_seconds=settings.enrich_drain_seconds)
+
+    return {"mongo_client": mongo_client, "http": http, "cache_backend": cache_backend,
+            "invalidation_bus": invalidation_bus, "provider_guards": provider_guards,
+            "enrichment_worker": enrichment_worker, "song_service": song_service,
+            "indexes_on_startup": settings.indexes_on_startup}
+
+async def ensure_indexes(container: dict):
+    """Create the collection indexes; idempotent, safe to run from every worker."""
+    song_service = container["song_service"]
+    await song_service.repository.ensure_indexes()
+    await song_service.jobs.ensure_indexes()
 
-    repo = SongRepository(mongo_uri=settings.mongo_uri, db_name=settings.mongo_db_name)
-    genius = GeniusClient()
-    lrclib_provider = LRCLibProvider()
-    spotify_provider = SpotifyProvider()
+async def _ensure_indexes_in_background(container: dict):
+    try:
+        await ensure_indexes(container)
+    except Exception:
+        logger.exception("Index creation failed; /health/ready stays not ready")
+        raise
+    logger.info("Indexes are up to date")
 
-    song_service = SongService(repository=repo, lyrics_provider=genius, lrclib_provider=lrclib_provider, spotify_provider=spotify_provider)
+async def start_dependencies(container: dict):
+    invalidation_bus = container.get("invalidation_bus")
+    if invalidation_bus is not None:
+        await invalidation_bus.start()
+    enrichment_worker = container.get("enrichment_worker")
+    if enrichment_worker is not None:
+        await enrichment_worker.start()
+    if container.get("indexes_on_startup"):
+        # Off the startup path: the worker serves while Mongo builds them,
+        # and /health/ready reports not ready until they exist
+        container["index_task"] = asyncio.create_task(_ensure_indexes_in_background(container))
+    song_service = container["song_service"]
+    if song_service.search_engine is not None or song_service.suggest_index is not None:
+        # Built in the background; keyword searches use Mongo until it is ready
+        container["search_index_task"] = asyncio.create_task(
+            song_service.build_search_index())
 
-    return {"song_service": song_service}
+async def close_dependencies(container: dict):
+    index_task = container.get("index_task")
+    if index_task is not None:
+        index_task.cancel()
+        await asyncio.gather(index_task, return_exceptions=True)
+    search_index_task = container.get("search_index_task")
+    if search_index_task is not None:
+        search_index_task.cancel()
+        await asyncio.gather(search_index_task, return_exceptions=True)
+    enrichment_worker = container.get("enrichment_worker")
+    if enrichment_worker is not None:
+        await enrichment_worker.stop()
+    invalidation_bus = container.get("invalidation_bus")
+    if invalidation_bus is not None:
+        await invalidation_bus.stop()
+    mongo_client = container.get("mongo_client")
+    if mongo_client is not None:
+        mongo_client.close()
+    http = container.get("http")
+    if http is not None:
+        await http.close()
+    cache_backend = container.get("cache_backend")
+    if cache_backend is not None:
+        await cache_backend.close()
@@ -1,5 +1,10 @@
 from fastapi import FastAPI
+from prometheus_client import multiprocess
 import logging
+import os
+
+from app.core.dependencies import create_dependencies, start_dependencies, close_dependencies
+from app.metrics.collectors import service_stats
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +14,11 @@ def create_start_app_handler(app: FastAPI, settings):
         # Initialize DB connections
         if hasattr(app.state, "db"):
             await app.state.db.connect()
-        # Initialize cache / external APIs if needed
+        # Build the shared service container (one Mongo pool, one set of providers)
+        app.state.container = create_dependencies(settings)
+        await start_dependencies(app.state.container)
+        if settings.metrics_enabled:
+            service_stats.bind(app.state.container)
         logger.info("Song Library API starting up...")
     return start_app
 
@@ -19,6 +28,11 @@ def create_stop_app_handler(app: FastAPI):
         # Close DB connections
         if hasattr(app.state, "db"):
             await app.state.db.disconnect()
-        # Close cache / other resources
+        # Close the shared container resources
+        if hasattr(app.state, "container"):
+            await close_dependencies(app.state.container)
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            # Drop this worker's live gauges from the merged /metrics
+            multiprocess.mark_process_dead(os.getpid())
         logger.info("Song Library API shutting down...")
     return stop_app
@@ -1,2 +1,6 @@
 class EntityDoesNotExist(Exception):
     """Raised when entity was not found in database."""
+
+
+class EntityAlreadyExists(Exception):
+    """Raised when a write is rejected by a unique index."""
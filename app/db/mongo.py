@@ -1,9 +1,18 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 
-def get_mongo_client():
-    mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-    return AsyncIOMotorClient(mongo_uri)
+def get_mongo_client(settings=None, event_listeners=None):
+    """
+    Build a Motor client. When settings are given, the connection pool is
+    sized from them; the client is meant to be created once per process and
+    shared, since every client owns its own pool and monitoring threads.
+    `event_listeners` are pymongo command/pool listeners (e.g. metrics).
+    """
+    kwargs = {"event_listeners": event_listeners} if event_listeners else {}
+    if settings is None:
+        mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+        return AsyncIOMotorClient(mongo_uri, **kwargs)
+    return AsyncIOMotorClient(settings.mongo_uri, **settings.mongo_client_kwargs, **kwargs)
 
 def get_database():
     client = get_mongo_client()
@@ -1,17 +1,24 @@
-import aiohttp
+import logging
 import os
+from .transport import HttpTransport, found
+
+logger = logging.getLogger(__name__)
+
 
 class LRCLibProvider:
     BASE_URL = os.getenv("LRCLIB_URL")
 
+    def __init__(self, http: HttpTransport):
+        self.http = http
+
     async def fetch_lyrics(self, title: str, artist: str) -> dict | None:
+        """
+        Lyrics record for title + artist, or None if LRCLib has none (404).
+        Transport errors, open circuits and other statuses propagate.
+        """
         params = {"track_name": title, "artist_name": artist}
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.BASE_URL, params=params) as resp:
-                    if resp.status != 200:
-                        return None
-                    return await resp.json()
-        except Exception as e:
-            print(f"LRCLib API error: {e}")
+        resp = await self.http.get(self.BASE_URL, params=params)
+        if not found(resp, "lrclib"):
+            logger.debug("LRCLib has no lyrics for %r by %r", title, artist)
             return None
+        return resp.json()
@@ -1,5 +1,6 @@
-import aiohttp
 import os
+from .transport import HttpTransport, ProviderError, found
+from ..utils.text import normalize
 
 
 MUSIXMATCH_API_URL = os.getenv("MUSIXMATCH_API_URL", "https://api.musixmatch.com/ws/1.1")
@@ -9,10 +10,27 @@ MUSIXMATCH_API_KEY = os.getenv("MUSIXMATCH_API_KEY")
 class MusixmatchClient:
     BASE_URL = MUSIXMATCH_API_URL
 
-    def __init__(self):
+    def __init__(self, http: HttpTransport):
         if not MUSIXMATCH_API_KEY:
             raise ValueError("MUSIXMATCH_API_KEY is not set in environment variables.")
         self.api_key = MUSIXMATCH_API_KEY
+        self.http = http
+
+    @staticmethod
+    def _message(resp):
+        """
+        Header and body of a Musixmatch envelope. The API reports errors in
+        `header.status_code` (often with HTTP 200): 404 is a miss, any other
+        non-200 raises ProviderError.
+        """
+        if not found(resp, "musixmatch"):
+            return {"status_code": 404}, {}
+        message = (resp.json() or {}).get("message", {})
+        header, body = message.get("header", {}), message.get("body") or {}
+        status = header.get("status_code", 200)
+        if status not in (200, 404):
+            raise ProviderError("musixmatch", status)
+        return header, body if isinstance(body, dict) else {}
 
     async def get_lyrics(self, track_id: int):
         """
@@ -22,20 +40,11 @@ class MusixmatchClient:
             "apikey": self.api_key,
             "track_id": track_id,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/track.lyrics.get", params=params) as resp:
-                data = await resp.json()
-                header = data.get("message", {}).get("header", {})
-                body = data.get("message", {}).get("body", {})
-
-                if header.get("status_code") == 200 and "lyrics" in body:
-                    lyrics = body["lyrics"]["lyrics_body"]
-                    return {"track_id": track_id, "lyrics": lyrics}
-                else:
-                    return {
-                        "error": header.get("status_code"),
-                        "message": header.get("status_code")
-                    }
+        resp = await self.http.get(f"{self.BASE_URL}/track.lyrics.get", params=params)
+        header, body = self._message(resp)
+        if header.get("status_code") == 404 or "lyrics" not in body:
+            return None
+        return {"track_id": track_id, "lyrics": body["lyrics"]["lyrics_body"]}
 
     async def search_track(self, title: str, artist: str = ""):
         """
@@ -50,19 +59,27 @@ class MusixmatchClient:
         if artist:
             params["q_artist"] = artist
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.BASE_URL}/track.search", params=params) as resp:
-                data = await resp.json()
-                header = data.get("message", {}).get("header", {})
-                body = data.get("message", {}).get("body", {})
+        resp = await self.http.get(f"{self.BASE_URL}/track.search", params=params)
+        _, body = self._message(resp)
+        if body.get("track_list"):
+            first_track = body["track_list"][0]["track"]
+            return {
+                "track_id": first_track["track_id"],
+                "title": first_track["track_name"],
+                "artist": first_track["artist_name"],
+                "album": first_track.get("album_name"),
+                "explicit": first_track.get("explicit", 0),
+            }
+        return None
 
-                if header.get("status_code") == 200 and body.get("track_list"):
-                    first_track = body["track_list"][0]["track"]
-                    return {
-                        "track_id": first_track["track_id"],
-                        "title": first_track["track_name"],
-                        "artist": first_track["artist_name"],
-                        "album": first_track.get("album_name"),
-                        "explicit": first_track.get("explicit", 0),
-                    }
-                return None
+    async def fetch_lyrics(self, title: str, artist: str):
+        """
+        Search the track, then fetch its lyrics.
+        Returns None unless the top hit matches title + artist (loosely).
+        """
+        track = await self.search_track(title, artist)
+        if not track:
+            return None
+        if normalize(track["title"]) != normalize(title) or normalize(track["artist"]) != normalize(artist):
+            return None
+        return await self.get_lyrics(track["track_id"])
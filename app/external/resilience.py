@@ -0,0 +1,230 @@
+import asyncio
+import time
+from collections import Counter, deque
+from typing import Optional
+
+from .transport import HttpResponse
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker driven by error rate and latency.
+
+    - closed: calls go through; outcomes of the last `window` calls are kept
+      and the breaker opens once at least `min_calls` were seen and either
+      the failure rate or the slow-call rate crosses its threshold
+    - open: calls are rejected right away for `open_seconds`
+    - half-open: up to `half_open_calls` trial calls go through; one failure
+      (or slow call) reopens, that many successes close it again
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 10, failure_rate: float = 0.5,
+                 slow_call_seconds: float = 3.0, slow_call_rate: float = 0.8, open_seconds: float = 30.0,
+                 half_open_calls: int = 2, clock=time.monotonic):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self._clock = clock
+        self._outcomes = deque(maxlen=window)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self.counters = Counter()
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if self._clock() - self.opened_at < self.open_seconds:
+                self.counters["rejected"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+        if self.state == self.HALF_OPEN:
+            if self._trials >= self.half_open_calls:
+                self.counters["rejected"] += 1
+                return False
+            self._trials += 1
+        return True
+
+    def release(self):
+        """Give back a half-open trial slot taken by a call that was cancelled."""
+        if self.state == self.HALF_OPEN and self._trials > 0:
+            self._trials -= 1
+
+    def record(self, success: bool, duration: float):
+        slow = duration >= self.slow_call_seconds
+        self.counters["success" if success else "failure"] += 1
+        if self.state == self.HALF_OPEN:
+            if not success or slow:
+                self._open()
+            else:
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+            return
+        if self.state == self.OPEN:
+            return  # a call that started before the breaker opened
+
+        self._outcomes.append((not success, slow))
+        if len(self._outcomes) >= self.min_calls:
+            failures = sum(failed for failed, _ in self._outcomes)
+            slows = sum(slow for _, slow in self._outcomes)
+            if failures / len(self._outcomes) >= self.failure_rate or slows / len(self._outcomes) >= self.slow_call_rate:
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = self._clock()
+        self._outcomes.clear()
+        self.counters["opened"] += 1
+
+    def stats(self) -> dict:
+        outcomes = len(self._outcomes)
+        return {
+            "state": self.state,
+            "failure_rate": sum(f for f, _ in self._outcomes) / outcomes if outcomes else 0.0,
+            "slow_call_rate": sum(s for _, s in self._outcomes) / outcomes if outcomes else 0.0,
+            **self.counters,
+        }
+
+
+class LatencyTracker:
+    """Recent successful call latencies, with a cached p95."""
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self._samples = deque(maxlen=size)
+        self.min_samples = min_samples
+        self._p95: Optional[float] = None
+        self._since_update = 0
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+        self._since_update += 1
+        if self._since_update >= 10 or self._p95 is None:
+            self._since_update = 0
+            if len(self._samples) >= self.min_samples:
+                ordered = sorted(self._samples)
+                self._p95 = ordered[int(0.95 * (len(ordered) - 1))]
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self._p95
+
+
+class ProviderGuard:
+    """
+    Circuit breaker, latency stats and hedging policy of one provider.
+    `bucket` is the provider's rate-limit TokenBucket: a hedge is only sent
+    if it can take its own token from it.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, hedge: bool = False, hedge_min_delay: float = 0.05, bucket=None):
+        self.breaker = breaker
+        self.bucket = bucket
+        self.latency = LatencyTracker()
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.counters = Counter()
+
+    def hedge_delay(self) -> Optional[float]:
+        if not self.hedge or self.latency.p95 is None:
+            return None
+        return max(self.hedge_min_delay, self.latency.p95)
+
+    def stats(self) -> dict:
+        return {
+            "breaker": self.breaker.stats(),
+            "p95_seconds": self.latency.p95,
+            "hedging": self.hedge,
+            **self.counters,
+        }
+
+
+class GuardedTransport:
+    """
+    Transport wrapper that applies a ProviderGuard:
+
+    - rejects calls with CircuitOpen while the breaker is open
+    - records outcome (exceptions, timeouts and 5xx count as failures) and
+      latency; calls cancelled by the caller are not recorded
+    - for GETs of hedged providers, fires a second identical request if the
+      first has not answered after the provider's p95 latency, and returns
+      whichever succeeds first; the hedge takes its own rate-limit token and
+      is skipped when none is free
+
+    It wraps the HTTP send itself and sits under the ProviderScheduler, so
+    rate-limit waits and 429 backoff are not timed as provider latency.
+    """
+
+    def __init__(self, inner, guard: ProviderGuard):
+        self.inner = inner
+        self.guard = guard
+
+    async def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        breaker = self.guard.breaker
+        if not breaker.allow():
+            raise CircuitOpen(f"{breaker.name} circuit is open")
+
+        start = time.monotonic()
+        try:
+            if method == "GET" and self.guard.hedge_delay() is not None:
+                resp = await self._hedged(method, url, **kwargs)
+            else:
+                resp = await self.inner.request(method, url, **kwargs)
+        except asyncio.CancelledError:
+            # The caller gave up (lost a race, another lookup failed):
+            # says nothing about the provider's health
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record(False, time.monotonic() - start)
+            raise
+
+        duration = time.monotonic() - start
+        success = resp.status < 500
+        breaker.record(success, duration)
+        if success:
+            self.guard.latency.add(duration)
+        return resp
+
+    async def _hedged(self, method: str, url: str, **kwargs) -> HttpResponse:
+        first = asyncio.ensure_future(self.inner.request(method, url, **kwargs))
+        attempts = [first]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.guard.hedge_delay())
+            if not done:
+                if self.guard.bucket is not None and not self.guard.bucket.try_acquire():
+                    self.guard.counters["hedge_throttled"] += 1
+                else:
+                    self.guard.counters["hedged"] += 1
+                    attempts.append(asyncio.ensure_future(self.inner.request(method, url, **kwargs)))
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is not first:
+                            self.guard.counters["hedge_won"] += 1
+                        return attempt.result()
+            raise first.exception()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("POST", url, **kwargs)
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from .transport import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` requests per second with bursts of up
+    to `burst`. Waiters are served in arrival order. `block_for` pauses the
+    bucket entirely, e.g. while an upstream `Retry-After` is in effect.
+    """
+
+    def __init__(self, rate: float, burst: int, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is free right now and nobody is queued for
+        one; never waits. For optional extra requests such as hedges.
+        """
+        if self._lock.locked():
+            return False
+        now = self._clock()
+        if now < self._blocked_until:
+            return False
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def block_for(self, seconds: float):
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """`Retry-After` as seconds, from either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class ProviderScheduler:
+    """
+    Shared scheduler for outgoing provider requests.
+
+    - Token-bucket rate limit per provider, from the configured quotas
+    - On 429, waits for `Retry-After` (or exponential backoff with full
+      jitter when absent) and retries up to `max_retries` times; the whole
+      provider bucket is paused meanwhile so other callers do not pile on
+    """
+
+    def __init__(self, quotas: Dict[str, Tuple[float, int]], max_retries: int = 2,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.buckets = {name: TokenBucket(rate, burst) for name, (rate, burst) in quotas.items()}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def request(self, provider: str, send: Callable[[], Awaitable[HttpResponse]]) -> HttpResponse:
+        """
+        Run `send` once per attempt, after the bucket lets it through.
+        `send` is the bare HTTP call (under the provider's breaker), so only
+        the request itself is timed, never the waits around it.
+        """
+        bucket = self.buckets.get(provider)
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await bucket.acquire()
+            resp = await send()
+            if resp.status != 429 or attempt >= self.max_retries:
+                return resp
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            if delay is None:
+                delay = self.backoff(attempt)
+            delay = min(delay, self.backoff_max)
+            logger.warning("%s returned 429, retrying in %.2fs", provider, delay)
+            if bucket is not None:
+                bucket.block_for(delay)
+            else:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    def bind(self, http, provider: str) -> "ScheduledTransport":
+        return ScheduledTransport(http, self, provider)
+
+
+class ScheduledTransport:
+    """
+    HttpTransport view for a single provider whose requests go through the
+    ProviderScheduler. Same `get`/`post` interface as HttpTransport; `http`
+    is the transport each attempt is sent on (HttpTransport, or a
+    GuardedTransport around it).
+    """
+
+    def __init__(self, http, scheduler: ProviderScheduler, provider: str):
+        self.http = http
+        self.scheduler = scheduler
+        self.provider = provider
+
+    async def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        return await self.scheduler.request(self.provider, lambda: self.http.request(method, url, **kwargs))
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("POST", url, **kwargs)
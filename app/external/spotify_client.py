@@ -1,30 +1,63 @@
-import aiohttp
 import asyncio
 import base64
 import os
-from typing import Optional, Dict
+import time
+from typing import Optional, Dict, List
+from .transport import HttpTransport, ProviderError, found
 
 
 class SpotifyProvider:
     """
     Wrapper for Spotify Web API search endpoints.
 
-    - Authenticates with Client Credentials flow
+    - Authenticates with Client Credentials flow; the token is refreshed
+      `token_refresh_margin` seconds before it expires, by a single
+      in-flight request, and once more if Spotify rejects it with 401
     - Searches for a track by title + artist
+    - Looks up many tracks at once by Spotify ID
     - Returns metadata (release_date, external_url, cover_art, id)
     """
 
-    def __init__(self):
+    # Max IDs per "Get Several Tracks" request
+    TRACKS_BATCH_LIMIT = 50
+
+    def __init__(self, http: HttpTransport, token_refresh_margin: float = 60.0):
+        self.http = http
+        self.token_refresh_margin = token_refresh_margin
         self.client_id = os.getenv("SPOTIFY_CLIENT_ID")
         self.client_secret = os.getenv("SPOTIFY_CLIENT_SECRET")
         self.token_url = os.getenv("SPOTIFY_TOKEN_URL")
         self.search_url = os.getenv("SPOTIFY_URL")
+        self.tracks_url = os.getenv("SPOTIFY_TRACKS_URL") or (
+            self.search_url.rsplit("/search", 1)[0] + "/tracks" if self.search_url else None
+        )
         self.access_token: Optional[str] = None
+        self.token_expires_at: float = 0.0
+        self._token_lock = asyncio.Lock()
+
+    def _token_valid(self, stale: Optional[str]) -> bool:
+        return (
+            self.access_token is not None
+            and self.access_token != stale
+            and time.monotonic() < self.token_expires_at - self.token_refresh_margin
+        )
 
-    async def _get_access_token(self) -> str:
-        if self.access_token:
+    async def _get_access_token(self, stale: Optional[str] = None) -> str:
+        """
+        Return a valid access token, refreshing it when it is about to expire
+        or when `stale` (a token the API just rejected) is still current.
+        Concurrent callers share a single refresh.
+        """
+        if self._token_valid(stale):
             return self.access_token
 
+        async with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._token_valid(stale):
+                return self.access_token
+            return await self._refresh_access_token()
+
+    async def _refresh_access_token(self) -> str:
         if not self.client_id or not self.client_secret:
             raise Exception("Spotify CLIENT_ID or CLIENT_SECRET not set")
 
@@ -38,43 +71,68 @@ class SpotifyProvider:
         }
         data = {"grant_type": "client_credentials"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.token_url, data=data, headers=headers) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    raise Exception(f"Spotify token error: {resp.status}, body={text}")
+        resp = await self.http.post(self.token_url, data=data, headers=headers)
+        if resp.status != 200:
+            raise Exception(f"Spotify token error: {resp.status}, body={resp.text()}")
 
-                token_data = await resp.json()
-                self.access_token = token_data["access_token"]
-                return self.access_token
+        token_data = resp.json()
+        self.access_token = token_data["access_token"]
+        self.token_expires_at = time.monotonic() + float(token_data.get("expires_in", 3600))
+        return self.access_token
+
+    async def _authorized_get(self, url: str, params: dict):
+        """GET with the bearer token, retrying once with a fresh token on 401."""
+        token = await self._get_access_token()
+        resp = await self.http.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+        if resp.status == 401:
+            token = await self._get_access_token(stale=token)
+            resp = await self.http.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+        return resp
 
     async def search_song(self, title: str, artist: str) -> Optional[Dict]:
         """
         Search for a track by title + artist.
-        Returns first match metadata or None.
+        Returns first match metadata or None; raises ProviderError on
+        upstream errors (5xx, 429, ...).
         """
-        token = await self._get_access_token()
         query = f"track:{title} artist:{artist}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.search_url,
-                params={"q": query, "type": "track", "limit": 1},
-                headers={"Authorization": f"Bearer {token}"},
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                items = data.get("tracks", {}).get("items", [])
-                if not items:
-                    return None
-
-                track = items[0]
-                return {
-                    "id": track["id"],
-                    "release_date": track["album"]["release_date"],
-                    "external_url": track["external_urls"]["spotify"],
-                    "cover_art": track["album"]["images"][0]["url"]
-                    if track["album"]["images"]
-                    else None,
-                }
+        resp = await self._authorized_get(
+            self.search_url,
+            params={"q": query, "type": "track", "limit": 1},
+        )
+        if not found(resp, "spotify"):
+            return None
+        data = resp.json() or {}
+        items = data.get("tracks", {}).get("items", [])
+        if not items:
+            return None
+
+        return self._track_metadata(items[0])
+
+    async def get_tracks(self, track_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Look up tracks by Spotify ID, up to TRACKS_BATCH_LIMIT per request.
+        Returns metadata keyed by ID; unknown IDs are left out.
+        """
+        tracks = {}
+        for start in range(0, len(track_ids), self.TRACKS_BATCH_LIMIT):
+            ids = track_ids[start:start + self.TRACKS_BATCH_LIMIT]
+            resp = await self._authorized_get(self.tracks_url, params={"ids": ",".join(ids)})
+            if resp.status != 200:
+                raise ProviderError("spotify", resp.status, resp.text()[:200])
+            for track in (resp.json() or {}).get("tracks", []):
+                if track:
+                    tracks[track["id"]] = self._track_metadata(track)
+        return tracks
+
+    @staticmethod
+    def _track_metadata(track: dict) -> Dict:
+        return {
+            "id": track["id"],
+            "release_date": track["album"]["release_date"],
+            "external_url": track["external_urls"]["spotify"],
+            "cover_art": track["album"]["images"][0]["url"]
+            if track["album"]["images"]
+            else None,
+        }
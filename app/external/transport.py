@@ -0,0 +1,105 @@
+import aiohttp
+import json
+from typing import Optional
+
+
+class ResponseTooLarge(Exception):
+    """Raised when an upstream response body exceeds the configured size cap."""
+
+
+class ProviderError(Exception):
+    """
+    Upstream failure (5xx, 429, any other unexpected status or error body).
+    Unlike a miss it is never cached, and the caller decides what to do.
+    """
+
+    def __init__(self, provider: str, status: int, detail: str = ""):
+        super().__init__(f"{provider} returned {status}{': ' + detail if detail else ''}")
+        self.provider = provider
+        self.status = status
+
+
+def found(resp: "HttpResponse", provider: str) -> bool:
+    """True for a 2xx, False for a 404 (a miss); raises ProviderError otherwise."""
+    if 200 <= resp.status < 300:
+        return True
+    if resp.status == 404:
+        return False
+    raise ProviderError(provider, resp.status, resp.text()[:200])
+
+
+class HttpResponse:
+    """
+    Fully-read upstream response.
+
+    The body is read (up to the size cap) before the connection is handed back
+    to the pool, so providers never hold a pooled socket while parsing.
+    """
+
+    def __init__(self, status: int, headers, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class HttpTransport:
+    """
+    Shared HTTP transport for all external providers.
+
+    - One `aiohttp.ClientSession` per process, owned by the app lifespan
+    - Per-host connection limits, keep-alive and DNS cache
+    - Connect/read/total timeouts
+    - Response size cap
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.max_response_bytes = settings.http_max_response_bytes
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.settings.http_pool_limit,
+                limit_per_host=self.settings.http_pool_limit_per_host,
+                ttl_dns_cache=self.settings.http_dns_cache_ttl,
+                keepalive_timeout=self.settings.http_keepalive_timeout,
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=self.settings.http_total_timeout,
+                connect=self.settings.http_connect_timeout,
+                sock_read=self.settings.http_read_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        async with self.session.request(method, url, **kwargs) as resp:
+            if resp.content_length is not None and resp.content_length > self.max_response_bytes:
+                raise ResponseTooLarge(f"{url} returned {resp.content_length} bytes")
+            chunks = []
+            size = 0
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                size += len(chunk)
+                if size > self.max_response_bytes:
+                    raise ResponseTooLarge(f"{url} returned more than {self.max_response_bytes} bytes")
+                chunks.append(chunk)
+            return HttpResponse(resp.status, resp.headers, b"".join(chunks))
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
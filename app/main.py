@@ -1,22 +1,33 @@
 from fastapi import FastAPI, HTTPException
 from app.core.settings import get_app_settings
+from app.core import config
+from app.core.events import create_start_app_handler, create_stop_app_handler
 from app.controllers.songs import router
-from app.db import mongo
+from app.controllers.diagnostics import router as diagnostics_router
+from app.controllers.jobs import router as jobs_router
+from app.controllers.metrics import router as metrics_router
+from app.controllers.health import router as health_router
+from app.metrics.middleware import MetricsMiddleware, TimingMiddleware
 from app.core.handlers import http_error_handler
-from pymongo import ASCENDING
 
 settings = get_app_settings()
 
 app = FastAPI(**settings.fastapi_kwargs)
-@app.on_event("startup")
-async def startup_event():
-    songs = mongo.get_database()["songs"]
-    await songs.create_index([("title", "text"), ("lyrics", "text")])
-    await songs.create_index(
-        [("title", ASCENDING), ("artist", ASCENDING)],
-        unique=True,
-        name="unique_title_artist",
-    )
+app.add_event_handler("startup", create_start_app_handler(app, config.get_app_settings()))
+app.add_event_handler("shutdown", create_stop_app_handler(app))
+if config.get_app_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+app_settings = config.get_app_settings()
+if app_settings.server_timing_enabled:
+    app.add_middleware(TimingMiddleware, slow_request_ms=app_settings.slow_request_ms,
+                       profile_sample_rate=app_settings.profile_sample_rate,
+                       profile_token=app_settings.profile_token, profile_dir=app_settings.profile_dir)
 
 app.add_exception_handler(HTTPException, http_error_handler)
-app.include_router(router)
\ No newline at end of file
+# Before the songs router, whose `/{song_id}` would otherwise match `/metrics`
+if config.get_app_settings().metrics_enabled:
+    app.include_router(metrics_router)
+app.include_router(health_router)
+app.include_router(router)
+app.include_router(jobs_router)
+app.include_router(diagnostics_router)
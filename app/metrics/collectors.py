@@ -0,0 +1,69 @@
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import REGISTRY
+
+BREAKER_STATES = ("closed", "open", "half_open")
+
+
+class ServiceStatsCollector:
+    """
+    Exports the stats the caches, circuit breakers and search indexes
+    already keep, read at scrape time so they cost nothing per request.
+    `bind` points it at the running service container.
+    """
+
+    def __init__(self):
+        self.container = None
+
+    def bind(self, container: dict):
+        self.container = container
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        container = self.container
+        if not container:
+            return
+        service = container["song_service"]
+
+        if service.cache is not None:
+            lookups = CounterMetricFamily("provider_cache_lookups", "Provider response cache lookups", labels=["namespace", "result"])
+            for namespace, counters in service.cache.stats().items():
+                for result, count in counters.items():
+                    lookups.add_metric([namespace, result], count)
+            yield lookups
+
+        if service.song_cache is not None:
+            stats = service.song_cache.stats()
+            lookups = CounterMetricFamily("song_cache_lookups", "Hot song cache lookups", labels=["result"])
+            lookups.add_metric(["hit"], stats["hit"])
+            lookups.add_metric(["miss"], stats["miss"])
+            yield lookups
+            removals = CounterMetricFamily("song_cache_removals", "Songs dropped from the hot song cache", labels=["reason"])
+            removals.add_metric(["eviction"], stats["eviction"])
+            removals.add_metric(["invalidation"], stats["invalidation"])
+            yield removals
+            yield GaugeMetricFamily("song_cache_entries", "Songs in the hot song cache", value=stats["entries"])
+            yield GaugeMetricFamily("song_cache_bytes", "Approximate size of the hot song cache", value=stats["bytes"])
+
+        guards = container.get("provider_guards") or {}
+        if guards:
+            state = GaugeMetricFamily("provider_circuit_state", "1 for the current circuit breaker state", labels=["provider", "state"])
+            failure_rate = GaugeMetricFamily("provider_circuit_failure_rate", "Failure rate over the breaker window", labels=["provider"])
+            for name, guard in guards.items():
+                stats = guard.breaker.stats()
+                for value in BREAKER_STATES:
+                    state.add_metric([name, value], 1.0 if stats["state"] == value else 0.0)
+                failure_rate.add_metric([name], stats["failure_rate"])
+            yield state
+            yield failure_rate
+
+        indexed = GaugeMetricFamily("search_index_songs", "Songs in the in-process search indexes", labels=["index"])
+        for name, index in (("bm25", service.search_engine), ("suggest", service.suggest_index)):
+            if index is not None:
+                indexed.add_metric([name], len(index))
+        yield indexed
+
+
+service_stats = ServiceStatsCollector()
+REGISTRY.register(service_stats)
@@ -0,0 +1,183 @@
+"""
+Prometheus metrics and the hooks that feed them.
+
+Metric objects are module-level and created once. Label children are bound
+once per label combination and kept in plain dicts, so the hot path is a
+dict lookup plus an `observe`/`inc`, with no metric objects allocated per
+request. Gauges declare how to combine worker processes when the server
+runs with several workers (see `app.server`).
+"""
+import asyncio
+import time
+from typing import Dict, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+from pymongo import monitoring
+
+from ..external.resilience import CircuitOpen
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+MONGO_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template, method and status",
+    ["route", "method", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being processed", multiprocess_mode="livesum")
+
+PROVIDER_DURATION = Histogram(
+    "provider_request_duration_seconds", "External provider call latency by outcome",
+    ["provider", "outcome"], buckets=LATENCY_BUCKETS,
+)
+PROVIDER_IN_FLIGHT = Gauge(
+    "provider_requests_in_flight", "External provider calls in progress", ["provider"], multiprocess_mode="livesum",
+)
+
+MONGO_COMMAND_DURATION = Histogram(
+    "mongo_command_duration_seconds", "MongoDB command latency by command name and outcome",
+    ["command", "outcome"], buckets=MONGO_BUCKETS,
+)
+MONGO_POOL_CONNECTIONS = Gauge(
+    "mongo_pool_connections", "Open connections in the MongoDB pool", ["address"], multiprocess_mode="livesum",
+)
+MONGO_POOL_CHECKED_OUT = Gauge(
+    "mongo_pool_checked_out", "MongoDB connections checked out by operations", ["address"], multiprocess_mode="livesum",
+)
+MONGO_POOL_CHECKOUT_FAILURES = Counter(
+    "mongo_pool_checkout_failures_total", "Failed MongoDB connection checkouts", ["address", "reason"],
+)
+
+PROVIDERS = ("genius", "lrclib", "spotify", "musixmatch")
+PROVIDER_OUTCOMES = ("2xx", "3xx", "4xx", "5xx", "timeout", "circuit_open", "cancelled", "error")
+
+
+class LabelCache:
+    """Label children of one metric, bound on first use and reused after."""
+
+    __slots__ = ("metric", "children")
+
+    def __init__(self, metric):
+        self.metric = metric
+        self.children: Dict[Tuple[str, ...], object] = {}
+
+    def get(self, *labels: str):
+        child = self.children.get(labels)
+        if child is None:
+            child = self.children[labels] = self.metric.labels(*labels)
+        return child
+
+
+http_durations = LabelCache(HTTP_REQUEST_DURATION)
+provider_durations = LabelCache(PROVIDER_DURATION)
+mongo_durations = LabelCache(MONGO_COMMAND_DURATION)
+pool_connections = LabelCache(MONGO_POOL_CONNECTIONS)
+pool_checked_out = LabelCache(MONGO_POOL_CHECKED_OUT)
+pool_checkout_failures = LabelCache(MONGO_POOL_CHECKOUT_FAILURES)
+
+# Provider series are known up front; bind them so they are exported from the start
+for _provider in PROVIDERS:
+    for _outcome in PROVIDER_OUTCOMES:
+        provider_durations.get(_provider, _outcome)
+
+
+class InstrumentedTransport:
+    """
+    Outermost transport of a provider: times every call and records its
+    outcome (status class, timeout, open circuit, cancellation or error).
+    """
+
+    def __init__(self, inner, provider: str):
+        self.inner = inner
+        self.provider = provider
+        self._outcomes = {outcome: provider_durations.get(provider, outcome) for outcome in PROVIDER_OUTCOMES}
+        self._in_flight = PROVIDER_IN_FLIGHT.labels(provider)
+
+    async def request(self, method: str, url: str, **kwargs):
+        outcome = "error"
+        self._in_flight.inc()
+        started = time.perf_counter()
+        try:
+            resp = await self.inner.request(method, url, **kwargs)
+            outcome = f"{resp.status // 100}xx" if 200 <= resp.status < 600 else "error"
+            return resp
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            raise
+        except CircuitOpen:
+            outcome = "circuit_open"
+            raise
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            self._in_flight.dec()
+            self._outcomes.get(outcome, self._outcomes["error"]).observe(time.perf_counter() - started)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Command timings from the driver's own measurements (`duration_micros`)."""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        mongo_durations.get(event.command_name, "ok").observe(event.duration_micros / 1e6)
+
+    def failed(self, event):
+        mongo_durations.get(event.command_name, "failed").observe(event.duration_micros / 1e6)
+
+
+class MongoPoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool gauges; called from driver threads (metrics are thread-safe)."""
+
+    @staticmethod
+    def _address(event) -> str:
+        host, port = event.address
+        return f"{host}:{port}"
+
+    def pool_created(self, event):
+        pool_connections.get(self._address(event))
+        pool_checked_out.get(self._address(event))
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pool_connections.get(self._address(event)).inc()
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pool_connections.get(self._address(event)).dec()
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pool_checkout_failures.get(self._address(event), str(event.reason)).inc()
+
+    def connection_checked_out(self, event):
+        pool_checked_out.get(self._address(event)).inc()
+
+    def connection_checked_in(self, event):
+        pool_checked_out.get(self._address(event)).dec()
+
+
+def mongo_event_listeners() -> list:
+    return [MongoCommandMetrics(), MongoPoolMetrics()]
@@ -0,0 +1,136 @@
+import cProfile
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from .instruments import HTTP_IN_FLIGHT, http_durations
+from .timing import start_request
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request latency by route template,
+    method and status, and the number of requests in flight.
+
+    The route is resolved after the call from the endpoint the router put
+    in the scope, so paths like `/{song_id}` stay one series; requests that
+    match no route are reported as `unmatched`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._routes = None
+
+    def _route(self, scope) -> str:
+        if self._routes is None:
+            # Built lazily: routes are all registered by the first request
+            self._routes = {
+                getattr(route, "endpoint", None): route.path
+                for route in scope["app"].routes if hasattr(route, "path")
+            }
+        return self._routes.get(scope.get("endpoint"), "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            http_durations.get(self._route(scope), scope["method"], str(status)).observe(time.perf_counter() - started)
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware collecting per-request timing spans (see `timing`).
+
+    The spans recorded before the response starts are sent back in a
+    `Server-Timing` header; requests slower than `slow_request_ms` are
+    logged as one JSON line with the full breakdown. Optionally profiles a
+    request with cProfile: a `profile_sample_rate` fraction of them, or any
+    request sending `X-Profile: <profile_token>`. Only one request is
+    profiled at a time, and the profile covers everything the event loop
+    ran meanwhile.
+    """
+
+    def __init__(self, app, slow_request_ms: float = 1000, profile_sample_rate: float = 0,
+                 profile_token: Optional[str] = None, profile_dir: str = "/tmp/songlibrary-profiles"):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_token = profile_token.encode() if profile_token else None
+        self.profile_dir = profile_dir
+        self._profiling = False
+
+    def _wants_profile(self, scope) -> bool:
+        if self._profiling:
+            return False
+        if self.profile_token is not None:
+            for name, value in scope["headers"]:
+                if name == b"x-profile":
+                    return hmac.compare_digest(value, self.profile_token)
+        return self.profile_sample_rate > 0 and random.random() < self.profile_sample_rate
+
+    def _save_profile(self, profiler: cProfile.Profile, scope) -> str:
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+        path = os.path.join(self.profile_dir, f"{int(time.time() * 1000)}-{scope['method']}-{slug}.prof")
+        profiler.dump_stats(path)
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        timings = start_request()
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = timings.server_timing(total=time.perf_counter() - started)
+                message["headers"] = [*message.get("headers", ()), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        profiler = None
+        if self._wants_profile(scope):
+            self._profiling = True
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+                try:
+                    path = self._save_profile(profiler, scope)
+                    logger.info("Profiled %s %s (%.1f ms): %s", scope["method"], scope["path"], elapsed_ms, path)
+                except OSError as e:
+                    logger.warning("Could not save profile of %s %s: %r", scope["method"], scope["path"], e)
+            if elapsed_ms >= self.slow_request_ms:
+                logger.warning("slow request %s", json.dumps({
+                    "method": scope["method"], "path": scope["path"], "status": status,
+                    "duration_ms": round(elapsed_ms, 1), "spans": timings.as_dict(),
+                }))
@@ -0,0 +1,93 @@
+"""
+Per-request timing spans.
+
+`TimingMiddleware` puts a `RequestTimings` in a context variable for each
+request. Code under it records spans with `span(name)`; tasks spawned by
+the request inherit the context, so concurrent provider lookups land in
+the same request. Outside a request (workers, CLI) spans are no-ops.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+_current: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """Total time and count per span name."""
+
+    __slots__ = ("spans",)
+
+    def __init__(self):
+        self.spans: Dict[str, List] = {}
+
+    def add(self, name: str, seconds: float):
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """`Server-Timing` header value, durations in ms."""
+        parts = []
+        for name, (count, seconds) in self.spans.items():
+            part = f"{name};dur={seconds * 1000:.1f}"
+            if count > 1:
+                part += f';desc="x{count}"'
+            parts.append(part)
+        if total is not None:
+            parts.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(parts)
+
+    def as_dict(self) -> dict:
+        return {name: {"count": count, "ms": round(seconds * 1000, 1)} for name, (count, seconds) in self.spans.items()}
+
+
+def start_request() -> RequestTimings:
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+@contextmanager
+def span(name: str):
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+class TimedProxy:
+    """
+    Proxy recording a `<prefix>.<method>` span around every coroutine method
+    of `target` (e.g. the repositories); other attributes pass through.
+    """
+
+    def __init__(self, target, prefix: str):
+        self._target = target
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+        span_name = f"{self._prefix}.{name}"
+
+        @functools.wraps(attr)
+        async def timed(*args, **kwargs):
+            with span(span_name):
+                return await attr(*args, **kwargs)
+
+        # Cached on the proxy: later lookups skip __getattr__
+        setattr(self, name, timed)
+        return timed
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
-from datetime import date
+from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Literal, Optional
+from datetime import date, datetime
 
 class SongBase(BaseModel):
     title: str = Field(..., description="Title of the song")
@@ -14,17 +14,52 @@ class SongWithLyrics(SongBase):
     release_date: Optional[date] = Field(None, description="Release date of the song")
     lyrics: Optional[List[str]] = Field(None, description="List of lyrics verses")
     link: Optional[str] = Field(None, description="Link to the song in external API")
+    total: Optional[int] = Field(None, description="Total number of lyrics verses")
+    pages: Optional[int] = Field(None, description="Total number of lyrics pages for the requested size")
+    enrichment_status: Optional[str] = Field(None, description="`pending` while the song is enriched in the background")
 
 class SongReturn(SongBase):
     id: str = Field(..., description="Unique ID of the song in the database")
     release_date: Optional[date] = Field(None, description="Release date of the song")
     link: Optional[str] = Field(None, description="Link to the song in external API")
+    matched_lines: Optional[List[int]] = Field(None, description="Lyrics lines matching the keywords (`bm25` engine only)")
+
+class SongSuggestion(SongBase):
+    id: str = Field(..., description="Unique ID of the song in the database")
+    match: str = Field(..., description="`prefix` or `fuzzy`")
+
+class SyncedLine(BaseModel):
+    time_ms: int = Field(..., description="Start of the line in milliseconds")
+    text: str = Field(..., description="Lyrics line")
+
+class SyncedLyrics(BaseModel):
+    id: str = Field(..., description="Unique ID of the song in the database")
+    lines: List[SyncedLine] = Field(..., description="Lines active at the requested time or window")
+    next_ms: Optional[int] = Field(None, description="Start of the next line after the requested time, if any")
+
+class SongAccepted(BaseModel):
+    id: str = Field(..., description="Unique ID of the pending song in the database")
+    job_id: str = Field(..., description="ID of the enrichment job")
+    status: str = Field(..., description="Job status")
+
+class JobStatus(BaseModel):
+    id: str = Field(..., description="Unique ID of the job")
+    song_id: str = Field(..., description="Song being enriched")
+    status: str = Field(..., description="pending, running, done or failed")
+    attempts: int = Field(..., description="Attempts made so far")
+    max_attempts: int = Field(..., description="Attempts allowed before the job fails")
+    error: Optional[str] = Field(None, description="Last error, if any")
+    created_at: datetime
+    updated_at: datetime
 
 class SongSearch(BaseModel):
     release_date_from: Optional[date] = None
     release_date_to: Optional[date] = None
     keywords: Optional[List[str]] = None
     link: Optional[str] = None
+    limit: Optional[int] = Field(None, ge=1, le=1000, description="Max songs per page (default 100)")
+    cursor: Optional[str] = Field(None, description="Continuation token from the previous page's X-Next-Cursor header")
+    engine: Optional[Literal["mongo", "bm25"]] = Field(None, description="Keyword search engine: Mongo `$text` (default) or the in-process BM25 index")
     class Config:
         schema_extra = {
             "example": {
@@ -37,9 +72,37 @@ class SongUpdate(BaseModel):
     artist: Optional[str] = None
     lyrics: List[Optional[str]] = None
 
+    @field_validator("title", "artist")
+    @classmethod
+    def not_null(cls, value):
+        # Omit the field to keep it; null would leave the song without a match key
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
     class Config:
         schema_extra = {
             "example": {
                 "title": "New Song Title"
             }
-        }
\ No newline at end of file
+        }
+
+class SongBulkPatchItem(SongUpdate):
+    id: str = Field(..., description="Unique ID of the song to update")
+
+class SongBulkPatch(BaseModel):
+    items: List[SongBulkPatchItem] = Field(..., min_length=1, max_length=1000, description="Patches, applied in order")
+    ordered: bool = Field(False, description="Stop at the first failed update; later items are `skipped`")
+
+class SongBulkDelete(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000, description="IDs of the songs to delete")
+    ordered: bool = Field(False, description="Stop at the first failed delete; later items are `skipped`")
+
+class SongBulkResult(BaseModel):
+    id: str = Field(..., description="Song ID as given")
+    status: str = Field(..., description="updated/deleted, not_found, duplicate, skipped or error")
+    detail: Optional[str] = Field(None, description="Error detail, if any")
+
+class SongBulkResponse(BaseModel):
+    results: List[SongBulkResult] = Field(..., description="One result per item, in request order")
+    summary: Dict[str, int] = Field(..., description="Number of items per status")
@@ -0,0 +1,80 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from typing import Optional
+from bson import ObjectId
+from datetime import datetime, timedelta, timezone
+from pymongo import ASCENDING, ReturnDocument
+
+class JobRepository:
+    """
+    Mongo-backed queue of enrichment jobs.
+
+    Jobs are claimed atomically with a lease; a job whose worker died is
+    picked up again once its lease expires, so the queue survives restarts
+    without an external broker.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient, db_name: str):
+        self.client = client
+        self.db = self.client[db_name]
+        self.collection = self.db["jobs"]
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("status", ASCENDING), ("run_after", ASCENDING)], name="status_run_after")
+
+    async def create_job(self, song_id: str, title: str, artist: str, max_attempts: int) -> str:
+        now = datetime.now(timezone.utc)
+        result = await self.collection.insert_one({
+            "song_id": song_id,
+            "title": title,
+            "artist": artist,
+            "status": "pending",
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "error": None,
+            "run_after": now,
+            "locked_until": None,
+            "created_at": now,
+            "updated_at": now,
+        })
+        return str(result.inserted_id)
+
+    async def claim_job(self, lease_seconds: float) -> Optional[dict]:
+        now = datetime.now(timezone.utc)
+        return await self.collection.find_one_and_update(
+            {"$or": [
+                {"status": "pending", "run_after": {"$lte": now}},
+                {"status": "running", "locked_until": {"$lt": now}},
+            ]},
+            {
+                "$set": {"status": "running", "locked_until": now + timedelta(seconds=lease_seconds), "updated_at": now},
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_after", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def complete_job(self, job_id: ObjectId):
+        await self._finish(job_id, {"status": "done", "error": None})
+
+    async def fail_job(self, job_id: ObjectId, error: str, retry_in: Optional[float] = None):
+        if retry_in is None:
+            await self._finish(job_id, {"status": "failed", "error": error})
+        else:
+            run_after = datetime.now(timezone.utc) + timedelta(seconds=retry_in)
+            await self._finish(job_id, {"status": "pending", "error": error, "run_after": run_after})
+
+    async def _finish(self, job_id: ObjectId, fields: dict):
+        fields["locked_until"] = None
+        fields["updated_at"] = datetime.now(timezone.utc)
+        await self.collection.update_one({"_id": job_id}, {"$set": fields})
+
+    async def get_job(self, job_id: str) -> Optional[dict]:
+        try:
+            obj_id = ObjectId(job_id)
+        except Exception:
+            return None
+
+        job = await self.collection.find_one({"_id": obj_id})
+        if job:
+            job["id"] = str(job["_id"])
+        return job
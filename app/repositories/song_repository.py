@@ -1,57 +1,516 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from bson import ObjectId
 from datetime import datetime
 from fastapi import HTTPException
 from ..core import handlers
-from pymongo import ASCENDING
+from pymongo import ASCENDING, DeleteOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from ..db.errors import EntityAlreadyExists
+from ..utils.lyrics_codec import pack_lyrics, unpack_lyrics, PackedLyrics
+from ..utils.text import match_key
+
+DUPLICATE_KEY_ERROR = 11000
+
+# Unique on the normalized title/artist. Partial, so songs written before
+# `match_key` existed do not collide on a missing key until backfilled.
+MATCH_KEY_INDEX = "unique_match_key"
+LEGACY_UNIQUE_INDEX = "unique_title_artist"
+# Attempts at an update that changes only one of title/artist when a
+# concurrent write changes the other one in between
+MATCH_KEY_UPDATE_ATTEMPTS = 3
+
+# Fields search results return; lyrics are never read for a search
+SEARCH_PROJECTION = {"title": 1, "artist": 1, "release_date": 1, "link": 1}
 
 class SongRepository:
-    def __init__(self, mongo_uri: str, db_name: str):
-        self.client = AsyncIOMotorClient(mongo_uri)
+    def __init__(self, client: AsyncIOMotorClient, db_name: str, compress_lyrics: bool = False):
+        """
+        Args:
+            compress_lyrics (bool): Write lyrics as one compressed `lyrics_z`
+                blob with a line-offset index instead of a `lyrics` array.
+                Both formats are always readable.
+        """
+        self.client = client
         self.db = self.client[db_name]
         self.collection = self.db["songs"]
+        self.compress_lyrics = compress_lyrics
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("title", "text"), ("lyrics", "text")])
+        await self.collection.create_index(
+            [("match_key", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"match_key": {"$exists": True}},
+            name=MATCH_KEY_INDEX,
+        )
+
+    async def drop_legacy_indexes(self) -> List[str]:
+        """Drop the exact-string title/artist unique index `match_key` replaces."""
+        existing = await self.collection.index_information()
+        dropped = []
+        if LEGACY_UNIQUE_INDEX in existing:
+            await self.collection.drop_index(LEGACY_UNIQUE_INDEX)
+            dropped.append(LEGACY_UNIQUE_INDEX)
+        return dropped
 
-    async def search_song(self, song_data: dict) -> Optional[dict]:
-        title = song_data.get("title", "")
-        artist = song_data.get("artist", "")
-        existing = await self.collection.find_one({"title": title, "artist": artist})
-        if existing:
-            return dict(existing)
-        return None
+    def _to_storage(self, fields: dict) -> Tuple[dict, List[str]]:
+        """
+        Map fields onto their stored form: `match_key` from title + artist,
+        and a `lyrics` list in the configured storage format.
+        Returns the fields to write and the stale lyrics field to unset.
+        """
+        if "title" in fields and "artist" in fields:
+            fields = {**fields, "match_key": match_key(fields["title"], fields["artist"])}
+        if "lyrics" not in fields:
+            return fields, []
+        fields = dict(fields)
+        if self.compress_lyrics:
+            fields["lyrics_z"] = pack_lyrics(fields.pop("lyrics"))
+            return fields, ["lyrics"]
+        return fields, ["lyrics_z"]
+
+    @staticmethod
+    def _from_storage(song: dict, page: Optional[int] = None, size: Optional[int] = None) -> dict:
+        """Expose compressed lyrics as a plain `lyrics` list (one page of it if asked)."""
+        packed = song.pop("lyrics_z", None)
+        if packed is not None:
+            if page is None or size is None:
+                song["lyrics"] = unpack_lyrics(packed)
+            else:
+                song["lyrics"] = PackedLyrics(packed).lines((page - 1) * size, size)
+        return song
 
     async def add_song(self, song_data: dict) -> str:
-        result = await self.collection.insert_one(song_data)
+        doc, _ = self._to_storage(song_data)
+        try:
+            result = await self.collection.insert_one(doc)
+        except DuplicateKeyError as e:
+            raise EntityAlreadyExists(str(e)) from e
+        song_data["_id"] = result.inserted_id
         return str(result.inserted_id)
 
-    async def get_song(self, song_id: str) -> Optional[dict]:
+    async def find_existing(self, songs: List[dict]) -> set:
+        """
+        Return the match keys of `songs` that are already stored, in a single
+        round-trip. Covered by the `match_key` index: no document is read.
+        """
+        if not songs:
+            return set()
+        cursor = self.collection.find(
+            {"match_key": {"$in": list({match_key(s["title"], s["artist"]) for s in songs})}},
+            {"_id": 0, "match_key": 1},
+        )
+        return {doc["match_key"] async for doc in cursor}
+
+    async def add_songs(self, songs: List[dict]) -> List[dict]:
+        """
+        Insert a batch of songs with one unordered `insert_many`.
+
+        Duplicates rejected by the `match_key` unique index do not abort the
+        batch. Returns one result per input document, in input order:
+        `{"status": "inserted", "id": ...}`, `{"status": "duplicate"}` or
+        `{"status": "error", "detail": ...}`.
+        """
+        if not songs:
+            return []
+        docs = [self._to_storage(song)[0] for song in songs]
+        write_errors = {}
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {err["index"]: err for err in e.details.get("writeErrors", [])}
+
+        results = []
+        for index, (song, doc) in enumerate(zip(songs, docs)):
+            song["_id"] = doc["_id"]
+            err = write_errors.get(index)
+            if err is None:
+                results.append({"status": "inserted", "id": str(song["_id"])})
+            elif err.get("code") == DUPLICATE_KEY_ERROR:
+                results.append({"status": "duplicate"})
+            else:
+                results.append({"status": "error", "detail": err.get("errmsg")})
+        return results
+
+    async def get_song(self, song_id: str, page: Optional[int] = None, size: Optional[int] = None) -> Optional[dict]:
+        """
+        Fetch a song by ID.
+
+        With `page`/`size`, only that page of lyric lines is sent back: the
+        array is cut server-side with `$slice` and the full line count comes
+        back as `lyrics_total`, so the bytes read scale with the page size.
+        Compressed lyrics come back whole (they are small) and only the
+        page's lines are decompressed and decoded.
+        """
         try:
             obj_id = ObjectId(song_id)
         except Exception:
             return None
 
-        song = await self.collection.find_one({"_id": obj_id})
+        if page is None or size is None:
+            song = await self.collection.find_one({"_id": obj_id})
+        else:
+            lyrics = {"$ifNull": ["$lyrics", []]}
+            pipeline = [
+                {"$match": {"_id": obj_id}},
+                {"$addFields": {
+                    "lyrics_total": {"$ifNull": ["$lyrics_z.count", {"$size": lyrics}]},
+                    "lyrics": {"$slice": [lyrics, (page - 1) * size, size]},
+                }},
+                {"$project": {"synced_lyrics": 0}},
+            ]
+            songs = await self.collection.aggregate(pipeline).to_list(length=1)
+            song = songs[0] if songs else None
+
         if song:
-            song = dict(song)
+            song = self._from_storage(dict(song), page, size)
             song["id"] = str(song["_id"])
         return song
 
-    async def update_song(self, song_id: str, updates: dict):
+    async def update_song(self, song_id: str, updates: dict, unset: Optional[List[str]] = None,
+                          projection: Optional[dict] = None):
+        """
+        Apply a partial update with an acknowledged `update_one`; nothing is
+        sent back unless `projection` asks for the updated document.
+
+        Changing only one of title/artist recomputes `match_key` from the
+        stored other one; the update is conditioned on the values it was
+        computed from.
+
+        Returns:
+            bool: Whether the song exists, or with `projection` the updated
+            song restricted to those fields (None if it does not exist).
+
+        Raises:
+            EntityAlreadyExists: If the new title/artist match another song.
+        """
         try:
             obj_id = ObjectId(song_id)
         except Exception:
-            return False
+            return None if projection is not None else False
+
+        updates, stale = self._to_storage(updates)
+        update = {"$set": updates}
+        if unset or stale:
+            update["$unset"] = {field: "" for field in (unset or []) + stale}
+
+        for _ in range(MATCH_KEY_UPDATE_ATTEMPTS):
+            query = {"_id": obj_id}
+            if ("title" in updates) != ("artist" in updates):
+                current = await self.collection.find_one({"_id": obj_id}, {"title": 1, "artist": 1})
+                if not current:
+                    break
+                query.update(title=current.get("title"), artist=current.get("artist"))
+                update["$set"] = {**updates, "match_key": match_key(updates.get("title", current.get("title") or ""),
+                                                                    updates.get("artist", current.get("artist") or ""))}
+            try:
+                if projection is not None:
+                    song = await self.collection.find_one_and_update(
+                        query, update, projection=projection, return_document=ReturnDocument.AFTER)
+                    found = song is not None
+                else:
+                    found = (await self.collection.update_one(query, update)).matched_count > 0
+            except DuplicateKeyError as e:
+                raise EntityAlreadyExists(str(e)) from e
+            if found or len(query) == 1:
+                if projection is not None:
+                    return self._from_storage(song) if found else None
+                return found
+        return None if projection is not None else False
+
+    async def bulk_update_songs(self, patches: List[Tuple[str, dict, List[str]]], ordered: bool = False) -> List[dict]:
+        """
+        Apply `(song_id, updates, unset)` patches with one `bulk_write`.
+
+        Songs are looked up first in one query, for `not_found` and for the
+        stored title/artist a `match_key` needs when a patch changes only one
+        of them (the other is written back alongside). Those updates are
+        conditioned on the title/artist/match_key read; a song deleted or
+        renamed in between matches nothing and is reported as `not_found`.
+        Ordered writes stop at the first failure; later patches are reported
+        as `skipped`.
+
+        Returns:
+            List[dict]: One result per patch, in order: `{"id", "status"}`
+            with `updated`, `not_found`, `duplicate`, `skipped` or `error`
+            (with `detail`).
+        """
+        results: List[Optional[dict]] = [None] * len(patches)
+        ids = {}
+        for index, (song_id, updates, unset) in enumerate(patches):
+            try:
+                ids[index] = ObjectId(song_id)
+            except Exception:
+                results[index] = {"id": song_id, "status": "error", "detail": "Invalid song ID"}
+            else:
+                if not updates and not unset:
+                    results[index] = {"id": song_id, "status": "error", "detail": "No fields to update"}
+            if results[index] is not None and ordered:
+                break
+
+        current = {}
+        if ids:
+            cursor = self.collection.find({"_id": {"$in": list(ids.values())}}, {"title": 1, "artist": 1, "match_key": 1})
+            current = {song["_id"]: song async for song in cursor}
+
+        requests, request_index, expected = [], [], {}
+        for index, (song_id, updates, unset) in enumerate(patches):
+            if results[index] is not None:
+                continue
+            if index not in ids:
+                results[index] = {"id": song_id, "status": "skipped"}
+                continue
+            song = current.get(ids[index])
+            if song is None:
+                results[index] = {"id": song_id, "status": "not_found"}
+                continue
+            query = {"_id": ids[index]}
+            if ("title" in updates) != ("artist" in updates):
+                updates = {"title": song.get("title") or "", "artist": song.get("artist") or "", **updates}
+                query.update(title=song.get("title"), artist=song.get("artist"), match_key=song.get("match_key"))
+            fields, stale = self._to_storage(updates)
+            update = {"$set": fields}
+            if unset or stale:
+                update["$unset"] = {field: "" for field in (unset or []) + stale}
+            requests.append(UpdateOne(query, update))
+            request_index.append(index)
+            expected[index] = {field: fields.get(field) for field in ("title", "artist", "match_key") if field in fields}
+
+        write_errors, matched = await self._bulk_write(requests, ordered)
+        self._bulk_results(patches, results, request_index, write_errors, ordered, "updated")
+        if matched < sum(results[index]["status"] == "updated" for index in request_index):
+            await self._unmatched_as_not_found(results, ids, expected)
+        return results
+
+    async def _unmatched_as_not_found(self, results: list, ids: dict, expected: dict):
+        """
+        Some bulk updates matched no song: re-read the ones reported `updated`
+        and turn those that are gone, or do not hold the written
+        title/artist/match_key, into `not_found`.
+        """
+        updated = [index for index in expected if results[index]["status"] == "updated"]
+        cursor = self.collection.find({"_id": {"$in": [ids[index] for index in updated]}},
+                                      {"title": 1, "artist": 1, "match_key": 1})
+        stored = {song["_id"]: song async for song in cursor}
+        for index in updated:
+            song = stored.get(ids[index])
+            if song is None or any(song.get(field) != value for field, value in expected[index].items()):
+                results[index] = {"id": results[index]["id"], "status": "not_found"}
+
+    async def bulk_delete_songs(self, song_ids: List[str], ordered: bool = False) -> List[dict]:
+        """
+        Delete songs with one `bulk_write`, looking them up first with a
+        query covered by the `_id` index (for `not_found`).
+
+        Returns:
+            List[dict]: One result per ID, in order: `{"id", "status"}` with
+            `deleted`, `not_found`, `skipped` or `error` (with `detail`).
+        """
+        results: List[Optional[dict]] = [None] * len(song_ids)
+        ids = {}
+        for index, song_id in enumerate(song_ids):
+            try:
+                ids[index] = ObjectId(song_id)
+            except Exception:
+                results[index] = {"id": song_id, "status": "error", "detail": "Invalid song ID"}
+                if ordered:
+                    break
 
-        # return_document=True gives the updated document
-        song = await self.collection.find_one_and_update(
-            {"_id": obj_id},
-            {"$set": updates},
-            return_document=True  # default False, set True for updated doc
+        existing = set()
+        if ids:
+            cursor = self.collection.find({"_id": {"$in": list(ids.values())}}, {"_id": 1})
+            existing = {song["_id"] async for song in cursor}
+
+        requests, request_index = [], []
+        for index, song_id in enumerate(song_ids):
+            if results[index] is not None:
+                continue
+            if index not in ids:
+                results[index] = {"id": song_id, "status": "skipped"}
+            elif ids[index] not in existing:
+                results[index] = {"id": song_id, "status": "not_found"}
+            else:
+                requests.append(DeleteOne({"_id": ids[index]}))
+                request_index.append(index)
+
+        write_errors, _ = await self._bulk_write(requests, ordered)
+        self._bulk_results([(song_id,) for song_id in song_ids], results, request_index, write_errors, ordered, "deleted")
+        return results
+
+    async def _bulk_write(self, requests: list, ordered: bool) -> Tuple[dict, int]:
+        """Run `requests`, returning write errors keyed by request index and the matched count."""
+        if not requests:
+            return {}, 0
+        try:
+            result = await self.collection.bulk_write(requests, ordered=ordered)
+        except BulkWriteError as e:
+            return {err["index"]: err for err in e.details.get("writeErrors", [])}, e.details.get("nMatched", 0)
+        return {}, result.matched_count
+
+    @staticmethod
+    def _bulk_results(items: list, results: list, request_index: List[int], write_errors: dict, ordered: bool, done: str):
+        stopped = False
+        for position, index in enumerate(request_index):
+            song_id = items[index][0]
+            err = write_errors.get(position)
+            if stopped:
+                results[index] = {"id": song_id, "status": "skipped"}
+            elif err is None:
+                results[index] = {"id": song_id, "status": done}
+            elif err.get("code") == DUPLICATE_KEY_ERROR:
+                results[index] = {"id": song_id, "status": "duplicate"}
+            else:
+                results[index] = {"id": song_id, "status": "error", "detail": err.get("errmsg")}
+            if err is not None and ordered:
+                stopped = True
+        if stopped:
+            # Ordered: nothing after the failed write ran, not even skipped lookups
+            first_failed = request_index[min(write_errors)]
+            for index in range(first_failed + 1, len(results)):
+                if results[index]["status"] == "not_found":
+                    results[index] = {"id": items[index][0], "status": "skipped"}
+
+    async def get_synced_lyrics(self, song_id: str) -> Optional[dict]:
+        """Fetch only the lyrics and their `synced_lyrics` offsets."""
+        try:
+            obj_id = ObjectId(song_id)
+        except Exception:
+            return None
+        song = await self.collection.find_one({"_id": obj_id}, {"lyrics": 1, "lyrics_z": 1, "synced_lyrics": 1})
+        if song and "lyrics_z" in song:
+            # Lazy: only the lines around the requested time get decoded
+            song["lyrics"] = PackedLyrics(song.pop("lyrics_z"))
+        return song
+
+    def iter_unparsed_synced_lyrics(self, batch_size: int = 500):
+        """Songs whose lyrics still hold raw "[mm:ss.xx] text" LRC lines."""
+        return self.collection.find(
+            {"synced_lyrics": {"$exists": False}, "lyrics.0": {"$regex": r"^\[\d+:\d"}},
+            {"lyrics": 1},
+            batch_size=batch_size,
         )
 
-        if song:
-            return True
-        return False
+    def iter_songs_needing_refresh(self, stale_before: datetime, retry_before: datetime, batch_size: int = 500):
+        """
+        Songs whose Spotify metadata was never refreshed or last refreshed
+        before `stale_before`, and songs missing release date, link or cover
+        art that were last tried before `retry_before` (Spotify may simply
+        not have them, so they are not retried on every run).
+        """
+        return self.collection.find(
+            {
+                "enrichment_status": {"$ne": "pending"},
+                "$or": [
+                    {"spotify_refreshed_at": None},
+                    {"spotify_refreshed_at": {"$lt": stale_before}},
+                    {
+                        "spotify_refreshed_at": {"$lt": retry_before},
+                        "$or": [{"release_date": None}, {"link": None}, {"cover_art": None}],
+                    },
+                ],
+            },
+            {"title": 1, "artist": 1, "spotify_id": 1, "release_date": 1, "link": 1, "cover_art": 1},
+            batch_size=batch_size,
+        )
+
+    async def set_many(self, updates: List[tuple]) -> int:
+        """
+        Apply `(song_id, fields)` `$set` updates with one unordered `bulk_write`.
+        Returns the number of modified songs.
+        """
+        if not updates:
+            return 0
+        requests = []
+        for song_id, fields in updates:
+            fields, stale = self._to_storage(fields)
+            update = {"$set": fields}
+            if stale:
+                update["$unset"] = {field: "" for field in stale}
+            requests.append(UpdateOne({"_id": ObjectId(song_id)}, update))
+        result = await self.collection.bulk_write(requests, ordered=False)
+        return result.modified_count
+
+    async def migrate_lyrics_storage(self, compress: bool = True, batch_size: int = 500) -> int:
+        """
+        Convert stored lyrics between the array and compressed formats.
+
+        Each update is conditioned on the lyrics it was computed from, so a
+        song edited meanwhile is left alone rather than overwritten; rerun
+        to pick it up. Returns the number of songs converted.
+        """
+        if compress:
+            query = {"lyrics": {"$type": "array"}, "lyrics_z": {"$exists": False}}
+        else:
+            query = {"lyrics_z": {"$exists": True}}
+        cursor = self.collection.find(query, {"lyrics": 1, "lyrics_z": 1}, batch_size=batch_size)
+
+        converted = 0
+        batch = []
+        async for song in cursor:
+            if compress:
+                batch.append(UpdateOne(
+                    {"_id": song["_id"], "lyrics": song["lyrics"], "lyrics_z": {"$exists": False}},
+                    {"$set": {"lyrics_z": pack_lyrics(song["lyrics"])}, "$unset": {"lyrics": ""}},
+                ))
+            else:
+                batch.append(UpdateOne(
+                    {"_id": song["_id"], "lyrics_z.data": song["lyrics_z"]["data"]},
+                    {"$set": {"lyrics": unpack_lyrics(song["lyrics_z"])}, "$unset": {"lyrics_z": ""}},
+                ))
+            if len(batch) >= batch_size:
+                converted += (await self.collection.bulk_write(batch, ordered=False)).modified_count
+                batch = []
+        if batch:
+            converted += (await self.collection.bulk_write(batch, ordered=False)).modified_count
+        return converted
+
+    async def backfill_match_keys(self, batch_size: int = 500) -> dict:
+        """
+        Set `match_key` on songs stored before it existed, and recompute keys
+        that no longer match the current normalization.
+
+        Run after `ensure_indexes`: a song whose key is already taken is
+        rejected by the unique index and reported in `conflicts` (its ID),
+        to be merged or renamed by hand. Each update is conditioned on the
+        title/artist the key was computed from and on the key it replaces.
+
+        Returns:
+            dict: `{"updated": int, "conflicts": [song_id, ...]}`.
+        """
+        cursor = self.collection.find({}, {"title": 1, "artist": 1, "match_key": 1}, batch_size=batch_size)
+        updated, conflicts = 0, []
+
+        async def flush(batch: List[UpdateOne], ids: list):
+            nonlocal updated
+            try:
+                result = await self.collection.bulk_write(batch, ordered=False)
+                updated += result.modified_count
+            except BulkWriteError as e:
+                updated += e.details.get("nModified", 0)
+                for err in e.details.get("writeErrors", []):
+                    if err.get("code") != DUPLICATE_KEY_ERROR:
+                        raise
+                    conflicts.append(str(ids[err["index"]]))
+
+        batch, ids = [], []
+        async for song in cursor:
+            title, artist = song.get("title"), song.get("artist")
+            key = match_key(title or "", artist or "")
+            if song.get("match_key") == key:
+                continue
+            current = song["match_key"] if "match_key" in song else {"$exists": False}
+            batch.append(UpdateOne(
+                {"_id": song["_id"], "title": title, "artist": artist, "match_key": current},
+                {"$set": {"match_key": key}},
+            ))
+            ids.append(song["_id"])
+            if len(batch) >= batch_size:
+                await flush(batch, ids)
+                batch, ids = [], []
+        if batch:
+            await flush(batch, ids)
+        return {"updated": updated, "conflicts": conflicts}
 
     async def delete_song(self, song_id: str):
         try:
@@ -59,12 +518,43 @@ class SongRepository:
         except Exception:
             return False
 
-        song = await self.collection.find_one_and_delete({"_id": obj_id})
-        if song:
-            return True
-        return False
+        result = await self.collection.delete_one({"_id": obj_id})
+        return result.deleted_count > 0
 
-    async def search_songs(self, search: dict) -> List[dict]:
+    async def iter_search_corpus(self, batch_size: int = 500):
+        """Every song's indexed text fields, for building the in-process search index."""
+        cursor = self.collection.find({}, {"title": 1, "artist": 1, "lyrics": 1, "lyrics_z": 1}, batch_size=batch_size)
+        async for song in cursor:
+            yield self._from_storage(song)
+
+    async def get_search_fields_many(self, song_ids: List[str]) -> dict:
+        """Search index fields of the given songs in one `$in` query, keyed by ID; missing songs are absent."""
+        ids = []
+        for song_id in song_ids:
+            try:
+                ids.append(ObjectId(song_id))
+            except Exception:
+                continue
+        if not ids:
+            return {}
+        cursor = self.collection.find({"_id": {"$in": ids}}, {"title": 1, "artist": 1, "lyrics": 1, "lyrics_z": 1})
+        return {str(song["_id"]): self._from_storage(song) async for song in cursor}
+
+    async def get_songs_by_ids(self, song_ids: List[str], search: Optional[dict] = None) -> dict:
+        """
+        Fetch the given songs that also pass the non-text filters of `search`,
+        keyed by ID. Used to resolve hits ranked by the in-process engine.
+        """
+        query = self._search_query({k: v for k, v in (search or {}).items() if k != "keywords"})
+        query["_id"] = {"$in": [ObjectId(song_id) for song_id in song_ids]}
+        songs = {}
+        async for song in self.collection.find(query, SEARCH_PROJECTION):
+            song["id"] = str(song["_id"])
+            songs[song["id"]] = song
+        return songs
+
+    @staticmethod
+    def _search_query(search: dict) -> dict:
         query = {}
 
         # Filter by release_date range
@@ -83,14 +573,47 @@ class SongRepository:
         if search.get("keywords", False):
             query["$text"] = {"$search": " ".join(search["keywords"])}
 
-        # Perform the query
-        cursor = self.collection.find(query)
+        return query
+
+    def iter_search_songs(self, search: dict, limit: Optional[int] = None, after: Optional[dict] = None,
+                          batch_size: Optional[int] = None):
+        """
+        Return a cursor over matching songs, in keyset order.
+
+        Plain filters are ordered by `_id`; text searches by `(score desc, _id)`.
+        `after` is the decoded position of the last song already returned, so
+        each page is an index range scan rather than a growing skip. Only
+        `SEARCH_PROJECTION` (plus `score`) is returned.
+        """
+        query = self._search_query(search)
 
-        # If using text search, sort by relevance
         if "$text" in query:
-            cursor = cursor.sort([("score", {"$meta": "textScore"})])
+            pipeline = [
+                {"$match": query},
+                {"$project": {**SEARCH_PROJECTION, "score": {"$meta": "textScore"}}},
+            ]
+            if after is not None:
+                pipeline.append({"$match": {"$or": [
+                    {"score": {"$lt": after["score"]}},
+                    {"score": after["score"], "_id": {"$gt": ObjectId(after["id"])}},
+                ]}})
+            pipeline.append({"$sort": {"score": -1, "_id": 1}})
+            if limit:
+                pipeline.append({"$limit": limit})
+            kwargs = {"batchSize": batch_size} if batch_size else {}
+            return self.collection.aggregate(pipeline, **kwargs)
+
+        if after is not None:
+            query["_id"] = {"$gt": ObjectId(after["id"])}
+        cursor = self.collection.find(query, SEARCH_PROJECTION).sort("_id", ASCENDING)
+        if limit:
+            cursor = cursor.limit(limit)
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return cursor
 
-        songs = await cursor.to_list(length=100)  # limit to first 100 results
+    async def search_songs(self, search: dict, limit: int = 100, after: Optional[dict] = None) -> List[dict]:
+        songs = await self.iter_search_songs(search, limit=limit, after=after).to_list(length=limit)
         for song in songs:
             song["id"] = str(song["_id"])
         return songs
@@ -0,0 +1,272 @@
+import math
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from heapq import nsmallest
+from typing import Dict, List, Optional, Tuple
+
+TOKEN = re.compile(r"\w+")
+PHRASE = re.compile(r'"([^"]*)"')
+
+# Title and artist matches weigh more than a match in one lyrics line
+TITLE_WEIGHT = 3.0
+ARTIST_WEIGHT = 2.0
+LYRICS_WEIGHT = 1.0
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN.findall(text.lower())
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """Split a query into loose terms and quoted phrases."""
+    phrases = [tokenize(p) for p in PHRASE.findall(query)]
+    terms = tokenize(PHRASE.sub(" ", query))
+    return terms, [p for p in phrases if p]
+
+
+class _Postings:
+    """
+    Posting list of one term, as parallel arrays.
+
+    For the k-th posting: document `docs[k]`, weighted term frequency
+    `freqs[k]`, token positions `positions[starts[k]:starts[k + 1]]`.
+    Documents are appended in increasing order, so `docs` is sorted.
+    """
+
+    __slots__ = ("docs", "freqs", "starts", "positions")
+
+    def __init__(self):
+        self.docs = array("I")
+        self.freqs = array("f")
+        self.starts = array("I", [0])
+        self.positions = array("I")
+
+    def add(self, doc: int, freq: float, positions: List[int]):
+        self.docs.append(doc)
+        self.freqs.append(freq)
+        self.positions.extend(positions)
+        self.starts.append(len(self.positions))
+
+    def positions_of(self, doc: int) -> Optional[array]:
+        k = bisect_left(self.docs, doc)
+        if k == len(self.docs) or self.docs[k] != doc:
+            return None
+        return self.positions[self.starts[k]:self.starts[k + 1]]
+
+
+class SearchEngine:
+    """
+    In-memory BM25 index over song title, artist and lyrics lines.
+
+    - Term dictionary mapping terms to ids, one array-backed posting list
+      per term, with token positions for phrase queries and hit lines
+    - Each song is one document; its token stream is title, then artist,
+      then every lyrics line, and `segments` records where each starts so a
+      position maps back to a lyrics line
+    - Incremental: `upsert` replaces a song, `remove` tombstones it; dead
+      postings are dropped by `compact` once they pile up
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, compact_ratio: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.compact_ratio = compact_ratio
+        self.ready = False
+        self._reset()
+
+    def _reset(self):
+        self._terms: Dict[str, int] = {}
+        self._postings: List[_Postings] = []
+        self._df = array("I")
+        self._song_ids: List[Optional[str]] = []
+        self._docno: Dict[str, int] = {}
+        self._lengths = array("f")
+        self._segments: List[Optional[array]] = []
+        self._doc_terms: List[Optional[array]] = []
+        self._total_length = 0.0
+        self._tombstones = 0
+
+    def __len__(self):
+        return len(self._docno)
+
+    def upsert(self, song_id: str, title: str, artist: str, lyrics: Optional[List[str]]):
+        replaced = song_id in self._docno
+        if replaced:
+            self._remove(song_id)
+        doc = len(self._song_ids)
+
+        positions = defaultdict(list)
+        freqs = defaultdict(float)
+        segments = array("I")
+        pos = 0
+        fields = [(title or "", TITLE_WEIGHT), (artist or "", ARTIST_WEIGHT)]
+        fields += [(line or "", LYRICS_WEIGHT) for line in lyrics or []]
+        for text, weight in fields:
+            segments.append(pos)
+            for token in tokenize(text):
+                positions[token].append(pos)
+                freqs[token] += weight
+                pos += 1
+
+        doc_terms = array("I")
+        for term, term_positions in positions.items():
+            term_id = self._terms.get(term)
+            if term_id is None:
+                term_id = self._terms[term] = len(self._postings)
+                self._postings.append(_Postings())
+                self._df.append(0)
+            self._postings[term_id].add(doc, freqs[term], term_positions)
+            self._df[term_id] += 1
+            doc_terms.append(term_id)
+
+        length = sum(freqs.values())
+        self._song_ids.append(song_id)
+        self._docno[song_id] = doc
+        self._lengths.append(length)
+        self._segments.append(segments)
+        self._doc_terms.append(doc_terms)
+        self._total_length += length
+        if replaced:
+            self._maybe_compact()
+
+    def remove(self, song_id: str):
+        if song_id in self._docno:
+            self._remove(song_id)
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        # Updates tombstone the old copy too, so both paths check the ratio
+        if self._tombstones > 1000 and self._tombstones > self.compact_ratio * len(self._docno):
+            self.compact()
+
+    def _remove(self, song_id: str):
+        doc = self._docno.pop(song_id)
+        for term_id in self._doc_terms[doc]:
+            self._df[term_id] -= 1
+        self._total_length -= self._lengths[doc]
+        self._song_ids[doc] = None
+        self._segments[doc] = None
+        self._doc_terms[doc] = None
+        self._tombstones += 1
+
+    def compact(self):
+        """Rebuild posting lists without removed songs and renumber documents."""
+        renumber = {}
+        for old, song_id in enumerate(self._song_ids):
+            if song_id is not None:
+                renumber[old] = len(renumber)
+
+        postings = []
+        for old_postings in self._postings:
+            new = _Postings()
+            for k, doc in enumerate(old_postings.docs):
+                if doc in renumber:
+                    new.add(renumber[doc], old_postings.freqs[k],
+                            old_postings.positions[old_postings.starts[k]:old_postings.starts[k + 1]])
+            postings.append(new)
+        self._postings = postings
+
+        keep = sorted(renumber)
+        self._song_ids = [self._song_ids[i] for i in keep]
+        self._lengths = array("f", (self._lengths[i] for i in keep))
+        self._segments = [self._segments[i] for i in keep]
+        self._doc_terms = [self._doc_terms[i] for i in keep]
+        self._docno = {song_id: doc for doc, song_id in enumerate(self._song_ids)}
+        self._tombstones = 0
+
+    def _phrase_positions(self, doc: int, phrase: List[int]) -> List[int]:
+        """Start positions of `phrase` (term ids) in `doc`, within one segment."""
+        term_positions = [set(self._postings[t].positions_of(doc) or ()) for t in phrase]
+        segments = self._segments[doc]
+        starts = []
+        for start in sorted(term_positions[0]):
+            if all(start + i in term_positions[i] for i in range(1, len(phrase))):
+                if bisect_right(segments, start) == bisect_right(segments, start + len(phrase) - 1):
+                    starts.append(start)
+        return starts
+
+    def _lyrics_line(self, doc: int, position: int) -> Optional[int]:
+        segment = bisect_right(self._segments[doc], position) - 1
+        return segment - 2 if segment >= 2 else None
+
+    def search(self, query: str, limit: int = 20, after: Optional[dict] = None) -> List[dict]:
+        """
+        Rank songs for `query` with BM25.
+
+        Loose terms are OR-ed; quoted phrases must all occur (within a single
+        title, artist or lyrics line). Results are ordered by
+        `(score desc, song_id)`; `after` (`{"id", "score"}` of the previous
+        page's last hit) continues from that position.
+
+        Returns:
+            List[dict]: `{"id", "score", "lines"}` where `lines` are the lyrics
+            line indices containing a query term or phrase.
+        """
+        terms, phrases = parse_query(query)
+        live = len(self._docno)
+        if live == 0 or (not terms and not phrases):
+            return []
+
+        phrase_ids = []
+        for phrase in phrases:
+            ids = [self._terms.get(t) for t in phrase]
+            if None in ids:
+                return []  # a required phrase contains an unknown term
+            phrase_ids.append(ids)
+
+        term_ids = {self._terms[t] for t in terms if t in self._terms}
+        term_ids.update(t for ids in phrase_ids for t in ids)
+
+        k1, song_ids, lengths = self.k1, self._song_ids, self._lengths
+        if self._total_length <= 0:
+            return []  # live songs have no tokens ("!!!"): nothing can match
+        base = k1 * (1 - self.b)
+        per_length = k1 * self.b * live / self._total_length
+        scores = defaultdict(float)
+        for term_id in term_ids:
+            df = self._df[term_id]
+            if df == 0:
+                continue
+            weight = math.log(1 + (live - df + 0.5) / (df + 0.5)) * (k1 + 1)
+            postings = self._postings[term_id]
+            for doc, tf in zip(postings.docs, postings.freqs):
+                if song_ids[doc] is not None:
+                    scores[doc] += weight * tf / (tf + base + per_length * lengths[doc])
+
+        phrase_hits = {}
+        if phrase_ids:
+            # Only songs holding every phrase term need their positions checked
+            required = set(scores)
+            for term_id in {t for ids in phrase_ids for t in ids}:
+                required.intersection_update(self._postings[term_id].docs)
+            for doc in list(scores):
+                if doc not in required:
+                    del scores[doc]
+                    continue
+                hits = []
+                for ids in phrase_ids:
+                    starts = self._phrase_positions(doc, ids)
+                    if not starts:
+                        del scores[doc]
+                        break
+                    hits.extend(starts)
+                else:
+                    phrase_hits[doc] = hits
+
+        ranked = ((-score, self._song_ids[doc], doc) for doc, score in scores.items())
+        if after is not None:
+            position = (-after["score"], after["id"])
+            ranked = (r for r in ranked if (r[0], r[1]) > position)
+        top = nsmallest(limit, ranked)
+
+        results = []
+        for neg_score, song_id, doc in top:
+            positions = list(phrase_hits.get(doc, ()))
+            for term_id in term_ids:
+                positions.extend(self._postings[term_id].positions_of(doc) or ())
+            lines = {self._lyrics_line(doc, p) for p in positions}
+            lines.discard(None)
+            results.append({"id": song_id, "score": -neg_score, "lines": sorted(lines)})
+        return results
@@ -0,0 +1,157 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.text import normalize
+
+TITLE = 0
+ARTIST = 1
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SuggestIndex:
+    """
+    Typeahead index over normalized song titles and artists.
+
+    - Prefix matches come from one sorted array of `(key, field, doc)`
+      entries: a bisect finds the start of the range and the first `k`
+      distinct songs are read off in key order
+    - Every word start of a title/artist is a key, so "world" finds
+      "Hello World" as well as "hellowo" does
+    - When prefixes give fewer than `k` songs, a trigram index over the
+      full keys supplies fuzzy matches ranked by trigram overlap; trigrams
+      shared by more than `max_gram_docs` songs carry no signal and are
+      skipped, which bounds the work per query
+    """
+
+    def __init__(self, min_similarity: float = 0.3, max_gram_docs: int = 2000):
+        self.min_similarity = min_similarity
+        self.max_gram_docs = max_gram_docs
+        self.ready = False
+        self._entries: List[Tuple[str, int, int]] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._docs: Dict[int, Tuple[str, str, str]] = {}
+        self._docno: Dict[str, int] = {}
+        self._next_doc = 0
+        # Songs removed while the startup scan runs, so `build` won't restore them
+        self._removed: Set[str] = set()
+
+    def __len__(self):
+        return len(self._docno)
+
+    @staticmethod
+    def _keys(title: str, artist: str):
+        for field, text in ((TITLE, title), (ARTIST, artist)):
+            words = [normalize(word) for word in text.split()]
+            for i in range(len(words)):
+                key = "".join(words[i:])
+                if key:
+                    yield key, field, i == 0
+
+    def upsert(self, song_id: str, title: str, artist: str):
+        title, artist = title or "", artist or ""
+        self._removed.discard(song_id)
+        doc = self._docno.get(song_id)
+        if doc is not None:
+            if self._docs[doc][1:] == (title, artist):
+                return
+            self._remove(doc)
+        for entry in self._add(song_id, title, artist):
+            insort(self._entries, entry)
+
+    def build(self, songs: Iterable[Tuple[str, str, str]]):
+        """
+        Bulk-load `(song_id, title, artist)` triples with one sort instead of
+        an insertion per key. Songs written while the collection was being
+        scanned keep their newer entry, and songs removed meanwhile stay out.
+        """
+        for song_id, title, artist in songs:
+            if song_id not in self._docno and song_id not in self._removed:
+                self._entries.extend(self._add(song_id, title or "", artist or ""))
+        self._entries.sort()
+        self._removed.clear()
+
+    def _add(self, song_id: str, title: str, artist: str) -> List[Tuple[str, int, int]]:
+        """Register a new doc and its trigrams; returns its prefix entries, unsorted."""
+        doc = self._docno[song_id] = self._next_doc
+        self._next_doc += 1
+        self._docs[doc] = (song_id, title, artist)
+        entries = []
+        for key, field, full in self._keys(title, artist):
+            entries.append((key, field, doc))
+            if full:
+                for gram in trigrams(key):
+                    self._trigrams.setdefault(gram, set()).add(doc)
+        return entries
+
+    def remove(self, song_id: str):
+        if not self.ready:
+            self._removed.add(song_id)
+        doc = self._docno.get(song_id)
+        if doc is not None:
+            self._remove(doc)
+
+    def _remove(self, doc: int):
+        song_id, title, artist = self._docs.pop(doc)
+        del self._docno[song_id]
+        for key, field, full in self._keys(title, artist):
+            i = bisect_left(self._entries, (key, field, doc))
+            if i < len(self._entries) and self._entries[i] == (key, field, doc):
+                del self._entries[i]
+            if full:
+                for gram in trigrams(key):
+                    docs = self._trigrams.get(gram)
+                    if docs is not None:
+                        docs.discard(doc)
+                        if not docs:
+                            del self._trigrams[gram]
+
+    def suggest(self, query: str, k: int = 10, fuzzy: bool = True) -> List[dict]:
+        """
+        Top-`k` songs whose title or artist starts with `query` (after
+        normalization), padded with fuzzy matches.
+
+        Returns:
+            List[dict]: `{"id", "title", "artist", "match"}`, `match` being
+            `"prefix"` or `"fuzzy"`.
+        """
+        key = normalize(query)
+        if not key or k <= 0:
+            return []
+
+        found: Dict[int, str] = {}
+        i = bisect_left(self._entries, (key,))
+        while i < len(self._entries) and len(found) < k:
+            entry_key, _, doc = self._entries[i]
+            if not entry_key.startswith(key):
+                break
+            found.setdefault(doc, "prefix")
+            i += 1
+
+        if fuzzy and len(found) < k and len(key) >= 3:
+            for doc in self._fuzzy(key, k - len(found), exclude=found):
+                found[doc] = "fuzzy"
+
+        results = []
+        for doc, match in found.items():
+            song_id, title, artist = self._docs[doc]
+            results.append({"id": song_id, "title": title, "artist": artist, "match": match})
+        return results
+
+    def _fuzzy(self, key: str, k: int, exclude: Optional[Dict[int, str]] = None) -> List[int]:
+        postings = [self._trigrams.get(gram, ()) for gram in trigrams(key)]
+        postings = [docs for docs in postings if len(docs) <= self.max_gram_docs]
+        shared = Counter()
+        for docs in postings:
+            shared.update(docs)
+        if exclude:
+            for doc in exclude:
+                shared.pop(doc, None)
+        # Overlap over the query's trigrams; titles/artists are short, so
+        # the candidate side is left unnormalized to favour containment
+        threshold = max(1, self.min_similarity * len(postings))
+        return [doc for doc, count in shared.most_common(k) if count >= threshold]
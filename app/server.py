@@ -0,0 +1,83 @@
+"""
+Production entry point.
+
+Usage:
+    python -m app.server
+
+Runs `app.main:app` under uvicorn with WEB_WORKERS processes (default: one
+per available core, honouring the container's CPU quota), uvloop and
+httptools, and no reloader. On SIGTERM each worker stops accepting
+connections, finishes in-flight requests for up to
+GRACEFUL_SHUTDOWN_SECONDS, then runs the shutdown handlers: enrichment
+workers stop claiming jobs and finish the running ones for up to
+ENRICH_DRAIN_SECONDS, then connections close.
+"""
+import importlib.util
+import logging
+import math
+import os
+import shutil
+import tempfile
+
+import uvicorn
+
+from app.core.config import get_app_settings
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    # cgroup v2 CPU quota, e.g. "200000 100000" for 2 CPUs or "max 100000"
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def prepare_multiprocess_metrics():
+    """
+    Point prometheus_client at a fresh shared directory before the workers
+    start, so /metrics merges all workers instead of reporting whichever
+    one answered the scrape.
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.path.join(tempfile.gettempdir(), "songlibrary-metrics")
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+def event_loop(loop: str) -> str:
+    """The configured loop, or "auto" if it is uvloop and uvloop is missing (Windows, bare installs)."""
+    if loop == "uvloop" and importlib.util.find_spec("uvloop") is None:
+        logger.warning("uvloop is not installed, using the default asyncio event loop")
+        return "auto"
+    return loop
+
+
+def main():
+    settings = get_app_settings()
+    workers = settings.web_workers or available_cpus()
+    if settings.metrics_enabled and workers > 1:
+        prepare_multiprocess_metrics()
+    uvicorn.run(
+        "app.main:app",
+        host=settings.web_host,
+        port=settings.web_port,
+        workers=workers,
+        loop=event_loop(settings.web_loop),
+        http=settings.web_http,
+        timeout_graceful_shutdown=settings.graceful_shutdown_seconds,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
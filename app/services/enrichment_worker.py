@@ -0,0 +1,66 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentWorker:
+    """
+    In-process pool of tasks draining the enrichment job queue.
+
+    Each task claims one job at a time and hands it to
+    `SongService.run_enrichment_job`; when the queue is empty it sleeps for
+    `poll_interval` seconds. Provider calls still go through the shared
+    rate limiter, so the pool size only bounds concurrency.
+
+    `stop` drains: no new job is claimed, in-flight jobs get up to
+    `drain_seconds` to finish, and only the ones still running then are
+    cancelled (their lease expires and another worker retries them).
+    """
+
+    def __init__(self, service, jobs, concurrency: int = 4, poll_interval: float = 1.0, lease_seconds: float = 60.0,
+                 drain_seconds: float = 8.0):
+        self.service = service
+        self.jobs = jobs
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.drain_seconds = drain_seconds
+        self._stopping = asyncio.Event()
+        self._tasks = []
+
+    async def start(self):
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def _idle(self):
+        # A sleep that ends early once stop() is called
+        try:
+            await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                job = await self.jobs.claim_job(self.lease_seconds)
+                if job is None:
+                    await self._idle()
+                    continue
+                await self.service.run_enrichment_job(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception("Enrichment worker error: %r", e)
+                await self._idle()
+
+    async def stop(self):
+        self._stopping.set()
+        if self._tasks:
+            _, running = await asyncio.wait(self._tasks, timeout=self.drain_seconds)
+            if running:
+                logger.warning("Cancelling %d enrichment jobs still running after %.0fs", len(running), self.drain_seconds)
+                for task in running:
+                    task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
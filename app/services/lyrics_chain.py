@@ -0,0 +1,193 @@
+"""
+Lyrics source registry and first-good-answer race.
+
+A `LyricsSource` turns one provider response into lyrics, or `None` when the
+response has nothing acceptable. Several sources may read the same provider
+call (LRCLib synced and plain come from one request); the chain issues each
+call once. Sources are ranked by `priority` (lower wins) and each call has a
+`cost` in upstream requests.
+"""
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+from ..utils.lrc import parse_lrc
+
+MUSIXMATCH_FOOTER = "*******"
+
+
+class LyricsSource:
+    def __init__(self, name: str, call_name: str, call, extract: Callable[[dict], Optional[dict]],
+                 priority: int, cost: float = 1.0):
+        """
+        Args:
+            name (str): Source name, stored as the song's `lyrics_source`.
+            call_name (str): Provider call this source reads; sources sharing
+                it share one request.
+            call: Coroutine function `(title, artist)` returning the provider response.
+            extract: Maps a response to `{"lines": [...], "synced_lyrics": {...}?}`
+                or `None` if it holds no acceptable lyrics.
+            priority (int): Lower is preferred.
+            cost (float): Upstream requests the call makes.
+        """
+        self.name = name
+        self.call_name = call_name
+        self.call = call
+        self.extract = extract
+        self.priority = priority
+        self.cost = cost
+
+
+class _Call:
+    __slots__ = ("name", "fn", "cost", "sources", "priority")
+
+    def __init__(self, name: str, fn, cost: float):
+        self.name = name
+        self.fn = fn
+        self.cost = cost
+        self.sources: List[LyricsSource] = []
+        self.priority = None
+
+    def add(self, source: LyricsSource):
+        self.sources.append(source)
+        self.sources.sort(key=lambda s: s.priority)
+        self.priority = self.sources[0].priority
+
+
+class LyricsChain:
+    """
+    Races the lyrics sources and returns the best acceptable answer.
+
+    Calls start in priority order as long as the cost of the calls in flight
+    stays within `cost_budget` (one call always runs). The race ends as soon
+    as no call still running or waiting could beat the best answer so far;
+    the remaining calls are cancelled, or never started.
+    """
+
+    def __init__(self, sources: List[LyricsSource], cost_budget: float = float("inf")):
+        calls: Dict[str, _Call] = {}
+        for source in sources:
+            call = calls.get(source.call_name)
+            if call is None:
+                call = calls[source.call_name] = _Call(source.call_name, source.call, source.cost)
+            call.add(source)
+        self.calls = sorted(calls.values(), key=lambda c: c.priority)
+        self.cost_budget = cost_budget
+
+    @property
+    def sources(self) -> List[str]:
+        return [source.name for call in self.calls for source in call.sources]
+
+    async def fetch(self, title: str, artist: str, timeout: float, lookup) -> Optional[dict]:
+        """
+        Args:
+            timeout (float): Seconds until the best answer so far is returned.
+            lookup: `SongService._lookup`-style runner, `(name, fn, title, artist)`,
+                returning the response or `None` on failure.
+
+        Returns:
+            Optional[dict]: `{"source", "lines", "synced_lyrics"?, ...}` or None.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        waiting = list(self.calls)
+        running: Dict[asyncio.Task, _Call] = {}
+        in_flight_cost = 0.0
+        best_priority, best = None, None
+
+        def can_improve(call: _Call) -> bool:
+            return best_priority is None or call.priority < best_priority
+
+        def launch():
+            nonlocal in_flight_cost
+            while waiting:
+                call = waiting[0]
+                if not can_improve(call):
+                    waiting.pop(0)
+                    continue
+                if running and in_flight_cost + call.cost > self.cost_budget:
+                    return
+                waiting.pop(0)
+                in_flight_cost += call.cost
+                running[asyncio.create_task(lookup(call.name, call.fn, title, artist))] = call
+
+        try:
+            launch()
+            while running:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, _ = await asyncio.wait(running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    call = running.pop(task)
+                    in_flight_cost -= call.cost
+                    response = task.result()
+                    if not response:
+                        continue
+                    for source in call.sources:
+                        if best_priority is not None and source.priority >= best_priority:
+                            break
+                        answer = source.extract(response)
+                        if answer:
+                            best_priority, best = source.priority, {"source": source.name, **answer}
+                            break
+                if not any(can_improve(call) for call in running.values()) and not any(map(can_improve, waiting)):
+                    break
+                launch()
+        finally:
+            for task in running:
+                task.cancel()
+        return best
+
+
+def _lrclib_synced(response: dict) -> Optional[dict]:
+    synced = response.get("syncedLyrics")
+    if not synced:
+        return None
+    parsed = parse_lrc(synced)
+    if not parsed["lines"]:
+        return None
+    return {"lines": parsed["lines"], "synced_lyrics": {"offsets": parsed["offsets"], "tags": parsed["tags"]}}
+
+
+def _lrclib_plain(response: dict) -> Optional[dict]:
+    plain = response.get("plainLyrics")
+    if not plain or not plain.strip():
+        return None
+    return {"lines": plain.split("\n")}
+
+
+def _musixmatch(response: dict) -> Optional[dict]:
+    lines = (response.get("lyrics") or "").split("\n")
+    # Non-commercial keys get a truncated body ending in a "*******" notice
+    for i, line in enumerate(lines):
+        if line.startswith(MUSIXMATCH_FOOTER):
+            lines = lines[:i]
+            break
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        return None
+    return {"lines": lines, "musixmatch_id": response.get("track_id")}
+
+
+def build_lyrics_sources(lrclib_provider=None, musixmatch_provider=None, order: Optional[List[str]] = None) -> List[LyricsSource]:
+    """
+    The known lyrics sources for the configured providers, by default
+    LRCLib synced > LRCLib plain > Musixmatch. `order` lists the source
+    names to use, most preferred first; unknown or unavailable names are
+    ignored.
+    """
+    available = {}
+    if lrclib_provider is not None:
+        available["lrclib_synced"] = ("LRCLib", lrclib_provider.fetch_lyrics, _lrclib_synced, 1.0)
+        available["lrclib_plain"] = ("LRCLib", lrclib_provider.fetch_lyrics, _lrclib_plain, 1.0)
+    if musixmatch_provider is not None:
+        # track.search then track.lyrics.get
+        available["musixmatch"] = ("Musixmatch", musixmatch_provider.fetch_lyrics, _musixmatch, 2.0)
+
+    names = order if order is not None else ["lrclib_synced", "lrclib_plain", "musixmatch"]
+    sources = []
+    for priority, name in enumerate(n for n in names if n in available):
+        call_name, call, extract, cost = available[name]
+        sources.append(LyricsSource(name, call_name, call, extract, priority=priority, cost=cost))
+    return sources
@@ -1,11 +1,30 @@
-from app.repositories.song_repository import SongRepository
+from app.repositories.song_repository import SongRepository, SEARCH_PROJECTION
 from app.external.genius_client import GeniusClient
 from app.external.LRCLib_client import LRCLibProvider
 from app.external.spotify_client import SpotifyProvider
+from app.services.lyrics_chain import LyricsChain, build_lyrics_sources
 from app.models.song import SongCreate, SongReturn
-from typing import List, Optional
+from app.db.errors import EntityAlreadyExists
+from app.external.resilience import CircuitOpen
+from app.external.transport import ProviderError, ResponseTooLarge
+from app.utils.singleflight import SingleFlight
+from app.utils.cursor import encode_cursor, decode_cursor, InvalidCursor
+from app.utils.lrc import parse_lrc, line_at, lines_between, next_start
+from app.utils.text import match_key
+from app.metrics.timing import span
+from typing import AsyncIterator, List, Optional, Tuple, Union
 from fastapi import HTTPException, status
 from bson import ObjectId
+from datetime import datetime, timedelta, timezone
+import aiohttp
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# The lyrics race ends this much before the fan-out deadline, so its best
+# answer so far is in before the fan-out stops waiting
+LYRICS_DEADLINE_MARGIN = 0.05
 
 class SongService:
     """
@@ -15,31 +34,191 @@ class SongService:
     repositories (database access), and external providers (Genius API).
     """
 
-    def __init__(self, repository: SongRepository, lyrics_provider: GeniusClient, lrclib_provider: LRCLibProvider, spotify_provider=SpotifyProvider, cache=None):
+    def __init__(self, repository: SongRepository, lyrics_provider: GeniusClient, lrclib_provider: LRCLibProvider, spotify_provider=SpotifyProvider, cache=None,
+                 song_cache=None, invalidation_bus=None, search_engine=None, suggest_index=None, jobs=None, enrich_max_attempts: int = 3, enrich_retry_backoff: float = 5.0,
+                 enrich_deadline: float = 8.0, provider_timeout: float = 5.0,
+                 bulk_concurrency: int = 8, bulk_batch_size: int = 500, stream_batch_size: int = 100,
+                 search_index_batch_size: int = 500, lyrics_chain: Optional[LyricsChain] = None):
         """
         Initialize the service.
 
         Args:
             repository (SongRepository): Data access layer for songs.
             lyrics_provider (GeniusClient): External API client for lyrics and metadata.
-            cache (Optional[Any]): Optional caching backend (e.g. Redis).
+            cache (Optional[ProviderCache]): Provider response cache the providers are wrapped with, for stats.
+            song_cache (Optional[SongDocumentCache]): Read-through cache for `get_song`.
+            invalidation_bus (Optional[Any]): Broadcasts song invalidations to other workers.
+            search_engine (Optional[SearchEngine]): In-process BM25 index, kept in sync with writes.
+            suggest_index (Optional[SuggestIndex]): Title/artist typeahead index, kept in sync with writes.
+            jobs (Optional[JobRepository]): Enrichment job queue for asynchronous adds.
+            enrich_max_attempts (int): Attempts per enrichment job before it fails.
+            enrich_retry_backoff (float): Base delay in seconds between job attempts (doubles per attempt).
+            enrich_deadline (float): Overall budget in seconds for the provider fan-out.
+            provider_timeout (float): Budget in seconds for a single provider call.
+            bulk_concurrency (int): Max songs enriched at once during bulk import.
+            bulk_batch_size (int): Songs per `insert_many` batch during bulk import.
+            stream_batch_size (int): Mongo cursor batch size when streaming search results.
+            search_index_batch_size (int): Mongo cursor batch size when building the search index.
+            lyrics_chain (Optional[LyricsChain]): Lyrics sources raced for each add;
+                defaults to LRCLib synced > LRCLib plain.
         """
         self.repository = repository
         self.lyrics_provider = lyrics_provider
         self.lrclib_provider = lrclib_provider
+        self.lyrics_chain = lyrics_chain or LyricsChain(build_lyrics_sources(lrclib_provider))
         self.spotify_provider = spotify_provider
         self.cache = cache
+        self.song_cache = song_cache
+        self.invalidation_bus = invalidation_bus
+        self.search_engine = search_engine
+        self.suggest_index = suggest_index
+        self.jobs = jobs
+        self.enrich_max_attempts = enrich_max_attempts
+        self.enrich_retry_backoff = enrich_retry_backoff
+        self.enrich_deadline = enrich_deadline
+        self.provider_timeout = provider_timeout
+        self.bulk_concurrency = bulk_concurrency
+        self.bulk_batch_size = bulk_batch_size
+        self.stream_batch_size = stream_batch_size
+        self.search_index_batch_size = search_index_batch_size
+        self._inflight_adds = SingleFlight()
+        self._reindex_tasks = set()
+
+    async def _lookup(self, name: str, provider_call, title: str, artist: str, required: bool = False):
+        """
+        Run a single provider call under the per-provider timeout.
+
+        Optional providers never raise: a timeout or error is logged and
+        treated as "no data" so the rest of the enrichment can proceed.
+        """
+        try:
+            with span(f"provider.{name.lower()}"):
+                return await asyncio.wait_for(provider_call(title, artist), self.provider_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if required:
+                raise
+            logger.warning("Skipping %s for %r by %r: %r", name, title, artist, e)
+            return None
+
+    @staticmethod
+    def _cancel(tasks):
+        for task in tasks:
+            task.cancel()
+
+    async def _enrich(self, title: str, artist: str):
+        """
+        Query Genius, the lyrics chain and Spotify concurrently.
+
+        Genius is required: its result gates the whole add, so a miss or a
+        timeout fails fast and cancels the optional lookups. The lyrics chain
+        and Spotify get whatever is left of the overall deadline and are
+        dropped if they miss it.
+
+        Returns:
+            tuple: (genius_data, lyrics_data, spotify_data)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.enrich_deadline
+
+        genius_task = asyncio.create_task(self._lookup("Genius", self.lyrics_provider.search_song, title, artist, required=True))
+        optional = {
+            "lyrics": asyncio.create_task(self.lyrics_chain.fetch(
+                title, artist, max(0.0, self.enrich_deadline - LYRICS_DEADLINE_MARGIN), self._lookup)),
+            "spotify": asyncio.create_task(self._lookup("Spotify", self.spotify_provider.search_song, title, artist)),
+        }
+
+        try:
+            external_data = await asyncio.wait_for(genius_task, self.enrich_deadline)
+        except asyncio.TimeoutError:
+            self._cancel(optional.values())
+            raise HTTPException(
+                status_code=504,
+                detail=f"Song lookup for {title} by {artist} timed out"
+            )
+        except CircuitOpen:
+            self._cancel(optional.values())
+            raise HTTPException(
+                status_code=503,
+                detail="Song lookup is temporarily unavailable"
+            )
+        except (ProviderError, aiohttp.ClientError, ResponseTooLarge):
+            # Unreachable or misbehaving upstream (refused, DNS, 5xx, oversized body)
+            self._cancel(optional.values())
+            raise HTTPException(
+                status_code=502,
+                detail="Song lookup failed upstream"
+            )
+        except BaseException:
+            self._cancel(optional.values())
+            raise
+
+        if not external_data:
+            self._cancel(optional.values())
+            return None, None, None
+
+        remaining = max(0.0, deadline - loop.time())
+        done, pending = await asyncio.wait(optional.values(), timeout=remaining)
+        self._cancel(pending)
+
+        results = {
+            name: task.result() if task in done else None
+            for name, task in optional.items()
+        }
+        return external_data, results["lyrics"], results["spotify"]
+
+    @staticmethod
+    def _build_song_doc(song_create: dict, external_data: dict, lyrics_data: Optional[dict], spotify_data: Optional[dict]) -> dict:
+        """
+        Merge provider results into a song document.
+
+        Lyrics: the lyrics chain's answer (see `LyricsChain`), else Genius.
+        Synced lyrics are stored as plain line texts in `lyrics` plus
+        `synced_lyrics.offsets`, the start time in ms of each line. Metadata:
+        Genius first, Spotify only fills what is missing.
+        """
+        # Base document from Genius
+        song_doc = {
+            "title": song_create["title"],
+            "artist": song_create["artist"],
+            "release_date": external_data.get("release_date"),
+            "link": external_data.get("link"),
+            "lyrics": external_data.get("lyrics")  # Genius fallback
+        }
+
+        # Lyrics chain overwrite: best source that answered
+        if lyrics_data:
+            song_doc["lyrics"] = lyrics_data["lines"]
+            if lyrics_data.get("synced_lyrics"):
+                song_doc["synced_lyrics"] = lyrics_data["synced_lyrics"]
+            song_doc["lyrics_source"] = lyrics_data["source"]
+            if lyrics_data.get("musixmatch_id"):
+                song_doc["musixmatch_id"] = lyrics_data["musixmatch_id"]
+
+        # Spotify overwrite (metadata if missing)
+        if spotify_data:
+            if not song_doc.get("release_date") and spotify_data.get("release_date"):
+                song_doc["release_date"] = spotify_data["release_date"]
+            if not song_doc.get("link") and spotify_data.get("external_url"):
+                song_doc["link"] = spotify_data["external_url"]
+
+            song_doc["spotify_id"] = spotify_data.get("id")
+            song_doc["cover_art"] = spotify_data.get("cover_art")
+
+        return song_doc
 
     async def add_song(self, song_create: dict) -> Optional[dict]:
         """
         Add a new song.
 
         Workflow:
-        - Search song in database. If song is not found proceeds.
-        - Look up metadata (release date, link, lyrics) using Genius API.
-        - Add metadata with LRCLib if available.
+        - Coalesce with an identical add already in flight, if any.
+        - Look up Genius, the lyrics sources and Spotify concurrently within the deadline.
+        - Take metadata (release date, link, lyrics) from Genius API.
+        - Take lyrics from the best lyrics source that answered (LRCLib, Musixmatch).
         - Add metadata with Spotify if available.
-        - Save enriched song document to MongoDB.
+        - Save enriched song document to MongoDB; the unique index rejects duplicates.
         - Return the saved song with generated ID.
 
         Args:
@@ -51,18 +230,19 @@ class SongService:
         Raises:
             HTTPException(409): If the song already exists in the library returns error.
             HTTPException(404): If the song could not be found in Genius API.
+            HTTPException(504): If Genius did not answer within the deadline.
+            HTTPException(503): If Genius is failing and its circuit breaker is open.
+            HTTPException(502): If Genius answered with an error (5xx, 429, ...),
+                could not be reached, or sent an oversized response.
             HTTPException(500): If saving to the database fails.
         """
-        # 1. Check if already in DB
-        existing = await self.repository.search_song(song_create)
-        if existing:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Song already exists in library."
-            )
+        key = match_key(song_create["title"], song_create["artist"])
+        song_doc = await self._inflight_adds.do(key, lambda: self._add_song(song_create))
+        return dict(song_doc)
 
-        # 2. Fetch from Genius
-        external_data = await self.lyrics_provider.search_song(
+    async def _add_song(self, song_create: dict) -> dict:
+        # 1. Fetch from Genius, the lyrics chain and Spotify concurrently
+        external_data, lyrics_data, spotify_data = await self._enrich(
             song_create["title"], song_create["artist"]
         )
         if not external_data:
@@ -71,82 +251,520 @@ class SongService:
                 detail=f"Song {song_create['title']} by {song_create['artist']} not found"
             )
 
-        # 3. Build base document
-        song_doc = {
-            "title": song_create["title"],
-            "artist": song_create["artist"],
-            "release_date": external_data.get("release_date"),
-            "link": external_data.get("link"),
-            "lyrics": external_data.get("lyrics")  # Genius fallback
-        }
-
-        # 4. Try LRCLib overwrite
-        lrclib_data = await self.lrclib_provider.fetch_lyrics(
-            song_create["title"], song_create["artist"]
-        )
-        if lrclib_data:
-            # overwrite only if LRCLib returns something valid
-            synced = lrclib_data.get("syncedLyrics")
-            plain = lrclib_data.get("plainLyrics")
-
-            if synced:
-                parsed = synced.split('\n')
-                song_doc["lyrics"] = parsed
-            elif plain:
-                # store plain text line by line as fallback
-                song_doc["lyrics"] = plain.split('\n')
-
-        # 5. Try Spotify overwrite (metadata if missing)
-        spotify_data = await self.spotify_provider.search_song(
-            song_create["title"], song_create["artist"]
-        )
-        if spotify_data:
-            if not song_doc.get("release_date") and spotify_data.get("release_date"):
-                song_doc["release_date"] = spotify_data["release_date"]
-            if not song_doc.get("link") and spotify_data.get("external_url"):
-                song_doc["link"] = spotify_data["external_url"]
-
-            song_doc["spotify_id"] = spotify_data.get("id")
+        # 2. Build document: Genius base, lyrics chain answer, Spotify gaps
+        song_doc = self._build_song_doc(song_create, external_data, lyrics_data, spotify_data)
 
-        # 6. Save to Mongo
-        song_id = await self.repository.add_song(song_doc)
+        # 3. Save to Mongo. Duplicates are rejected by the unique index,
+        #    which saves a find_one round-trip on every successful add.
+        try:
+            song_id = await self.repository.add_song(song_doc)
+        except EntityAlreadyExists:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Song already exists in library."
+            )
         if not song_id:
             raise HTTPException(
                 status_code=500,
                 detail=f"Song cannot be saved in database."
             )
         song_doc["id"] = song_id
+        await self._invalidate(song_id, song_doc)
         return song_doc
 
+    async def add_song_async(self, song_create: dict) -> dict:
+        """
+        Accept a song now and enrich it in the background.
+
+        Workflow:
+        - Save a pending skeleton (title, artist, no metadata) to MongoDB.
+        - Queue an enrichment job picked up by the worker pool.
+        - Return the song and job IDs right away.
+
+        Args:
+            song_create (dict): Dictionary with `title` and `artist`.
+
+        Returns:
+            dict: `id` (song), `job_id` and `status`.
+
+        Raises:
+            HTTPException(409): If the song already exists in the library returns error.
+            HTTPException(503): If asynchronous enrichment is not configured.
+        """
+        if self.jobs is None:
+            raise HTTPException(
+                status_code=503,
+                detail="Asynchronous enrichment is not enabled."
+            )
+        skeleton = {
+            "title": song_create["title"],
+            "artist": song_create["artist"],
+            "release_date": None,
+            "link": None,
+            "lyrics": [],
+            "enrichment_status": "pending",
+        }
+        try:
+            song_id = await self.repository.add_song(skeleton)
+        except EntityAlreadyExists:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Song already exists in library."
+            )
+        await self._invalidate(song_id, skeleton)
+        job_id = await self.jobs.create_job(song_id, song_create["title"], song_create["artist"], self.enrich_max_attempts)
+        return {"id": song_id, "job_id": job_id, "status": "pending"}
+
+    async def run_enrichment_job(self, job: dict):
+        """
+        Enrich the skeleton song of a claimed job and patch it in place.
+
+        Transient failures (timeouts, provider or DB errors) are retried with
+        exponential backoff up to the job's `max_attempts`. When the song is
+        not found, or attempts run out, the job fails and the skeleton is
+        removed so the song can be added again.
+        """
+        song_id = job["song_id"]
+        try:
+            external_data, lyrics_data, spotify_data = await self._enrich(job["title"], job["artist"])
+            if not external_data:
+                await self._abandon_enrichment(job, f"Song {job['title']} by {job['artist']} not found")
+                return
+            song_doc = self._build_song_doc(job, external_data, lyrics_data, spotify_data)
+            song_doc["enrichment_status"] = "done"
+            if not await self.repository.update_song(song_id, song_doc):
+                await self.jobs.fail_job(job["_id"], "Song was deleted before enrichment finished")
+                return
+        except Exception as e:
+            error = e.detail if isinstance(e, HTTPException) else repr(e)
+            if job["attempts"] >= job["max_attempts"]:
+                await self._abandon_enrichment(job, error)
+            else:
+                retry_in = self.enrich_retry_backoff * 2 ** (job["attempts"] - 1)
+                await self.jobs.fail_job(job["_id"], error, retry_in=retry_in)
+            return
+
+        await self.jobs.complete_job(job["_id"])
+        await self._invalidate(song_id, song_doc)
+
+    async def _abandon_enrichment(self, job: dict, error: str):
+        await self.jobs.fail_job(job["_id"], error)
+        await self.repository.delete_song(job["song_id"])
+        await self._invalidate(job["song_id"])
+
+    async def get_job(self, job_id: str) -> dict:
+        """
+        Retrieve an enrichment job.
+
+        Returns:
+            dict: Job with `status` (pending, running, done, failed),
+            `attempts` and the last `error`.
+
+        Raises:
+            HTTPException(404): If no job is found with the given ID.
+        """
+        job = await self.jobs.get_job(job_id) if self.jobs is not None else None
+        if not job:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Job with {job_id=} not found"
+            )
+        return job
+
+    async def import_songs(self, records: AsyncIterator[Tuple[int, Union[dict, str]]]) -> AsyncIterator[dict]:
+        """
+        Bulk-import songs from a stream of `(line, record)` pairs.
+
+        Workflow, per batch of `bulk_batch_size` records:
+        - Validate records and drop duplicates already in DB (one query per batch).
+        - Enrich the rest concurrently, at most `bulk_concurrency` at a time.
+        - Save the batch with one unordered `insert_many`.
+        - Yield one result per line, in input order.
+
+        Only one batch is held in memory at a time.
+
+        Args:
+            records: Async iterator of `(line_number, dict | error message)`.
+
+        Yields:
+            dict: `{"line", "status", ...}` with status one of
+            `inserted`, `duplicate`, `not_found`, `error`.
+        """
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+        batch = []
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= self.bulk_batch_size:
+                for result in await self._import_batch(batch, semaphore):
+                    yield result
+                batch = []
+        if batch:
+            for result in await self._import_batch(batch, semaphore):
+                yield result
+
+    async def _import_batch(self, batch: list, semaphore: asyncio.Semaphore) -> List[dict]:
+        results = {}
+        candidates = []
+        seen = set()
+        for line, record in batch:
+            if isinstance(record, str):
+                results[line] = {"line": line, "status": "error", "detail": record}
+                continue
+            title, artist = record.get("title"), record.get("artist")
+            if not isinstance(title, str) or not isinstance(artist, str) or not title or not artist:
+                results[line] = {"line": line, "status": "error", "detail": "`title` and `artist` are required strings"}
+                continue
+            key = match_key(title, artist)
+            if key in seen:
+                results[line] = {"line": line, "title": title, "artist": artist, "status": "duplicate"}
+                continue
+            seen.add(key)
+            candidates.append((line, {"title": title, "artist": artist}))
+
+        existing = await self.repository.find_existing([song for _, song in candidates])
+
+        async def enrich(line: int, song: dict):
+            async with semaphore:
+                try:
+                    external_data, lyrics_data, spotify_data = await self._enrich(song["title"], song["artist"])
+                except HTTPException as e:
+                    return line, song, e.detail
+                except Exception as e:
+                    return line, song, repr(e)
+            if not external_data:
+                return line, song, None
+            return line, song, self._build_song_doc(song, external_data, lyrics_data, spotify_data)
+
+        pending = []
+        for line, song in candidates:
+            if match_key(song["title"], song["artist"]) in existing:
+                results[line] = {"line": line, **song, "status": "duplicate"}
+            else:
+                pending.append(enrich(line, song))
+
+        to_insert = []
+        for line, song, outcome in await asyncio.gather(*pending):
+            if outcome is None:
+                results[line] = {"line": line, **song, "status": "not_found"}
+            elif isinstance(outcome, str):
+                results[line] = {"line": line, **song, "status": "error", "detail": outcome}
+            else:
+                to_insert.append((line, song, outcome))
+
+        inserted = await self.repository.add_songs([doc for _, _, doc in to_insert])
+        docs = {}
+        for (line, song, doc), outcome in zip(to_insert, inserted):
+            results[line] = {"line": line, **song, **outcome}
+            if outcome["status"] == "inserted":
+                docs[outcome["id"]] = doc
+        await self._invalidate_many(list(docs), docs)
+
+        return [results[line] for line in sorted(results)]
+
+    async def refresh_spotify_metadata(self, stale_after_days: float = 30, batch_size: int = 500,
+                                       retry_missing_after_days: float = 1) -> dict:
+        """
+        Refresh Spotify metadata of songs that miss it or whose copy is stale.
+        Songs still missing fields after a refresh are retried once
+        `retry_missing_after_days` have passed.
+
+        Workflow, per batch of `batch_size` songs:
+        - Songs with a stored `spotify_id` are looked up with multi-ID track
+          requests (up to the API's batch limit per request).
+        - Songs without one fall back to a title/artist search, with at most
+          `bulk_concurrency` searches in flight.
+        - Missing release date/link are filled, cover art and `spotify_id`
+          updated, and the batch saved with one `bulk_write`.
+        - `spotify_refreshed_at` is only set for completed lookups (a track
+          came back, or the request succeeded without one); songs whose
+          lookup failed are left as they were and picked up next run.
+
+        Returns:
+            dict: Counters `scanned`, `updated`, `track_requests`, `searches`, `errors`.
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(days=stale_after_days)
+        retry_before = now - timedelta(days=retry_missing_after_days)
+        counts = {"scanned": 0, "updated": 0, "track_requests": 0, "searches": 0, "errors": 0}
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+
+        async def search(song: dict):
+            async with semaphore:
+                try:
+                    return song, await self.spotify_provider.search_song(song["title"], song["artist"])
+                except Exception as e:
+                    logger.warning("Spotify search failed for %r by %r: %r", song["title"], song["artist"], e)
+                    counts["errors"] += 1
+                    return None
+
+        async def refresh(batch: List[dict]):
+            with_id = [song for song in batch if song.get("spotify_id")]
+            without_id = [song for song in batch if not song.get("spotify_id")]
+
+            found = []
+            if with_id:
+                ids = [song["spotify_id"] for song in with_id]
+                counts["track_requests"] += -(-len(ids) // self.spotify_provider.TRACKS_BATCH_LIMIT)
+                try:
+                    tracks = await self.spotify_provider.get_tracks(ids)
+                except Exception as e:
+                    logger.warning("Spotify track lookup failed: %r", e)
+                    counts["errors"] += 1
+                else:
+                    found.extend((song, tracks.get(song["spotify_id"])) for song in with_id)
+            counts["searches"] += len(without_id)
+            found.extend(result for result in await asyncio.gather(*(search(song) for song in without_id)) if result)
+
+            refreshed_at = datetime.now(timezone.utc)
+            updates = []
+            for song, data in found:
+                fields = {"spotify_refreshed_at": refreshed_at}
+                if data:
+                    if not song.get("release_date") and data.get("release_date"):
+                        fields["release_date"] = data["release_date"]
+                    if not song.get("link") and data.get("external_url"):
+                        fields["link"] = data["external_url"]
+                    fields["cover_art"] = data.get("cover_art")
+                    fields["spotify_id"] = data.get("id")
+                updates.append((song["_id"], fields))
+            counts["updated"] += await self.repository.set_many(updates)
+            await self._invalidate_many([str(song_id) for song_id, _ in updates], reindex=False)
+
+        batch = []
+        async for song in self.repository.iter_songs_needing_refresh(stale_before, retry_before, batch_size):
+            counts["scanned"] += 1
+            batch.append(song)
+            if len(batch) >= batch_size:
+                await refresh(batch)
+                batch = []
+        if batch:
+            await refresh(batch)
+        return counts
+
     async def get_song(self, song_id: str, page: int, size: int) -> Optional[dict]:
         """
-        Retrieve a song by ID.
+        Retrieve a song by ID with one page of lyrics.
 
         Args:
             song_id (str): MongoDB ObjectId of the song.
+            page (int): 1-based page number.
+            size (int): Lyric lines per page.
 
         Returns:
-            dict: Song document with metadata and lyrics.
+            dict: Song document with metadata, the requested lyrics page,
+            and `total`/`pages` lyric counts.
 
         Raises:
             HTTPException(404): If no song is found with the given ID.
         """
-        song = await self.repository.get_song(song_id)
+        song = await self._read_song(song_id, page, size)
         if not song:
             raise HTTPException(
                 status_code=404,
                 detail=f"Song with {song_id=} not found"
             )
-        lyrics = song.get("lyrics", [])
-        total = len(lyrics)
-
-        # calculate pagination
-        start = (page - 1) * size
-        end = start + size
-        items = lyrics[start:min(end, total)]
-        song["lyrics"] = items
+        total = song.pop("lyrics_total", 0)
+        song["total"] = total
+        song["pages"] = -(-total // size)
         return song
 
+    async def _cached_song(self, song_id: str):
+        """
+        Hot-song cache lookup. On a miss, a song that has been read often
+        enough is loaded in full once and admitted; otherwise returns None
+        and the caller reads just what it needs from Mongo.
+        """
+        if self.song_cache is None:
+            return None
+        entry = self.song_cache.get(song_id)
+        if entry is None and self.song_cache.should_admit(song_id):
+            generation = self.song_cache.generation
+            doc = await self.repository.get_song(song_id)
+            if doc:
+                entry = self.song_cache.put(song_id, doc, generation)
+        return entry
+
+    async def _read_song(self, song_id: str, page: int, size: int) -> Optional[dict]:
+        """Read one lyrics page, through the hot-song cache when enabled."""
+        entry = await self._cached_song(song_id)
+        if entry is not None:
+            return entry.page(page, size)
+        return await self.repository.get_song(song_id, page, size)
+
+    async def get_synced_lyrics(self, song_id: str, t: Optional[int] = None,
+                                start: Optional[int] = None, end: Optional[int] = None) -> dict:
+        """
+        Return the synced lyrics line active at `t` ms, or every line active
+        within `[start, end]` ms, using binary search over the line offsets.
+
+        Args:
+            song_id (str): MongoDB ObjectId of the song.
+            t (int): Playback position in ms.
+            start (int): Window start in ms (used when `t` is not given).
+            end (int): Window end in ms.
+
+        Returns:
+            dict: `id`, `lines` (each `time_ms`, `text`) and `next_ms`, the
+            start of the following line so players know when to poll next.
+
+        Raises:
+            HTTPException(404): If the song does not exist or has no synced lyrics.
+        """
+        entry = await self._cached_song(song_id)
+        if entry is not None:
+            offsets = entry.synced_offsets
+            get_lines = entry.lines
+        else:
+            doc = await self.repository.get_synced_lyrics(song_id)
+            if not doc:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Song with {song_id=} not found"
+                )
+            offsets = (doc.get("synced_lyrics") or {}).get("offsets")
+            lyrics = doc.get("lyrics") or []
+            get_lines = lambda lo, count: lyrics[lo:lo + count]
+
+        if not offsets:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Song with {song_id=} has no synced lyrics"
+            )
+
+        if t is not None:
+            i = line_at(offsets, t)
+            lo, hi = (i, i + 1) if i >= 0 else (0, 0)
+            position = t
+        else:
+            lo, hi = lines_between(offsets, start, end)
+            position = end
+        texts = get_lines(lo, hi - lo)
+        return {
+            "id": song_id,
+            "lines": [{"time_ms": offsets[lo + k], "text": text} for k, text in enumerate(texts)],
+            "next_ms": next_start(offsets, position),
+        }
+
+    async def backfill_synced_lyrics(self, batch_size: int = 500) -> int:
+        """
+        Parse raw LRC lyrics stored before synced lyrics were parsed at ingest.
+
+        Returns:
+            int: Number of songs converted.
+        """
+        converted = 0
+        batch = []
+        async for doc in self.repository.iter_unparsed_synced_lyrics(batch_size):
+            parsed = parse_lrc("\n".join(line or "" for line in doc["lyrics"]))
+            batch.append((doc["_id"], {
+                "lyrics": parsed["lines"],
+                "synced_lyrics": {"offsets": parsed["offsets"], "tags": parsed["tags"]},
+            }))
+            if len(batch) >= batch_size:
+                converted += await self.repository.set_many(batch)
+                batch = []
+        converted += await self.repository.set_many(batch)
+        return converted
+
+    def _indexes(self) -> list:
+        return [index for index in (self.search_engine, self.suggest_index) if index is not None]
+
+    async def build_search_index(self) -> int:
+        """
+        Fill the in-process search and suggest indexes from one streamed scan
+        of the collection. Writes made meanwhile are indexed as they happen;
+        the indexes serve queries once the scan is done.
+
+        Returns:
+            int: Number of songs indexed.
+        """
+        count = 0
+        # The suggest index is sorted once at the end instead of per song
+        suggestions = []
+        try:
+            async for doc in self.repository.iter_search_corpus(self.search_index_batch_size):
+                song_id = str(doc["_id"])
+                if self.search_engine is not None:
+                    self.search_engine.upsert(song_id, doc.get("title"), doc.get("artist"), doc.get("lyrics"))
+                if self.suggest_index is not None:
+                    suggestions.append((song_id, doc.get("title"), doc.get("artist")))
+                count += 1
+        except Exception:
+            logger.exception("Building the search indexes failed")
+            raise
+        if self.suggest_index is not None:
+            self.suggest_index.build(suggestions)
+        for index in self._indexes():
+            index.ready = True
+        logger.info("Search indexes built: %d songs", count)
+        return count
+
+    def _index_song(self, song_id: str, doc: dict):
+        if self.search_engine is not None:
+            self.search_engine.upsert(song_id, doc.get("title"), doc.get("artist"), doc.get("lyrics"))
+        if self.suggest_index is not None:
+            self.suggest_index.upsert(song_id, doc.get("title"), doc.get("artist"))
+
+    async def _reindex(self, song_id: str, doc: Optional[dict] = None):
+        """Bring the search index entries of a song up to date (`doc` saves the read)."""
+        await self._reindex_many([song_id], {song_id: doc} if doc is not None else None)
+
+    async def _reindex_many(self, song_ids: List[str], docs: Optional[dict] = None):
+        """
+        Bring the search index entries of songs up to date. `docs` (by ID)
+        saves the read, a None doc marking a deleted song; the others are
+        fetched with one query, and songs that no longer exist are dropped
+        from the indexes.
+        """
+        if not self._indexes() or not song_ids:
+            return
+        docs = dict(docs or {})
+        missing = [song_id for song_id in song_ids if song_id not in docs]
+        if missing:
+            docs.update(await self.repository.get_search_fields_many(missing))
+        for song_id in song_ids:
+            doc = docs.get(song_id)
+            if doc:
+                self._index_song(song_id, doc)
+            else:
+                for index in self._indexes():
+                    index.remove(song_id)
+
+    def handle_remote_invalidation(self, song_ids: List[str], reindex: bool = True):
+        """
+        Invalidation broadcast by another worker: drop the cached copies and,
+        unless the search fields did not change, reindex the songs.
+        """
+        if self.song_cache is not None:
+            for song_id in song_ids:
+                self.song_cache.invalidate(song_id)
+        if reindex and self._indexes():
+            task = asyncio.create_task(self._reindex_many(song_ids))
+            self._reindex_tasks.add(task)
+            task.add_done_callback(self._reindex_tasks.discard)
+
+    async def _invalidate(self, song_id: str, doc: Optional[dict] = None, reindex: bool = True):
+        await self._invalidate_many([song_id], {song_id: doc} if doc is not None else None, reindex=reindex)
+
+    async def _invalidate_many(self, song_ids: List[str], docs: Optional[dict] = None, reindex: bool = True):
+        """
+        Drop cached copies, reindex (`docs` by ID saves reads) and tell the
+        other workers with a single broadcast. `reindex=False` when only
+        fields outside the search indexes changed.
+        """
+        if not song_ids:
+            return
+        if self.song_cache is not None:
+            for song_id in song_ids:
+                self.song_cache.invalidate(song_id)
+        if reindex:
+            await self._reindex_many(song_ids, docs)
+        if self.invalidation_bus is not None:
+            try:
+                await self.invalidation_bus.publish_many(song_ids, reindex=reindex)
+            except Exception as e:
+                logger.warning("Could not broadcast invalidation of %d songs: %r", len(song_ids), e)
+
     async def delete_song(self, song_id: str) -> Optional[str]:
         """
         Delete a song by ID.
@@ -155,7 +773,7 @@ class SongService:
             song_id (str): MongoDB ObjectId of the song.
 
         Returns:
-            dict: Deleted song document.
+            msg: outcome of delete.
 
         Raises:
             HTTPException(404): If the song does not exist.
@@ -166,41 +784,225 @@ class SongService:
                 status_code=404,
                 detail=f"Song with {song_id=} not found"
             )
+        await self._invalidate_many([song_id], {song_id: None})
         return f"Song with {song_id=} deleted successfully"
 
-    async def update_song(self, song_id: str, data: dict) -> Optional[str]:
+    async def update_song(self, song_id: str, data: dict, return_song: bool = False) -> Union[str, dict]:
         """
         Partially update a song.
 
         Args:
             song_id (str): MongoDB ObjectId of the song.
             data (dict): Fields to update (title, artist, release_date, etc.).
+            return_song (bool): Return the updated song (without lyrics)
+                instead of a message.
 
         Returns:
-            msg: outcome of update.
+            msg: outcome of update, or the updated song as a `SongReturn` dict.
 
         Raises:
             HTTPException(404): If the song does not exist.
+            HTTPException(409): If the new title/artist match another song.
         """
-        success = await self.repository.update_song(song_id, data)
-        if not success:
+        # New lyrics text no longer matches the stored line timings
+        unset = ["synced_lyrics"] if "lyrics" in data else None
+        try:
+            result = await self.repository.update_song(song_id, data, unset=unset,
+                                                       projection=SEARCH_PROJECTION if return_song else None)
+        except EntityAlreadyExists:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Song already exists in library."
+            )
+        if not result:
             raise HTTPException(
                 status_code=404,
                 detail=f"Song with {song_id=} not found"
             )
+        await self._invalidate(song_id)
+        if return_song:
+            return self._search_row(result)
         return f"Song with {song_id=} updated successfully"
 
-    async def search_songs(self, query: dict) -> List[SongReturn]:
+    async def bulk_update_songs(self, patches: List[dict], ordered: bool = False) -> List[dict]:
+        """
+        Apply many partial updates with one `bulk_write`. The updated songs
+        are then reindexed from one `$in` read and broadcast to the other
+        workers in one message.
+
+        Args:
+            patches (List[dict]): `id` plus the fields to update, per song.
+            ordered (bool): Stop at the first failed update.
+
+        Returns:
+            List[dict]: `id` and `status` (`updated`, `not_found`, `duplicate`,
+            `skipped` or `error` with `detail`) per patch, in order.
+        """
+        items = []
+        for patch in patches:
+            data = dict(patch)
+            song_id = data.pop("id")
+            items.append((song_id, data, ["synced_lyrics"] if "lyrics" in data else None))
+        results = await self.repository.bulk_update_songs(items, ordered=ordered)
+        await self._invalidate_many([r["id"] for r in results if r["status"] == "updated"])
+        return results
+
+    async def bulk_delete_songs(self, song_ids: List[str], ordered: bool = False) -> List[dict]:
+        """
+        Delete many songs with one `bulk_write`. They are dropped from the
+        indexes without a read and broadcast to the other workers in one
+        message.
+
+        Returns:
+            List[dict]: `id` and `status` (`deleted`, `not_found`, `skipped`
+            or `error` with `detail`) per ID, in order.
+        """
+        results = await self.repository.bulk_delete_songs(song_ids, ordered=ordered)
+        deleted = [r["id"] for r in results if r["status"] == "deleted"]
+        # A None doc means "gone": nothing to read back
+        await self._invalidate_many(deleted, dict.fromkeys(deleted))
+        return results
+
+    def suggest_songs(self, prefix: str, k: int = 10) -> List[dict]:
+        """
+        Typeahead suggestions over song titles and artists.
+
+        Args:
+            prefix (str): What the user has typed so far.
+            k (int): Max suggestions.
+
+        Returns:
+            List[dict]: `id`, `title`, `artist` and `match` (`prefix` or `fuzzy`).
+
+        Raises:
+            HTTPException(503): If the suggest index is disabled or still building.
+        """
+        if self.suggest_index is None or not self.suggest_index.ready:
+            raise HTTPException(
+                status_code=503,
+                detail="Suggestions are not available yet."
+            )
+        return self.suggest_index.suggest(prefix, k)
+
+    @staticmethod
+    def _search_position(query: dict) -> Optional[dict]:
+        try:
+            after = decode_cursor(query.get("cursor"))
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if after is None:
+            return None
+        if not ObjectId.is_valid(after["id"]):
+            raise HTTPException(status_code=400, detail="Invalid cursor: bad id")
+        if query.get("keywords") and not isinstance(after.get("score"), (int, float)):
+            raise HTTPException(status_code=400, detail="Cursor does not belong to a keyword search")
+        return after
+
+    @staticmethod
+    def _search_row(doc: dict) -> dict:
+        """
+        Shape a projected search hit as a `SongReturn` dict. Built directly:
+        the route serializes it as is, without a second model pass.
+        """
+        row = {
+            "id": str(doc["_id"]),
+            "title": doc.get("title"),
+            "artist": doc.get("artist"),
+            "release_date": doc.get("release_date"),
+            "link": doc.get("link"),
+        }
+        if "matched_lines" in doc:
+            row["matched_lines"] = doc["matched_lines"]
+        return row
+
+    async def search_songs(self, query: dict) -> Tuple[List[dict], Optional[str]]:
         """
-        Search for songs.
+        Search for songs, one keyset page at a time.
 
         Supports filtering by artist, release date, keywords, or link.
 
         Args:
-            query (dict): Search parameters (subset of `SongSearch`).
+            query (dict): Search parameters (subset of `SongSearch`), including
+                optional `limit` and `cursor` from a previous page.
 
         Returns:
-            List[SongRead]: List of matching songs (possibly empty).
+            tuple: (List[dict] of `SongReturn` fields, next cursor or None when this is the last page).
+
+        Raises:
+            HTTPException(400): If the cursor is malformed.
+        """
+        limit = query.get("limit") or 100
+        after = self._search_position(query)
+        if self._use_search_engine(query):
+            docs = []
+            async for doc in self._iter_ranked_songs(query, after):
+                docs.append(doc)
+                if len(docs) > limit:
+                    break
+        else:
+            docs = await self.repository.search_songs(query, limit=limit + 1, after=after)
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return [self._search_row(doc) for doc in docs[:limit]], next_cursor
+
+    def stream_songs(self, query: dict) -> AsyncIterator[dict]:
+        """
+        Stream matching songs as the Mongo cursor yields batches.
+
+        Nothing beyond the current batch is held in memory. `limit` is
+        optional here; without it every match is streamed. The cursor is
+        validated before streaming starts, so errors still map to a status code.
+
+        Returns:
+            AsyncIterator[dict]: `SongRead` fields of each matching song.
+
+        Raises:
+            HTTPException(400): If the cursor is malformed.
+        """
+        after = self._search_position(query)
+        limit = query.get("limit")
+        if self._use_search_engine(query):
+            cursor = self._iter_ranked_songs(query, after)
+        else:
+            cursor = self.repository.iter_search_songs(query, limit=limit, after=after, batch_size=self.stream_batch_size)
+
+        async def songs():
+            count = 0
+            async for doc in cursor:
+                yield self._search_row(doc)
+                count += 1
+                if limit and count >= limit:
+                    break
+
+        return songs()
+
+    def _use_search_engine(self, query: dict) -> bool:
+        if query.get("engine") != "bm25" or not query.get("keywords"):
+            return False
+        if self.search_engine is None or not self.search_engine.ready:
+            logger.info("Search index unavailable, falling back to Mongo text search")
+            return False
+        return True
+
+    async def _iter_ranked_songs(self, query: dict, after: Optional[dict]) -> AsyncIterator[dict]:
+        """
+        Songs ranked by the in-process BM25 engine, in `(score desc, id)` order.
+
+        Hits are resolved in chunks with one `$in` query each, which also
+        applies the non-keyword filters; filtered-out hits are skipped.
         """
-        docs = await self.repository.search_songs(query)
-        return [SongReturn(**doc) for doc in docs]
+        text = " ".join(query["keywords"])
+        chunk = self.stream_batch_size
+        while True:
+            hits = self.search_engine.search(text, limit=chunk, after=after)
+            if not hits:
+                return
+            songs = await self.repository.get_songs_by_ids([hit["id"] for hit in hits], query)
+            for hit in hits:
+                song = songs.get(hit["id"])
+                if song is not None:
+                    song["score"] = hit["score"]
+                    song["matched_lines"] = hit["lines"]
+                    yield song
+            if len(hits) < chunk:
+                return
+            after = hits[-1]
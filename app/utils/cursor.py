@@ -0,0 +1,31 @@
+import base64
+import json
+from typing import Optional
+
+
+class InvalidCursor(ValueError):
+    """Raised when a continuation token cannot be decoded."""
+
+
+def encode_cursor(doc: dict) -> str:
+    """
+    Build an opaque continuation token from the last document of a page:
+    its `_id`, plus its text score when the results are ranked.
+    """
+    position = {"id": str(doc["_id"])}
+    if "score" in doc:
+        position["score"] = doc["score"]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[dict]:
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(position, dict) or not isinstance(position.get("id"), str):
+            raise ValueError("missing id")
+        return position
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {e}") from e
@@ -0,0 +1,78 @@
+import re
+from bisect import bisect_right
+from typing import Sequence, Tuple
+
+TIMESTAMP = re.compile(r"\[(\d+):(\d{1,2})(?:[.:](\d{1,3}))?\]")
+METADATA_TAG = re.compile(r"^\[([a-zA-Z#]+):([^\]]*)\]\s*$")
+
+
+def _to_ms(minutes: str, seconds: str, fraction: str) -> int:
+    ms = int(fraction.ljust(3, "0")) if fraction else 0
+    return (int(minutes) * 60 + int(seconds)) * 1000 + ms
+
+
+def parse_lrc(text: str) -> dict:
+    """
+    Parse LRC ("[mm:ss.xx] text") into parallel arrays sorted by time.
+
+    Lines with several timestamps ("[00:12.00][01:30.00] chorus") produce one
+    entry per timestamp; metadata tags ("[ar:Alex G]") are kept in `tags`,
+    and an `offset` tag is applied to all times (positive values make the
+    lyrics appear sooner, per the LRC convention).
+
+    Returns:
+        dict: `{"offsets": [ms, ...], "lines": [text, ...], "tags": {...}}`
+    """
+    tags = {}
+    entries = []
+    for raw in text.splitlines():
+        raw = raw.strip()
+        if not raw:
+            continue
+        stamps = []
+        pos = 0
+        while True:
+            match = TIMESTAMP.match(raw, pos)
+            if not match:
+                break
+            stamps.append(_to_ms(*match.groups()))
+            pos = match.end()
+        if stamps:
+            line = raw[pos:].strip()
+            entries.extend((ms, line) for ms in stamps)
+            continue
+        tag = METADATA_TAG.match(raw)
+        if tag:
+            tags[tag.group(1).lower()] = tag.group(2).strip()
+
+    try:
+        shift = int(tags.get("offset", 0))
+    except ValueError:
+        shift = 0
+    entries.sort(key=lambda entry: entry[0])
+    return {
+        "offsets": [max(0, ms - shift) for ms, _ in entries],
+        "lines": [line for _, line in entries],
+        "tags": tags,
+    }
+
+
+def line_at(offsets: Sequence[int], t: int) -> int:
+    """Index of the line active at `t` ms, or -1 before the first line."""
+    return bisect_right(offsets, t) - 1
+
+
+def lines_between(offsets: Sequence[int], start: int, end: int) -> Tuple[int, int]:
+    """
+    Index range `[lo, hi)` of lines active at any point in `[start, end]` ms,
+    including the line already playing at `start`.
+    """
+    lo = max(0, line_at(offsets, start))
+    hi = bisect_right(offsets, end)
+    return lo, max(lo, hi)
+
+
+def next_start(offsets: Sequence[int], t: int):
+    """Start time of the first line after `t` ms, or None at the end."""
+    i = bisect_right(offsets, t)
+    return offsets[i] if i < len(offsets) else None
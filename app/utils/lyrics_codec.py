@@ -0,0 +1,109 @@
+"""
+Compressed lyrics storage.
+
+A song's lyrics are stored as one zlib stream of the concatenated UTF-8
+lines plus a packed array of line boundaries, instead of one BSON string
+per line:
+
+    {"codec": "zlib", "count": n, "data": <bytes>, "offsets": <bytes>}
+
+`offsets` holds n + 1 little-endian uint32 byte offsets into the
+uncompressed text. A page of lines only needs the stream decompressed up
+to its last byte, and only its own lines decoded.
+"""
+import sys
+import zlib
+from array import array
+from typing import List, Optional
+
+CODEC = "zlib"
+
+
+def _pack_offsets(offsets: array) -> bytes:
+    if sys.byteorder == "big":
+        offsets = array("I", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _unpack_offsets(data: bytes) -> array:
+    offsets = array("I")
+    offsets.frombytes(data)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return offsets
+
+
+def pack_lyrics(lines: Optional[List[Optional[str]]], level: int = 6) -> dict:
+    offsets = array("I", [0])
+    chunks = []
+    for line in lines or []:
+        encoded = (line or "").encode("utf-8")
+        chunks.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+    return {
+        "codec": CODEC,
+        "count": len(chunks),
+        "data": zlib.compress(b"".join(chunks), level),
+        "offsets": _pack_offsets(offsets),
+    }
+
+
+class PackedLyrics:
+    """
+    Read-only, list-like view of packed lyrics.
+
+    Slicing decompresses the stream only as far as the requested lines
+    reach (the decompressed prefix is kept for later slices) and decodes
+    just those lines.
+    """
+
+    __slots__ = ("_data", "_offsets", "_text", "_inflater")
+
+    def __init__(self, packed: dict):
+        if packed.get("codec") != CODEC:
+            raise ValueError(f"Unsupported lyrics codec: {packed.get('codec')!r}")
+        self._data = bytes(packed["data"])
+        self._offsets = _unpack_offsets(bytes(packed["offsets"]))
+        self._text = b""
+        self._inflater = None
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def _text_until(self, end: int) -> bytes:
+        if len(self._text) < end:
+            if self._inflater is None:
+                self._inflater = zlib.decompressobj()
+                self._text = self._inflater.decompress(self._data, end)
+            else:
+                self._text += self._inflater.decompress(self._inflater.unconsumed_tail, end - len(self._text))
+        return self._text
+
+    def lines(self, start: int, count: int) -> List[str]:
+        start = max(0, start)
+        stop = min(len(self), start + max(0, count))
+        if start >= stop:
+            return []
+        offsets = self._offsets
+        text = self._text_until(offsets[stop])
+        return [text[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(start, stop)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.lines(0, len(self))[index]
+            return self.lines(start, stop - start)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("lyrics line out of range")
+        return self.lines(index, 1)[0]
+
+    def __iter__(self):
+        return iter(self.lines(0, len(self)))
+
+
+def unpack_lyrics(packed: dict) -> List[str]:
+    return PackedLyrics(packed).lines(0, packed["count"])
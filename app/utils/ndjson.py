@@ -0,0 +1,44 @@
+import json
+import orjson
+from typing import AsyncIterator, Iterable, Tuple, Union
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    """
+    Incrementally parse newline-delimited JSON from a stream of byte chunks.
+
+    Only the current partial line is buffered, so memory stays flat no matter
+    how large the input is. Yields `(line_number, record)` for each non-blank
+    line, where `record` is the decoded object or an error message string.
+    """
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, _decode(line)
+    if buffer.strip():
+        yield line_no + 1, _decode(buffer)
+
+
+async def iter_file_chunks(lines: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a binary file object (or any iterable of bytes) to `iter_ndjson`."""
+    for line in lines:
+        yield line
+
+
+def _decode(line: bytes) -> Union[dict, str]:
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return f"Invalid JSON: {e}"
+    if not isinstance(record, dict):
+        return "Expected a JSON object"
+    return record
+
+
+def dumps_line(obj: dict) -> bytes:
+    return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
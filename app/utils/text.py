@@ -0,0 +1,38 @@
+import re
+import unicodedata
+
+
+def normalize(s: str) -> str:
+    """Lowercase and keep only alphanumerics, for loose title/artist matching."""
+    return "".join(ch.lower() for ch in s if ch.isalnum())
+
+
+# A bracketed "(feat. X)" / "[ft. X]" suffix (possibly before other bracketed
+# tags, "(feat. X) [Live]"), or a trailing " feat. X" / " ft. X" / " featuring X".
+# Bare "ft"/"feat" words inside a title ("Left ft Behind") are kept.
+_FEATURING = re.compile(
+    r"\s*[(\[]\s*(?:feat|ft|featuring)\b\.?[^)\]]*[)\]](?=(?:\s*[(\[][^)\]]*[)\]])*\s*$)"
+    r"|\s(?:feat\.|ft\.|featuring\s).*$"
+)
+
+
+def fold(s: str) -> str:
+    """Unicode-fold for matching: compatibility forms, accents and case."""
+    decomposed = unicodedata.normalize("NFKD", s)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _match_part(s: str) -> str:
+    folded = _FEATURING.sub("", fold(s))
+    key = "".join(ch for ch in folded if ch.isalnum())
+    # All-punctuation names ("!!!") keep their folded text
+    return key or " ".join(folded.split())
+
+
+def match_key(title: str, artist: str) -> str:
+    """
+    Normalized identity of a song, stored as `match_key` and unique: "Alex G"
+    and "alex g", "Beyoncé" and "Beyonce", or a title with and without
+    "(feat. X)" are the same song.
+    """
+    return f"{_match_part(title)}|{_match_part(artist)}"
@@ -0,0 +1,70 @@
+"""
+Compare two benchmark result files and flag regressions.
+
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.15]
+
+A scenario regresses when its req/s drops, or its p95/p99 latency or
+error count grows, by more than `threshold` relative to the baseline.
+"""
+import argparse
+import json
+import sys
+from typing import List, Tuple
+
+# metric -> True when higher is better
+METRICS = {"rps": True, "p95_ms": False, "p99_ms": False}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.15) -> List[Tuple[str, str, float, float]]:
+    """Return `(scenario, metric, baseline, current)` for every regression."""
+    regressions = []
+    for scenario, before in baseline.get("results", {}).items():
+        after = current.get("results", {}).get(scenario)
+        if after is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = before.get(metric), after.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (change < -threshold) if higher_is_better else (change > threshold):
+                regressions.append((scenario, metric, old, new))
+        if after.get("errors", 0) > before.get("errors", 0) * (1 + threshold):
+            regressions.append((scenario, "errors", before.get("errors", 0), after["errors"]))
+    return regressions
+
+
+def print_report(baseline: dict, current: dict, regressions, file=sys.stdout):
+    flagged = {(scenario, metric) for scenario, metric, _, _ in regressions}
+    print(f"{'scenario':<16}{'metric':<8}{'baseline':>12}{'current':>12}{'change':>9}", file=file)
+    for scenario, before in baseline.get("results", {}).items():
+        after = current.get("results", {}).get(scenario)
+        if after is None:
+            print(f"{scenario:<16}missing from current run", file=file)
+            continue
+        for metric in (*METRICS, "errors"):
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old:+.1%}" if old else "n/a"
+            mark = "  REGRESSION" if (scenario, metric) in flagged else ""
+            print(f"{scenario:<16}{metric:<8}{old:>12}{new:>12}{change:>9}{mark}", file=file)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    print_report(baseline, current, regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
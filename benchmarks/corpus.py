@@ -0,0 +1,52 @@
+"""
+Seeded song catalog shared by the fake providers and the load scenarios.
+"""
+import random
+from typing import List
+
+WORDS = ("love night heart fire rain dance baby dream light road home money summer cold blue river city "
+         "gold time forever broken wild alone sky angel ghost shadow sun moon storm never always tonight "
+         "again falling running burning golden silver midnight morning highway ocean".split())
+
+
+def _line(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(4, 9))).capitalize()
+
+
+def _lrc(lines: List[str], rng: random.Random) -> str:
+    ms = rng.randint(2000, 9000)
+    out = []
+    for line in lines:
+        out.append(f"[{ms // 60000:02d}:{ms // 1000 % 60:02d}.{ms // 10 % 100:02d}] {line}")
+        ms += rng.randint(1500, 5000)
+    return "\n".join(out)
+
+
+def make_catalog(size: int, seed: int = 42) -> List[dict]:
+    """
+    `size` distinct songs with verse/chorus lyrics, an LRC version of them,
+    release date and Spotify ID. The same seed always gives the same catalog.
+    """
+    rng = random.Random(seed)
+    catalog = []
+    seen = set()
+    while len(catalog) < size:
+        title = " ".join(rng.choices(WORDS, k=rng.randint(1, 3))).title()
+        artist = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}"
+        if (title, artist) in seen:
+            continue
+        seen.add((title, artist))
+        chorus = [_line(rng) for _ in range(4)]
+        lyrics = []
+        for _ in range(rng.randint(2, 5)):
+            lyrics += [_line(rng) for _ in range(rng.randint(4, 10))] + chorus
+        catalog.append({
+            "title": title,
+            "artist": artist,
+            "lyrics": lyrics,
+            "lrc": _lrc(lyrics, rng),
+            "release_date": f"{rng.randint(1960, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "spotify_id": f"sp{len(catalog):08d}",
+            "musixmatch_id": 100000 + len(catalog),
+        })
+    return catalog
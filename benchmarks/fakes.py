@@ -0,0 +1,166 @@
+"""
+Local fake Genius, LRCLib, Spotify and Musixmatch APIs.
+
+One aiohttp server answers all four under path prefixes, from a seeded
+catalog, with per-provider latency and error injection:
+
+    /genius/search                      Genius search
+    /lrclib/api/get                     LRCLib lookup
+    /spotify/api/token, /v1/search, /v1/tracks
+    /musixmatch/ws/1.1/track.search, /track.lyrics.get
+"""
+import asyncio
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+SPOTIFY_QUERY = re.compile(r"track:(.*) artist:(.*)")
+
+
+class FakeProviders:
+    """
+    Args:
+        catalog: Songs the fakes know about (see `corpus.make_catalog`).
+        latency: Per provider `(mean, jitter)` in seconds; each response is
+            delayed by a uniform draw from `mean ± jitter`.
+        error_rate: Per provider share of requests answered with an error.
+        error_status: HTTP status of injected errors (429 gets `Retry-After: 0`).
+        seed: Seed of the latency/error draws.
+    """
+
+    def __init__(self, catalog: List[dict], latency: Optional[Dict[str, Tuple[float, float]]] = None,
+                 error_rate: Optional[Dict[str, float]] = None, error_status: int = 500, seed: int = 42):
+        self.latency = latency or {}
+        self.error_rate = error_rate or {}
+        self.error_status = error_status
+        self.rng = random.Random(seed)
+        self.requests = {"genius": 0, "lrclib": 0, "spotify": 0, "musixmatch": 0}
+        self.errors = dict.fromkeys(self.requests, 0)
+        self._by_query = {f"{song['title']} {song['artist']}": song for song in catalog}
+        self._by_pair = {(song["title"], song["artist"]): song for song in catalog}
+        self._by_spotify_id = {song["spotify_id"]: song for song in catalog}
+        self._by_musixmatch_id = {song["musixmatch_id"]: song for song in catalog}
+        self._runner = None
+        self.url = None
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/genius/search", self.genius_search)
+        app.router.add_get("/lrclib/api/get", self.lrclib_get)
+        app.router.add_post("/spotify/api/token", self.spotify_token)
+        app.router.add_get("/spotify/v1/search", self.spotify_search)
+        app.router.add_get("/spotify/v1/tracks", self.spotify_tracks)
+        app.router.add_get("/musixmatch/ws/1.1/track.search", self.musixmatch_search)
+        app.router.add_get("/musixmatch/ws/1.1/track.lyrics.get", self.musixmatch_lyrics)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _simulate(self, provider: str) -> Optional[web.Response]:
+        """Apply latency; return an error response when one is injected."""
+        self.requests[provider] += 1
+        mean, jitter = self.latency.get(provider, (0.0, 0.0))
+        delay = max(0.0, mean + self.rng.uniform(-jitter, jitter))
+        if delay:
+            await asyncio.sleep(delay)
+        if self.rng.random() < self.error_rate.get(provider, 0.0):
+            self.errors[provider] += 1
+            headers = {"Retry-After": "0"} if self.error_status == 429 else None
+            return web.json_response({"error": "injected"}, status=self.error_status, headers=headers)
+        return None
+
+    async def genius_search(self, request: web.Request) -> web.Response:
+        error = await self._simulate("genius")
+        if error is not None:
+            return error
+        song = self._by_query.get(request.query.get("q", ""))
+        hits = []
+        if song:
+            hits.append({"result": {
+                "title": song["title"],
+                "primary_artist": {"name": song["artist"]},
+                "release_date": song["release_date"],
+                "url": f"https://genius.example/{song['spotify_id']}",
+            }})
+        return web.json_response({"response": {"hits": hits}})
+
+    async def lrclib_get(self, request: web.Request) -> web.Response:
+        error = await self._simulate("lrclib")
+        if error is not None:
+            return error
+        song = self._by_pair.get((request.query.get("track_name"), request.query.get("artist_name")))
+        if not song:
+            return web.json_response({"code": 404, "name": "TrackNotFound"}, status=404)
+        return web.json_response({
+            "trackName": song["title"],
+            "artistName": song["artist"],
+            "plainLyrics": "\n".join(song["lyrics"]),
+            "syncedLyrics": song["lrc"],
+        })
+
+    async def spotify_token(self, request: web.Request) -> web.Response:
+        return web.json_response({"access_token": "bench-token", "token_type": "Bearer", "expires_in": 3600})
+
+    @staticmethod
+    def _spotify_track(song: dict) -> dict:
+        return {
+            "id": song["spotify_id"],
+            "album": {"release_date": song["release_date"], "images": [{"url": f"https://img.example/{song['spotify_id']}"}]},
+            "external_urls": {"spotify": f"https://open.spotify.example/track/{song['spotify_id']}"},
+        }
+
+    async def spotify_search(self, request: web.Request) -> web.Response:
+        error = await self._simulate("spotify")
+        if error is not None:
+            return error
+        match = SPOTIFY_QUERY.fullmatch(request.query.get("q", ""))
+        song = self._by_pair.get(match.groups()) if match else None
+        items = [self._spotify_track(song)] if song else []
+        return web.json_response({"tracks": {"items": items}})
+
+    async def spotify_tracks(self, request: web.Request) -> web.Response:
+        error = await self._simulate("spotify")
+        if error is not None:
+            return error
+        ids = [i for i in request.query.get("ids", "").split(",") if i]
+        tracks = [self._spotify_track(self._by_spotify_id[i]) if i in self._by_spotify_id else None for i in ids]
+        return web.json_response({"tracks": tracks})
+
+    @staticmethod
+    def _musixmatch(status: int, body: dict) -> web.Response:
+        return web.json_response({"message": {"header": {"status_code": status}, "body": body}})
+
+    async def musixmatch_search(self, request: web.Request) -> web.Response:
+        error = await self._simulate("musixmatch")
+        if error is not None:
+            return error
+        song = self._by_pair.get((request.query.get("q_track"), request.query.get("q_artist")))
+        if not song:
+            return self._musixmatch(200, {"track_list": []})
+        return self._musixmatch(200, {"track_list": [{"track": {
+            "track_id": song["musixmatch_id"],
+            "track_name": song["title"],
+            "artist_name": song["artist"],
+        }}]})
+
+    async def musixmatch_lyrics(self, request: web.Request) -> web.Response:
+        error = await self._simulate("musixmatch")
+        if error is not None:
+            return error
+        song = self._by_musixmatch_id.get(int(request.query.get("track_id", "0")))
+        if not song:
+            return self._musixmatch(404, {})
+        return self._musixmatch(200, {"lyrics": {"lyrics_body": "\n".join(song["lyrics"])}})
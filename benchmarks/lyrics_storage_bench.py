@@ -0,0 +1,102 @@
+"""
+Compare lyrics storage formats: BSON array of lines vs compressed `lyrics_z`.
+
+Reports the encoded document size and the time to decode a document from
+BSON and read one page of lyrics from it, for each format. Runs on
+synthetic songs (verses plus repeated choruses, like real lyrics), or on a
+sample of stored songs with --mongo.
+
+    python -m benchmarks.lyrics_storage_bench --songs 2000
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.lyrics_storage_bench --mongo
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+import bson
+
+from app.utils.lyrics_codec import pack_lyrics, PackedLyrics
+
+WORDS = ("love night heart fire rain dance baby dream light road home money summer cold blue river city "
+         "gold time forever broken wild alone sky angel ghost shadow sun moon storm i you we the a in on "
+         "and never always tonight again".split())
+
+
+def synthetic_lyrics(rng: random.Random):
+    line = lambda: " ".join(rng.choices(WORDS, k=rng.randint(4, 9))).capitalize()
+    chorus = [line() for _ in range(4)]
+    lyrics = []
+    for _ in range(rng.randint(2, 4)):
+        lyrics += [line() for _ in range(8)] + [""] + chorus + [""]
+    return lyrics
+
+
+async def sample_mongo(count: int):
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    try:
+        db = client[os.getenv("MONGO_DB_NAME", "songlib")]
+        pipeline = [{"$match": {"lyrics.0": {"$exists": True}}}, {"$sample": {"size": count}},
+                    {"$project": {"title": 1, "artist": 1, "lyrics": 1}}]
+        return [song["lyrics"] async for song in db.songs.aggregate(pipeline)]
+    finally:
+        client.close()
+
+
+def bench(corpus, page_size: int, rounds: int):
+    array_docs, packed_docs = [], []
+    for i, lyrics in enumerate(corpus):
+        meta = {"title": f"song {i}", "artist": "artist", "release_date": "2020-01-01", "link": "https://example.com"}
+        array_docs.append(bson.encode({**meta, "lyrics": lyrics}))
+        packed_docs.append(bson.encode({**meta, "lyrics_z": pack_lyrics(lyrics)}))
+
+    def read_array(raw, page):
+        lyrics = bson.decode(raw)["lyrics"]
+        return lyrics[(page - 1) * page_size:page * page_size]
+
+    def read_packed(raw, page):
+        return PackedLyrics(bson.decode(raw)["lyrics_z"]).lines((page - 1) * page_size, page_size)
+
+    report = {}
+    for name, docs, read in (("array", array_docs, read_array), ("zlib", packed_docs, read_packed)):
+        samples = []
+        for _ in range(rounds):
+            for raw, lyrics in zip(docs, corpus):
+                page = 1 + len(lyrics) // page_size // 2
+                started = time.perf_counter()
+                read(raw, page)
+                samples.append(time.perf_counter() - started)
+        samples.sort()
+        report[name] = {
+            "avg_doc_bytes": round(statistics.mean(len(raw) for raw in docs)),
+            "total_mb": round(sum(len(raw) for raw in docs) / 1e6, 2),
+            "page_read_p50_us": round(samples[len(samples) // 2] * 1e6, 1),
+            "page_read_p95_us": round(samples[int(len(samples) * 0.95)] * 1e6, 1),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--mongo", action="store_true", help="sample stored songs instead of synthetic ones")
+    args = parser.parse_args()
+
+    if args.mongo:
+        corpus = asyncio.run(sample_mongo(args.songs))
+    else:
+        rng = random.Random(1)
+        corpus = [synthetic_lyrics(rng) for _ in range(args.songs)]
+    print(f"{len(corpus)} songs, {statistics.mean(len(c) for c in corpus):.0f} lines avg, page size {args.page_size}")
+    for name, stats in bench(corpus, args.page_size, args.rounds).items():
+        print(f"{name:6}", stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+End-to-end load benchmark of the API against local fake providers.
+
+Starts the fake Genius/LRCLib/Spotify/Musixmatch server, a scratch mongod
+(or uses --mongo-uri), and the app itself under uvicorn in this process,
+then drives it over HTTP with a fixed seed catalog:
+
+    add_song            POST /            (sync enrichment)
+    bulk_import         POST /bulk        (one NDJSON request)
+    get_song_p{N}       GET /{id}?size=N  (for each --page-sizes)
+    search_*            POST /search      (filters, $text, bm25)
+    suggest             GET /suggest
+
+Each scenario reports req/s and p50/p95/p99 latency; the JSON written to
+--out can be compared with a baseline (see benchmarks/compare.py):
+
+    python -m benchmarks.run --out bench.json
+    python -m benchmarks.run --out bench.json --baseline benchmarks/baseline.json
+
+Provider behaviour is set with --latency/--errors, e.g.
+`--latency genius=0.08:0.02 --errors spotify=0.05`. App settings come from
+the environment as usual; the harness only fills in what it must (provider
+URLs, credentials, Mongo) and defaults that keep the fakes, not the rate
+limiter, the bottleneck.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from benchmarks.compare import compare, print_report
+from benchmarks.corpus import make_catalog
+from benchmarks.fakes import FakeProviders
+
+PROVIDERS = ("genius", "lrclib", "spotify", "musixmatch")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def parse_provider_values(values: List[str], parse) -> dict:
+    """`["genius=0.05:0.01", ...]` -> `{"genius": parse("0.05:0.01")}`."""
+    result = {}
+    for value in values or []:
+        name, _, spec = value.partition("=")
+        if name not in PROVIDERS:
+            raise SystemExit(f"Unknown provider {name!r}; expected one of {', '.join(PROVIDERS)}")
+        result[name] = parse(spec)
+    return result
+
+
+def parse_latency(spec: str) -> Tuple[float, float]:
+    mean, _, jitter = spec.partition(":")
+    return float(mean), float(jitter or 0)
+
+
+@contextmanager
+def local_mongod(binary: str):
+    """Run a throwaway mongod on a free port with a temporary data directory."""
+    port = free_port()
+    with tempfile.TemporaryDirectory(prefix="songlib-bench-") as dbpath:
+        proc = subprocess.Popen(
+            [binary, "--dbpath", dbpath, "--port", str(port), "--bind_ip", "127.0.0.1", "--quiet"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+                    break
+                except OSError:
+                    if proc.poll() is not None or time.monotonic() > deadline:
+                        raise SystemExit(f"mongod did not start (exit code {proc.poll()})")
+                    time.sleep(0.1)
+            yield f"mongodb://127.0.0.1:{port}"
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+
+def configure_environment(providers_url: str, mongo_uri: str, db_name: str):
+    # Must run before app modules are imported: provider clients read these at import
+    os.environ.update({
+        "GENIUS_API_URL": f"{providers_url}/genius",
+        "LRCLIB_URL": f"{providers_url}/lrclib/api/get",
+        "SPOTIFY_TOKEN_URL": f"{providers_url}/spotify/api/token",
+        "SPOTIFY_URL": f"{providers_url}/spotify/v1/search",
+        "SPOTIFY_TRACKS_URL": f"{providers_url}/spotify/v1/tracks",
+        "MUSIXMATCH_API_URL": f"{providers_url}/musixmatch/ws/1.1",
+        "MONGO_URI": mongo_uri,
+        "MONGO_DB_NAME": db_name,
+    })
+    for name, value in {
+        "GENIUS_TOKEN": "bench", "SPOTIFY_CLIENT_ID": "bench", "SPOTIFY_CLIENT_SECRET": "bench",
+        "MUSIXMATCH_API_KEY": "bench",
+        "PROVIDER_RATE_LIMITS": json.dumps({p: [10000, 10000] for p in PROVIDERS}),
+        "CACHE_BACKEND": "none",
+        "ENRICH_WORKERS": "0",
+        "SONG_CACHE_INVALIDATION": "none",
+    }.items():
+        os.environ.setdefault(name, value)
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+
+async def run_load(total: int, concurrency: int, send: Callable[[int], Awaitable[int]]) -> dict:
+    """
+    Issue `total` requests, `concurrency` at a time; `send(i)` performs
+    request `i` and returns its HTTP status.
+    """
+    latencies, statuses = [], {}
+    counter = iter(range(total))
+
+    async def worker():
+        for i in counter:
+            started = time.perf_counter()
+            try:
+                status = await send(i)
+            except Exception as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": total,
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+async def scenarios(base: str, catalog: List[dict], args) -> Dict[str, dict]:
+    rng = random.Random(args.seed)
+    results = {}
+    song_ids: List[str] = []
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(base, connector=connector) as http:
+        add_songs = catalog[:args.add]
+
+        async def add(i: int) -> int:
+            song = add_songs[i]
+            async with http.post("/", json={"title": song["title"], "artist": song["artist"]}) as resp:
+                body = await resp.json()
+                if resp.status == 200:
+                    song_ids.append(body["id"])
+                return resp.status
+
+        results["add_song"] = await run_load(len(add_songs), args.concurrency, add)
+
+        bulk_songs = catalog[args.add:args.add + args.bulk]
+        if bulk_songs:
+            payload = b"".join(json.dumps({"title": s["title"], "artist": s["artist"]}).encode() + b"\n" for s in bulk_songs)
+            lines = {}
+            started = time.perf_counter()
+            async with http.post("/bulk", data=payload, headers={"Content-Type": "application/x-ndjson"}) as resp:
+                async for raw in resp.content:
+                    if raw.strip():
+                        line = json.loads(raw)
+                        lines[line["status"]] = lines.get(line["status"], 0) + 1
+                        if line["status"] == "inserted":
+                            song_ids.append(line["id"])
+            elapsed = time.perf_counter() - started
+            results["bulk_import"] = {
+                "requests": len(bulk_songs),
+                "errors": sum(count for status, count in lines.items() if status != "inserted"),
+                "statuses": lines,
+                "rps": round(len(bulk_songs) / elapsed, 2),
+                "total_s": round(elapsed, 3),
+            }
+
+        if not song_ids:
+            raise SystemExit("No song was added; check the provider error rates")
+
+        for size in args.page_sizes:
+            picks = [(rng.choice(song_ids), rng.randint(1, 3)) for _ in range(args.requests)]
+
+            async def get(i: int, picks=picks, size=size) -> int:
+                song_id, page = picks[i]
+                async with http.get(f"/{song_id}", params={"page": page, "size": size}) as resp:
+                    await resp.read()
+                    return resp.status
+
+            results[f"get_song_p{size}"] = await run_load(args.requests, args.concurrency, get)
+
+        titles = [song["title"] for song in catalog[:args.add + args.bulk]]
+        searches = {
+            "search_filter": lambda: {"release_date_from": "1990-01-01", "limit": 20},
+            "search_text": lambda: {"keywords": rng.choice(titles).lower().split()[:2], "limit": 20},
+            "search_bm25": lambda: {"keywords": rng.choice(titles).lower().split()[:2], "limit": 20, "engine": "bm25"},
+        }
+        for name, make_body in searches.items():
+            bodies = [make_body() for _ in range(args.requests)]
+
+            async def search(i: int, bodies=bodies) -> int:
+                async with http.post("/search", json=bodies[i]) as resp:
+                    await resp.read()
+                    return resp.status
+
+            results[name] = await run_load(args.requests, args.concurrency, search)
+
+        prefixes = [rng.choice(titles)[:rng.randint(1, 5)] for _ in range(args.requests)]
+
+        async def suggest(i: int) -> int:
+            async with http.get("/suggest", params={"q": prefixes[i]}) as resp:
+                await resp.read()
+                return resp.status
+
+        results["suggest"] = await run_load(args.requests, args.concurrency, suggest)
+    return results
+
+
+async def wait_for_search_indexes(app, timeout: float = 30):
+    task = app.state.container.get("search_index_task")
+    if task is not None:
+        await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+async def benchmark(args, mongo_uri: str) -> dict:
+    catalog = make_catalog(args.add + args.bulk, seed=args.seed)
+    fakes = FakeProviders(
+        catalog,
+        latency=parse_provider_values(args.latency, parse_latency),
+        error_rate=parse_provider_values(args.errors, float),
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    providers_url = await fakes.start()
+    db_name = f"songlib_bench_{args.seed}"
+    configure_environment(providers_url, mongo_uri, db_name)
+
+    import uvicorn
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    admin = AsyncIOMotorClient(mongo_uri)
+    await admin.drop_database(db_name)
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config("app.main:app", host="127.0.0.1", port=port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if serving.done():
+                serving.result()
+                raise SystemExit("The app exited during startup")
+            await asyncio.sleep(0.05)
+        from app.main import app
+        await wait_for_search_indexes(app)
+        results = await scenarios(f"http://127.0.0.1:{port}", catalog, args)
+    finally:
+        server.should_exit = True
+        await serving
+        await fakes.stop()
+        await admin.drop_database(db_name)
+        admin.close()
+
+    return {
+        "meta": {
+            "seed": args.seed,
+            "catalog": len(catalog),
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "latency": args.latency,
+            "errors": args.errors,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "provider_requests": fakes.requests,
+            "provider_errors": fakes.errors,
+            "git": git_revision(),
+        },
+        "results": results,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--add", type=int, default=200, help="songs added one by one")
+    parser.add_argument("--bulk", type=int, default=500, help="songs added in one bulk import")
+    parser.add_argument("--requests", type=int, default=2000, help="requests per read scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--latency", nargs="*", default=["genius=0.05:0.01", "lrclib=0.03:0.01", "spotify=0.04:0.01", "musixmatch=0.04:0.01"],
+                        metavar="PROVIDER=MEAN[:JITTER]", help="fake provider latency in seconds")
+    parser.add_argument("--errors", nargs="*", default=[], metavar="PROVIDER=RATE", help="share of failing provider requests")
+    parser.add_argument("--error-status", type=int, default=500, help="status of injected errors (429 to exercise backoff)")
+    parser.add_argument("--mongo-uri", help="use this MongoDB instead of starting one")
+    parser.add_argument("--mongod", default=shutil.which("mongod"), help="mongod binary to start (default: from PATH)")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare with this results JSON; exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative regression")
+    args = parser.parse_args()
+
+    if args.mongo_uri:
+        report = asyncio.run(benchmark(args, args.mongo_uri))
+    elif args.mongod:
+        with local_mongod(args.mongod) as uri:
+            report = asyncio.run(benchmark(args, uri))
+    else:
+        raise SystemExit("No mongod on PATH; pass --mongod PATH or --mongo-uri URI")
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        print_report(baseline, report, regressions, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
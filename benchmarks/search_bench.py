@@ -0,0 +1,115 @@
+"""
+Compare keyword search latency: Mongo `$text` vs the in-process BM25 index.
+
+Seeds a synthetic corpus into a scratch database (dropped afterwards),
+builds both indexes and times the same queries against each.
+
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.search_bench --songs 20000
+    python -m benchmarks.search_bench --engine-only   # no Mongo needed
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+from app.search.engine import SearchEngine
+
+WORDS = [
+    "love", "night", "heart", "fire", "rain", "dance", "baby", "dream", "light", "road",
+    "home", "money", "summer", "cold", "blue", "river", "city", "gold", "time", "forever",
+    "broken", "wild", "alone", "sky", "angel", "ghost", "shadow", "sun", "moon", "storm",
+]
+
+
+def make_corpus(n: int, lines: int, seed: int = 1):
+    rng = random.Random(seed)
+    # Skewed word frequencies, like real lyrics
+    vocabulary = WORDS + [f"w{i}" for i in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for i in range(n):
+        yield {
+            "title": " ".join(rng.choices(vocabulary, weights, k=rng.randint(1, 4))),
+            "artist": f"artist {i % 997}",
+            "lyrics": [" ".join(rng.choices(vocabulary, weights, k=rng.randint(4, 10))) for _ in range(lines)],
+        }
+
+
+def make_queries(count: int, seed: int = 2):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        queries.append(f'"{words[0]} {words[1]}"' if len(words) > 1 and rng.random() < 0.2 else " ".join(words))
+    return queries
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+    return {"p50_ms": round(pick(0.5), 3), "p95_ms": round(pick(0.95), 3),
+            "p99_ms": round(pick(0.99), 3), "mean_ms": round(statistics.mean(samples) * 1000, 3)}
+
+
+def bench_engine(corpus, queries, limit):
+    engine = SearchEngine()
+    started = time.perf_counter()
+    for i, song in enumerate(corpus):
+        engine.upsert(str(i), song["title"], song["artist"], song["lyrics"])
+    build = time.perf_counter() - started
+
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        engine.search(query, limit=limit)
+        samples.append(time.perf_counter() - started)
+    return {"build_s": round(build, 3), **percentiles(samples)}
+
+
+async def bench_mongo(corpus, queries, limit, uri):
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(uri)
+    db = client["songlib_search_bench"]
+    try:
+        await db.songs.drop()
+        for start in range(0, len(corpus), 1000):
+            await db.songs.insert_many([dict(song) for song in corpus[start:start + 1000]])
+        started = time.perf_counter()
+        await db.songs.create_index([("title", "text"), ("lyrics", "text")])
+        build = time.perf_counter() - started
+
+        samples = []
+        for query in queries:
+            started = time.perf_counter()
+            await db.songs.find(
+                {"$text": {"$search": query}}, {"score": {"$meta": "textScore"}, "lyrics": 0}
+            ).sort([("score", {"$meta": "textScore"})]).limit(limit).to_list(length=limit)
+            samples.append(time.perf_counter() - started)
+        return {"build_s": round(build, 3), **percentiles(samples)}
+    finally:
+        await client.drop_database("songlib_search_bench")
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--songs", type=int, default=10000)
+    parser.add_argument("--lines", type=int, default=30, help="lyrics lines per song")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--engine-only", action="store_true", help="skip the Mongo `$text` run")
+    args = parser.parse_args()
+
+    corpus = list(make_corpus(args.songs, args.lines))
+    queries = make_queries(args.queries)
+    print(f"{args.songs} songs x {args.lines} lines, {args.queries} queries, top {args.limit}")
+    print("bm25  ", bench_engine(corpus, queries, args.limit))
+    if not args.engine_only:
+        uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+        print("$text ", asyncio.run(bench_mongo(corpus, queries, args.limit, uri)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import asyncio
+
+from bson import ObjectId
+
+from app.repositories.song_repository import SongRepository
+from app.utils.text import match_key
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self.docs:
+            yield dict(doc)
+
+
+class BulkResult:
+    def __init__(self, matched_count):
+        self.matched_count = matched_count
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = {doc["_id"]: doc for doc in docs}
+        self.before_write = None
+
+    def find(self, query, projection=None):
+        return FakeCursor([self.docs[_id] for _id in query["_id"]["$in"] if _id in self.docs])
+
+    async def bulk_write(self, requests, ordered=False):
+        if self.before_write:
+            self.before_write()
+        matched = 0
+        for request in requests:
+            doc = self.docs.get(request._filter["_id"])
+            if doc is not None and all(doc.get(field) == value for field, value in request._filter.items()):
+                doc.update(request._doc["$set"])
+                matched += 1
+        return BulkResult(matched)
+
+
+def song(title, artist):
+    return {"_id": ObjectId(), "title": title, "artist": artist, "match_key": match_key(title, artist)}
+
+
+def test_songs_changed_after_the_pre_read_are_not_reported_updated():
+    renamed, deleted, untouched = song("A", "x"), song("B", "y"), song("C", "z")
+    collection = FakeCollection([renamed, deleted, untouched])
+    repository = SongRepository.__new__(SongRepository)
+    repository.collection = collection
+    repository.compress_lyrics = False
+
+    def concurrent_writes():
+        renamed.update(title="A2", match_key=match_key("A2", "x"))
+        del collection.docs[deleted["_id"]]
+
+    collection.before_write = concurrent_writes
+    results = asyncio.run(repository.bulk_update_songs([
+        (str(renamed["_id"]), {"artist": "q"}, []),
+        (str(deleted["_id"]), {"lyrics": ["la"]}, []),
+        (str(untouched["_id"]), {"title": "C2"}, []),
+    ]))
+
+    assert [result["status"] for result in results] == ["not_found", "not_found", "updated"]
+    assert renamed["artist"] == "x"
+    assert untouched["match_key"] == match_key("C2", "z")
+
+
+class RecordingBus:
+    def __init__(self):
+        self.calls = []
+
+    async def publish_many(self, song_ids, reindex=True):
+        self.calls.append(list(song_ids))
+
+
+class BulkRepository:
+    def __init__(self):
+        self.reads = []
+
+    async def bulk_update_songs(self, items, ordered=False):
+        return [{"id": song_id, "status": "updated"} for song_id, _, _ in items]
+
+    async def bulk_delete_songs(self, song_ids, ordered=False):
+        return [{"id": song_id, "status": "deleted"} for song_id in song_ids]
+
+    async def get_search_fields_many(self, song_ids):
+        self.reads.append(list(song_ids))
+        return {song_id: {"title": "New", "artist": "A", "lyrics": []} for song_id in song_ids}
+
+
+def bulk_service():
+    from app.search.suggest import SuggestIndex
+    from app.services.song_service import SongService
+
+    suggest = SuggestIndex()
+    suggest.ready = True
+    bus = RecordingBus()
+    repository = BulkRepository()
+    return SongService(repository, None, None, None, invalidation_bus=bus, suggest_index=suggest), repository, bus, suggest
+
+
+def test_bulk_update_reindexes_with_one_read_and_one_broadcast():
+    service, repository, bus, suggest = bulk_service()
+    ids = [str(ObjectId()) for _ in range(3)]
+
+    asyncio.run(service.bulk_update_songs([{"id": song_id, "title": "New"} for song_id in ids]))
+
+    assert repository.reads == [ids]
+    assert bus.calls == [ids]
+    assert len(suggest) == 3
+
+
+def test_bulk_delete_reads_nothing_and_broadcasts_once():
+    service, repository, bus, suggest = bulk_service()
+    ids = [str(ObjectId()) for _ in range(3)]
+    for song_id in ids:
+        suggest.upsert(song_id, "Old", "A")
+
+    asyncio.run(service.bulk_delete_songs(ids))
+
+    assert repository.reads == []
+    assert bus.calls == [ids]
+    assert len(suggest) == 0
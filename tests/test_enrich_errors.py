@@ -0,0 +1,34 @@
+import asyncio
+
+import aiohttp
+import pytest
+from fastapi import HTTPException
+
+from app.external.transport import ProviderError, ResponseTooLarge
+from app.services.song_service import SongService
+
+
+class FailingGenius:
+    def __init__(self, error):
+        self.error = error
+
+    async def search_song(self, title, artist):
+        raise self.error
+
+
+class NoSpotify:
+    async def search_song(self, title, artist):
+        return None
+
+
+@pytest.mark.parametrize("error", [
+    aiohttp.ClientConnectionError("connection refused"),
+    ResponseTooLarge("body too large"),
+    ProviderError("genius", 503),
+])
+def test_genius_failures_are_bad_gateway(error):
+    service = SongService(None, FailingGenius(error), None, NoSpotify())
+
+    with pytest.raises(HTTPException) as raised:
+        asyncio.run(service._enrich("Song", "Artist"))
+    assert raised.value.status_code == 502
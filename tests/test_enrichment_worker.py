@@ -0,0 +1,52 @@
+import asyncio
+
+from app.services.enrichment_worker import EnrichmentWorker
+
+
+class FakeJobs:
+    def __init__(self, count):
+        self.pending = list(range(count))
+        self.claimed = 0
+
+    async def claim_job(self, lease_seconds):
+        if not self.pending:
+            return None
+        self.claimed += 1
+        return {"_id": self.pending.pop(0)}
+
+
+class FakeService:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.finished = []
+
+    async def run_enrichment_job(self, job):
+        await asyncio.sleep(self.seconds)
+        self.finished.append(job["_id"])
+
+
+def run_and_stop(service, jobs, drain_seconds):
+    worker = EnrichmentWorker(service, jobs, concurrency=2, poll_interval=0.01, drain_seconds=drain_seconds)
+
+    async def run():
+        await worker.start()
+        await asyncio.sleep(0.01)
+        await worker.stop()
+
+    asyncio.run(run())
+
+
+def test_stop_lets_in_flight_jobs_finish_and_claims_no_more():
+    jobs, service = FakeJobs(10), FakeService(0.1)
+    run_and_stop(service, jobs, drain_seconds=1)
+
+    assert jobs.claimed == 2
+    assert sorted(service.finished) == [0, 1]
+
+
+def test_stop_cancels_jobs_still_running_after_the_drain_timeout():
+    jobs, service = FakeJobs(10), FakeService(10)
+    run_and_stop(service, jobs, drain_seconds=0.05)
+
+    assert jobs.claimed == 2
+    assert service.finished == []
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.cache.invalidation import MongoPollingInvalidationBus
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for doc in self.docs:
+            yield doc
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+
+    async def update_one(self, query, update, upsert=False):
+        self.docs.append({"_id": query["_id"], **update["$set"], "at": datetime(2026, 1, 1)})
+
+    def find(self, query):
+        since = query["at"].get("$gte")
+        return FakeCursor([doc for doc in self.docs if since is None or doc["at"] >= since])
+
+
+class FakeDb:
+    def __init__(self):
+        self.collection = FakeCollection()
+
+    def __getitem__(self, name):
+        return self.collection
+
+
+def test_late_visible_entries_are_not_skipped_nor_repeated():
+    received = []
+    db = FakeDb()
+    bus = MongoPollingInvalidationBus(db, lambda song_ids, reindex: received.extend(song_ids), overlap=5)
+    now = datetime(2026, 1, 1)
+
+    def entry(song_id, at):
+        return {"_id": ObjectId(), "origin": "other", "song_ids": [song_id], "reindex": True, "at": at}
+
+    async def run():
+        db.collection.docs.append(entry("b", now + timedelta(seconds=1)))
+        await bus.poll_once()
+        # Stamped before "b" but committed after the first poll
+        db.collection.docs.append(entry("a", now))
+        await bus.poll_once()
+        await bus.poll_once()
+
+    asyncio.run(run())
+    assert received == ["b", "a"]
+
+
+def test_one_entry_per_batch_carries_the_reindex_flag():
+    received = []
+    db = FakeDb()
+    publisher = MongoPollingInvalidationBus(db, None)
+    publisher._created = True
+    subscriber = MongoPollingInvalidationBus(db, lambda song_ids, reindex: received.append((song_ids, reindex)))
+
+    async def run():
+        await publisher.publish_many(["1", "2", "3"], reindex=False)
+        await subscriber.poll_once()
+
+    asyncio.run(run())
+    assert len(db.collection.docs) == 1
+    assert received == [(["1", "2", "3"], False)]
@@ -0,0 +1,13 @@
+from app.utils.lrc import parse_lrc
+
+LYRICS = "[00:01.00] first\n[00:02.00] second"
+
+
+def test_positive_offset_shows_lines_sooner():
+    parsed = parse_lrc("[offset:+500]\n" + LYRICS)
+    assert parsed["offsets"] == [500, 1500]
+
+
+def test_negative_offset_shows_lines_later():
+    parsed = parse_lrc("[offset:-500]\n" + LYRICS)
+    assert parsed["offsets"] == [1500, 2500]
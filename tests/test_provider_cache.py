@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import pytest
+
+from app.cache.backends import MemoryCache
+from app.cache.providers import ProviderCache
+from app.external.LRCLib_client import LRCLibProvider
+from app.external.transport import HttpResponse, ProviderError
+
+
+class ScriptedTransport:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def response(status, body=None):
+    return HttpResponse(status, {}, json.dumps(body).encode() if body is not None else b"")
+
+
+def cached_fetch(http):
+    cache = ProviderCache(MemoryCache(), ttl=3600, negative_ttl=600)
+    return cache.wrap("lrclib", LRCLibProvider(http).fetch_lyrics)
+
+
+def test_server_error_is_not_cached():
+    http = ScriptedTransport(response(503), response(200, {"plainLyrics": "la la"}))
+    fetch = cached_fetch(http)
+
+    with pytest.raises(ProviderError):
+        asyncio.run(fetch("Song", "Artist"))
+    assert asyncio.run(fetch("Song", "Artist")) == {"plainLyrics": "la la"}
+    assert http.calls == 2
+
+
+def test_not_found_is_negatively_cached():
+    http = ScriptedTransport(response(404))
+    fetch = cached_fetch(http)
+
+    assert asyncio.run(fetch("Song", "Artist")) is None
+    assert asyncio.run(fetch("Song", "Artist")) is None
+    assert http.calls == 1
+
+
+def test_lrclib_lets_transport_errors_propagate():
+    class FailingTransport:
+        async def get(self, url, **kwargs):
+            raise ConnectionResetError("reset by peer")
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(LRCLibProvider(FailingTransport()).fetch_lyrics("Song", "Artist"))
@@ -0,0 +1,103 @@
+import asyncio
+
+from app.external.resilience import CircuitBreaker, GuardedTransport, ProviderGuard
+
+
+class SlowTransport:
+    async def request(self, method, url, **kwargs):
+        await asyncio.sleep(10)
+
+
+def test_cancelled_calls_leave_breaker_closed():
+    breaker = CircuitBreaker("lrclib", window=10, min_calls=5)
+    transport = GuardedTransport(SlowTransport(), ProviderGuard(breaker))
+
+    async def cancel_calls():
+        for _ in range(10):
+            task = asyncio.create_task(transport.get("http://provider"))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancel_calls())
+    stats = breaker.stats()
+    assert stats["state"] == CircuitBreaker.CLOSED
+    assert stats.get("failure", 0) == 0
+
+
+def test_cancelled_half_open_trial_frees_its_slot():
+    now = [0.0]
+    breaker = CircuitBreaker("lrclib", window=4, min_calls=2, open_seconds=1, half_open_calls=1, clock=lambda: now[0])
+    breaker.record(False, 0.1)
+    breaker.record(False, 0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    now[0] = 2.0
+    transport = GuardedTransport(SlowTransport(), ProviderGuard(breaker))
+
+    async def cancel_trial():
+        task = asyncio.create_task(transport.get("http://provider"))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancel_trial())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_rate_limit_waits_are_not_timed_by_the_breaker():
+    from app.external.scheduler import ProviderScheduler
+    from app.external.transport import HttpResponse
+
+    class RateLimitedTransport:
+        def __init__(self):
+            self.calls = 0
+
+        async def request(self, method, url, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                return HttpResponse(429, {"Retry-After": "0.2"}, b"")
+            return HttpResponse(200, {}, b"")
+
+    breaker = CircuitBreaker("lrclib", window=10, min_calls=1, slow_call_seconds=0.1, slow_call_rate=0.5)
+    scheduler = ProviderScheduler({"lrclib": (100.0, 1)})
+    transport = scheduler.bind(GuardedTransport(RateLimitedTransport(), ProviderGuard(breaker)), "lrclib")
+
+    resp = asyncio.run(transport.get("http://provider"))
+    assert resp.status == 200
+    stats = breaker.stats()
+    assert stats["state"] == CircuitBreaker.CLOSED
+    assert stats["success"] == 2
+    assert stats["slow_call_rate"] == 0.0
+
+
+def test_hedges_take_their_own_rate_limit_token():
+    from app.external.scheduler import ProviderScheduler
+    from app.external.transport import HttpResponse
+
+    class CountingTransport:
+        def __init__(self):
+            self.calls = 0
+
+        async def request(self, method, url, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return HttpResponse(200, {}, b"")
+
+    def send_hedged(rate, burst):
+        scheduler = ProviderScheduler({"lrclib": (rate, burst)})
+        bucket = scheduler.buckets["lrclib"]
+        guard = ProviderGuard(CircuitBreaker("lrclib"), hedge=True, hedge_min_delay=0.01, bucket=bucket)
+        for _ in range(20):
+            guard.latency.add(0.01)
+        inner = CountingTransport()
+        asyncio.run(scheduler.bind(GuardedTransport(inner, guard), "lrclib").get("http://provider"))
+        return inner.calls, guard.counters
+
+    calls, counters = send_hedged(1, 1)
+    assert calls == 1
+    assert counters["hedge_throttled"] == 1
+
+    calls, counters = send_hedged(0.001, 2)
+    assert calls == 2
+    assert counters["hedged"] == 1
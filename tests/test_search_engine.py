@@ -0,0 +1,19 @@
+from app.search.engine import SearchEngine
+
+
+def test_repeated_upserts_trigger_compaction():
+    engine = SearchEngine()
+    engine.upsert("1", "Song", "Artist", ["first line"])
+    for i in range(1500):
+        engine.upsert("1", "Song", "Artist", [f"version {i}"])
+
+    assert len(engine) == 1
+    assert engine._tombstones <= 1000
+    assert [hit["id"] for hit in engine.search("version 1499")][:1] == ["1"]
+
+
+def test_search_over_songs_without_tokens_returns_nothing():
+    engine = SearchEngine()
+    engine.upsert("1", "!!!", "???", [])
+
+    assert engine.search("anything") == []
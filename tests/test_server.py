@@ -0,0 +1,9 @@
+import importlib.util
+
+from app.server import event_loop
+
+
+def test_missing_uvloop_falls_back_to_auto(monkeypatch):
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert event_loop("uvloop") == "auto"
+    assert event_loop("asyncio") == "asyncio"
@@ -0,0 +1,15 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models.song import SongBulkPatchItem, SongUpdate
+
+
+def test_update_rejects_null_title_and_artist():
+    with pytest.raises(ValidationError):
+        SongUpdate(title=None)
+    with pytest.raises(ValidationError):
+        SongBulkPatchItem(id="1", artist=None)
+
+
+def test_update_allows_omitting_title_and_artist():
+    assert SongUpdate(lyrics=["la"]).dict(exclude_unset=True) == {"lyrics": ["la"]}
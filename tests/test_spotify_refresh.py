@@ -0,0 +1,69 @@
+import asyncio
+
+from bson import ObjectId
+
+from app.services.song_service import SongService
+
+
+class FakeRepository:
+    def __init__(self, songs):
+        self.songs = songs
+        self.updates = []
+
+    async def iter_songs_needing_refresh(self, stale_before, retry_before, batch_size=500):
+        for song in self.songs:
+            yield song
+
+    async def set_many(self, updates):
+        self.updates.extend(updates)
+        return len(updates)
+
+
+class FakeSpotify:
+    TRACKS_BATCH_LIMIT = 50
+
+    async def get_tracks(self, ids):
+        raise ConnectionResetError("reset by peer")
+
+    async def search_song(self, title, artist):
+        if title == "Broken":
+            raise ConnectionResetError("reset by peer")
+        if title == "Unknown":
+            return None
+        return {"id": "sp1", "cover_art": "http://cover", "release_date": "2020-01-01"}
+
+
+def test_refresh_only_stamps_completed_lookups():
+    songs = [
+        {"_id": ObjectId(), "title": "Known", "artist": "A"},
+        {"_id": ObjectId(), "title": "Unknown", "artist": "A"},
+        {"_id": ObjectId(), "title": "Broken", "artist": "A"},
+        {"_id": ObjectId(), "title": "Stored", "artist": "A", "spotify_id": "sp2"},
+    ]
+    repository = FakeRepository(songs)
+    service = SongService(repository, None, None, FakeSpotify())
+
+    counts = asyncio.run(service.refresh_spotify_metadata())
+
+    updated = {str(song_id): fields for song_id, fields in repository.updates}
+    assert set(updated) == {str(songs[0]["_id"]), str(songs[1]["_id"])}
+    assert updated[str(songs[0]["_id"])]["spotify_id"] == "sp1"
+    assert set(updated[str(songs[1]["_id"])]) == {"spotify_refreshed_at"}
+    assert counts["errors"] == 2
+
+
+def test_refresh_broadcasts_once_per_batch_without_reindex():
+    class RecordingBus:
+        def __init__(self):
+            self.calls = []
+
+        async def publish_many(self, song_ids, reindex=True):
+            self.calls.append((sorted(song_ids), reindex))
+
+    songs = [{"_id": ObjectId(), "title": "Known", "artist": "A"}, {"_id": ObjectId(), "title": "Unknown", "artist": "A"}]
+    bus = RecordingBus()
+    service = SongService(FakeRepository(songs), None, None, FakeSpotify(), invalidation_bus=bus)
+
+    asyncio.run(service.refresh_spotify_metadata())
+
+    assert bus.calls == [(sorted(str(song["_id"]) for song in songs), False)]
@@ -0,0 +1,33 @@
+from app.search.suggest import SuggestIndex
+
+SONGS = [("1", "Hello World", "Alex G"), ("2", "World Peace", "Band"), ("3", "Help", "The Beatles")]
+
+
+def test_build_matches_incremental_upserts():
+    built, incremental = SuggestIndex(), SuggestIndex()
+    built.build(SONGS)
+    for song in SONGS:
+        incremental.upsert(*song)
+
+    assert built._entries == incremental._entries
+    assert [s["id"] for s in built.suggest("hel")] == ["1", "3"]
+    assert [s["id"] for s in built.suggest("world", fuzzy=False)] == ["1", "2"]
+
+
+def test_build_keeps_songs_indexed_meanwhile():
+    index = SuggestIndex()
+    index.upsert("1", "Renamed", "Alex G")
+    index.build(SONGS)
+
+    assert len(index) == 3
+    assert index.suggest("hello", fuzzy=False) == []
+    assert [s["id"] for s in index.suggest("renamed")] == ["1"]
+
+
+def test_build_skips_songs_removed_during_the_scan():
+    index = SuggestIndex()
+    index.remove("1")
+    index.build(SONGS)
+
+    assert len(index) == 2
+    assert index.suggest("hello", fuzzy=False) == []
@@ -0,0 +1,13 @@
+from app.utils.text import match_key
+
+
+def test_featuring_suffixes_are_ignored():
+    assert match_key("Song (feat. Drake)", "A") == "song|a"
+    assert match_key("Song [ft. Drake] (Live)", "A") == match_key("Song (Live)", "A")
+    assert match_key("Song feat. Drake", "A") == "song|a"
+    assert match_key("Song featuring Drake", "A") == "song|a"
+
+
+def test_bare_ft_inside_a_title_is_kept():
+    assert match_key("Left ft Behind", "a") == "leftftbehind|a"
+    assert match_key("Feat of Strength", "a") == "featofstrength|a"